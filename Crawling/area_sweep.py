@@ -0,0 +1,283 @@
+# area_sweep.py
+# 위경도 + zoom_level 검색은 결과 목록이 최대 개수(약 300건)에서 잘리므로, 밀집 지역은 누락되고 한산한 지역은 검색 한 번이 낭비됩니다.
+# 이 모듈은 run_naver_crawling 위에서 동작하는 '영역 스윕' 플래너입니다.
+#
+#  1) 경계 상자(bbox) 또는 행정구역 Polygon을 타일 격자로 덮고, 타일 중심/크기에 맞는 zoom_level로 목록 ID만 수집합니다.
+#  2) 결과 수가 상한(result_cap)에 닿은 타일은 4등분해 다시 수집합니다. (max_depth까지 재귀)
+#  3) 마스터 데이터의 매장 밀도를 재사용합니다.
+#     - 마스터 매장 수만으로 이미 상한을 넘는 타일은 검색하지 않고 바로 4등분 (잘릴 것이 확실한 검색 생략)
+#     - 마스터 매장이 충분히 많고 최근에 수집된 타일(포화 지역)은 다시 스윕하지 않음
+#  4) 타일들은 병렬로 수집하며, 타일 간 중복은 naver_id 기준으로 제거한 뒤 상세 수집(crawl_naver_place_ids)을 한 번만 실행합니다.
+#  5) new_only=True(신규 오픈 탐색)면 각 타일 목록에 '새로오픈' 필터를 적용해 수집하고, 이미 알고 있는 ID는 상세 수집하지 않습니다.
+#     새 매장은 포화 지역에도 생기므로 이 모드에서는 마스터 밀도에 따른 생략/분할을 하지 않습니다.
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from shapely import wkt
+from shapely.geometry import Point, box
+
+from Crawling.naver_crawler import crawl_naver_place_ids
+from Crawling.naver_crawler_detail import StoreCrawler
+from Crawling.utils.check_franchise import tag_franchise
+from Crawling.utils.crawl_sink import CrawlSink
+from Crawling.utils.crawl_profiles import DEFAULT_PROFILE, profile_sections
+
+# 네이버 지도 검색 목록의 최대 결과 수 (이 값에 닿으면 타일이 잘린 것으로 보고 분할)
+DEFAULT_RESULT_CAP = 300
+
+# 검색 결과 목록 패널을 제외한 지도 영역 크기(px). 브라우저 창은 1920x1080으로 고정되어 있음
+VIEWPORT_PX = (1500, 1000)
+
+# Web Mercator 기준 zoom 0의 적도 해상도(m/px)
+_METERS_PER_PX_Z0 = 156543.03392
+_MIN_ZOOM, _MAX_ZOOM = 10, 19
+
+
+class Tile(NamedTuple):
+    south: float
+    west: float
+    north: float
+    east: float
+    depth: int = 0
+
+    @property
+    def center(self):
+        return (self.south + self.north) / 2, (self.west + self.east) / 2
+
+
+def tile_zoom(tile: Tile, viewport_px: Sequence[int] = VIEWPORT_PX) -> int:
+    """타일 전체가 지도 화면 안에 들어오는 가장 큰 zoom_level을 계산합니다."""
+    lat, _ = tile.center
+    width_m = (tile.east - tile.west) * 111320 * math.cos(math.radians(lat))
+    height_m = (tile.north - tile.south) * 110540
+    meters_per_px = max(width_m / viewport_px[0], height_m / viewport_px[1], 1e-6)
+    zoom = math.floor(math.log2(_METERS_PER_PX_Z0 * math.cos(math.radians(lat)) / meters_per_px))
+    return max(_MIN_ZOOM, min(_MAX_ZOOM, zoom))
+
+
+def split_tile(tile: Tile) -> List[Tile]:
+    """타일을 4등분합니다."""
+    mid_lat, mid_lng = tile.center
+    depth = tile.depth + 1
+    return [
+        Tile(tile.south, tile.west, mid_lat, mid_lng, depth),
+        Tile(tile.south, mid_lng, mid_lat, tile.east, depth),
+        Tile(mid_lat, tile.west, tile.north, mid_lng, depth),
+        Tile(mid_lat, mid_lng, tile.north, tile.east, depth),
+    ]
+
+
+def grid_tiles(bounds: Sequence[float], tile_km: float = 1.0) -> List[Tile]:
+    """(south, west, north, east) 경계 상자를 한 변이 약 tile_km인 타일 격자로 나눕니다."""
+    south, west, north, east = bounds
+    lat = (south + north) / 2
+    lat_step = tile_km / 110.54
+    lng_step = tile_km / (111.32 * math.cos(math.radians(lat)))
+    rows = max(1, math.ceil((north - south) / lat_step))
+    cols = max(1, math.ceil((east - west) / lng_step))
+    lat_edges = np.linspace(south, north, rows + 1)
+    lng_edges = np.linspace(west, east, cols + 1)
+    return [Tile(float(lat_edges[r]), float(lng_edges[c]), float(lat_edges[r + 1]), float(lng_edges[c + 1]))
+            for r in range(rows) for c in range(cols)]
+
+
+class MasterDensity:
+    """마스터 데이터의 매장 좌표/수집일로 타일별 매장 수와 최근 수집일을 조회합니다."""
+
+    def __init__(self, master_df: Optional[pd.DataFrame] = None):
+        df = master_df if master_df is not None else pd.DataFrame()
+        if df.empty or 'gps_latitude' not in df.columns or 'gps_longitude' not in df.columns:
+            self.lats = self.lngs = np.array([])
+            self.dates = pd.Series(dtype='datetime64[ns]')
+            return
+        self.lats = pd.to_numeric(df['gps_latitude'], errors='coerce').to_numpy()
+        self.lngs = pd.to_numeric(df['gps_longitude'], errors='coerce').to_numpy()
+        crawl_dates = df['Crawl_Date'] if 'Crawl_Date' in df.columns else pd.Series([None] * len(df))
+        self.dates = pd.to_datetime(crawl_dates, errors='coerce').reset_index(drop=True)
+
+    def _mask(self, tile: Tile):
+        return (self.lats >= tile.south) & (self.lats < tile.north) & (self.lngs >= tile.west) & (self.lngs < tile.east)
+
+    def count(self, tile: Tile) -> int:
+        return int(self._mask(tile).sum()) if len(self.lats) else 0
+
+    def latest(self, tile: Tile) -> Optional[date]:
+        if not len(self.lats):
+            return None
+        dates = self.dates[self._mask(tile)].dropna()
+        return dates.max().date() if not dates.empty else None
+
+
+def discovery_sweep_config(config: Dict) -> Dict:
+    """신규 오픈 탐색용 스윕 설정. area_sweep 설정에 new_openings의 타일 설정(tile_km 등)을 덮어씁니다."""
+    discovery = {k: v for k, v in (config.get('new_openings') or {}).items() if k != 'areas'}
+    return {**(config.get('area_sweep') or {}), **discovery}
+
+
+def _harvest_tile(search_query: str, tile: Tile, headless_mode: bool, output_dir: str, new_only: bool = False) -> Optional[List[str]]:
+    """타일 중심/zoom으로 검색해 목록의 place ID만 수집합니다. 드라이버 초기화에 실패하면 None."""
+    crawler = StoreCrawler(headless=headless_mode, output_base_dir=output_dir)
+    if crawler.driver is None:
+        return None
+    lat, lng = tile.center
+    return crawler.run_harvest(search_query=search_query, latitude=lat, longitude=lng, zoom_level=tile_zoom(tile), new_only=new_only)
+
+
+def plan_and_harvest(
+    search_query: str,
+    tiles: List[Tile],
+    density: MasterDensity,
+    area=None,
+    result_cap: int = DEFAULT_RESULT_CAP,
+    max_depth: int = 4,
+    tile_parallelism: int = 2,
+    saturated_min_stores: int = 50,
+    skip_recent_days: int = 14,
+    headless_mode: bool = True,
+    output_dir: str = 'results',
+    new_only: bool = False,
+    budget=None,
+) -> Dict:
+    """
+    타일을 깊이 순서(BFS)로 처리하며 목록 ID를 수집하고, 상한에 닿은 타일은 분할해 다음 깊이에서 다시 수집합니다.
+    반환: {"place_ids": [...], "stats": {...}}
+    """
+    today = date.today()
+    harvested: Dict[str, None] = {}  # 타일 간 중복 제거 (삽입 순서 유지)
+    stats = {"searched": 0, "split": 0, "split_by_master": 0, "skipped_saturated": 0, "skipped_outside": 0, "failed": 0, "skipped_budget": 0}
+
+    pending = list(tiles)
+    while pending:
+        # 시간 예산이 소진되면 남은 타일은 검색하지 않고, 지금까지 모은 ID로 상세 수집
+        if budget is not None and budget.exhausted():
+            stats["skipped_budget"] += len(pending)
+            break
+        to_search: List[Tile] = []
+        next_level: List[Tile] = []
+        for tile in pending:
+            if area is not None and not area.intersects(box(tile.west, tile.south, tile.east, tile.north)):
+                stats["skipped_outside"] += 1
+                continue
+            known = density.count(tile)
+            if known >= result_cap and tile.depth < max_depth:
+                # 마스터 매장만으로 상한을 넘으므로 이 타일 검색은 반드시 잘림 → 검색 없이 분할
+                stats["split_by_master"] += 1
+                next_level.extend(split_tile(tile))
+                continue
+            latest = density.latest(tile)
+            if known >= saturated_min_stores and latest is not None and (today - latest).days < skip_recent_days:
+                stats["skipped_saturated"] += 1
+                continue
+            to_search.append(tile)
+
+        with ThreadPoolExecutor(max_workers=max(1, tile_parallelism)) as executor:
+            results = list(executor.map(lambda t: _harvest_tile(search_query, t, headless_mode, output_dir, new_only), to_search))
+
+        for tile, place_ids in zip(to_search, results):
+            if place_ids is None:
+                stats["failed"] += 1
+                continue
+            stats["searched"] += 1
+            for pid in place_ids:
+                harvested.setdefault(str(pid), None)
+            if len(place_ids) >= result_cap and tile.depth < max_depth:
+                stats["split"] += 1
+                next_level.extend(split_tile(tile))
+            print(f"[스윕] 타일(depth {tile.depth}, zoom {tile_zoom(tile)}) 중심 {tile.center}: 목록 {len(place_ids)}건 (누적 고유 ID {len(harvested)}개)")
+        pending = next_level
+
+    return {"place_ids": list(harvested.keys()), "stats": stats}
+
+
+def run_area_sweep(
+    search_query: str,
+    bounds: Optional[Sequence[float]] = None,
+    polygon_wkt: Optional[str] = None,
+    master_df: Optional[pd.DataFrame] = None,
+    sweep_config: Optional[Dict] = None,
+    headless_mode: bool = True,
+    output_dir: str = 'results',
+    existing_naver_ids: set = None,
+    num_workers: int = 1,
+    tabs_per_browser: int = 1,
+    detail_backend: str = "browser",
+    http_concurrency: int = 4,
+    run_id: Optional[str] = None,
+    sink_dir: Optional[str] = None,
+    crawl_profile: str = DEFAULT_PROFILE,
+    new_only: bool = False,
+    budget=None
+) -> pd.DataFrame:
+    """
+    경계 상자(bounds: south, west, north, east) 또는 Polygon(WKT) 영역을 타일로 스윕해 네이버 매장을 수집합니다.
+    sweep_config는 config.yaml의 area_sweep 섹션(tile_km, result_cap, max_depth, tile_parallelism,
+    saturated_min_stores, skip_recent_days)이며, 나머지 인자는 run_naver_crawling과 같습니다.
+    Polygon을 주면 영역과 겹치지 않는 타일은 검색하지 않고, 상세 수집 결과도 영역 안의 매장만 남깁니다.
+    new_only=True면 '새로오픈' 필터 목록만 수집하고, existing_naver_ids에 없는 매장만 상세 수집합니다. (신규 오픈 탐색)
+    """
+    cfg = sweep_config or {}
+    sections = profile_sections(crawl_profile)
+    if bounds is not None and len(bounds) != 4:
+        raise ValueError("bounds는 [south, west, north, east] 4개 값이어야 합니다.")
+    area = wkt.loads(polygon_wkt) if polygon_wkt else None
+    if bounds is None:
+        if area is None:
+            raise ValueError("bounds 또는 polygon_wkt 중 하나는 필요합니다.")
+        west, south, east, north = area.bounds
+        bounds = (south, west, north, east)
+
+    tiles = grid_tiles(bounds, cfg.get('tile_km', 1.0))
+    mode = " [신규 오픈 탐색]" if new_only else ""
+    print(f"영역 스윕 시작{mode}... (검색어: '{search_query}', 영역: {tuple(bounds)}, 초기 타일 {len(tiles)}개)")
+
+    sink = None
+    existing_naver_ids = set(existing_naver_ids or set())
+    if run_id:
+        sink = CrawlSink(sink_dir or os.path.join(output_dir, 'runs'), run_id)
+        existing_naver_ids |= sink.completed_ids()
+
+    plan = plan_and_harvest(
+        search_query, tiles, MasterDensity(None if new_only else master_df), area=area,
+        result_cap=cfg.get('result_cap', DEFAULT_RESULT_CAP),
+        max_depth=cfg.get('max_depth', 4),
+        tile_parallelism=cfg.get('tile_parallelism', 2),
+        saturated_min_stores=cfg.get('saturated_min_stores', 50),
+        skip_recent_days=cfg.get('skip_recent_days', 14),
+        headless_mode=headless_mode,
+        output_dir=output_dir,
+        new_only=new_only,
+        budget=budget,
+    )
+    print(f"영역 스윕 목록 수집 완료: 고유 ID {len(plan['place_ids'])}개, 타일 통계 {plan['stats']}")
+    if new_only:
+        unknown = [pid for pid in plan['place_ids'] if int(pid) not in existing_naver_ids]
+        print(f"새로오픈 목록 {len(plan['place_ids'])}개 중 처음 보는 매장 {len(unknown)}개를 상세 수집합니다.")
+
+    final_df = crawl_naver_place_ids(
+        plan['place_ids'], search_query, headless_mode, output_dir, existing_naver_ids, max(1, num_workers or 1), tabs_per_browser,
+        detail_backend=detail_backend, http_concurrency=http_concurrency, sink=sink,
+        sections=sections, budget=budget
+    )
+    if sink is not None:
+        final_df = pd.DataFrame(sink.load_records())
+
+    if final_df.empty or 'naver_id' not in final_df.columns:
+        print("크롤링된 데이터가 없습니다.")
+        return final_df
+
+    final_df = final_df.drop_duplicates(subset=["naver_id"], keep='first').reset_index(drop=True)
+    if area is not None:
+        lats = pd.to_numeric(final_df['gps_latitude'], errors='coerce')
+        lngs = pd.to_numeric(final_df['gps_longitude'], errors='coerce')
+        # 좌표가 없는 매장은 판단할 수 없으므로 유지
+        inside = [pd.isna(lat) or pd.isna(lng) or area.covers(Point(lng, lat)) for lat, lng in zip(lats, lngs)]
+        final_df = final_df[inside].reset_index(drop=True)
+    print(f"총 {len(final_df)}개의 고유한 매장 정보 크롤링을 완료했습니다.")
+    tag_franchise(final_df)
+    return final_df
@@ -0,0 +1,210 @@
+# instagram_enricher.py
+# 인스타그램 팔로워 수/게시글 수 수집을 네이버 상세 수집(get_store_details)에서 분리한 별도 단계입니다.
+# 기존에는 매장마다 네이버 창에서 새 탭을 열어 /embed 페이지를 기다린 뒤 다시 entryIframe으로 돌아와야 해서
+# 상세 수집이 직렬로 막혔고, 재수집 때마다 같은 계정을 다시 조회했습니다.
+#
+#  - 네이버 수집이 끝난 DataFrame의 instagram_link를 계정(handle) 단위로 모아 중복을 제거합니다.
+#  - 계정별 결과는 TTL이 있는 캐시(JSON 파일)에 저장되어, 같은 계정이나 최근 조회한 계정은 다시 요청하지 않습니다.
+#    embed 페이지에 계정 정보가 없는 계정(삭제/비공개/잘못된 링크)도 missing으로 캐시해 TTL 동안 다시 조회하지 않습니다.
+#  - 캐시에 없는 계정만 max_concurrency개의 브라우저가 공유 큐에서 나눠 조회합니다.
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from Crawling.utils.convert_str_to_number import convert_str_to_number
+
+INSTAGRAM_EMBED_URL = "https://www.instagram.com/{handle}/embed"
+
+# embed 페이지의 계정 이름, 팔로워 수, 게시글 수 위치 (기존 get_store_details와 동일)
+NAME_XPATH = "/html/body/div/div/div/div/div/div/div/div/div[1]/div[2]/div[1]/a/div"
+FOLLOWER_XPATH = "/html/body/div/div/div/div/div/div/div/div/div[1]/div[2]/div[3]/span/div[1]/span/span"
+POST_XPATH = "/html/body/div/div/div/div/div/div/div/div/div[1]/div[2]/div[3]/span/div[2]/span/span"
+
+HANDLE_PATTERN = re.compile(r"instagram\.com/([^/?#]+)", re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+
+def instagram_handle(link) -> Optional[str]:
+    """instagram_link에서 계정 이름을 추출합니다. (대소문자 구분 없이 같은 계정으로 취급)"""
+    if not isinstance(link, str):
+        return None
+    match = HANDLE_PATTERN.search(link)
+    return match.group(1).lower() if match else None
+
+
+class InstagramCache:
+    """계정별 {follower, post, missing, fetched_at}을 JSON 파일에 저장하는 TTL 캐시입니다."""
+
+    def __init__(self, path: Optional[str], ttl_days: float = 7):
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"인스타그램 캐시를 읽지 못해 비어 있는 캐시로 시작합니다: {e}")
+
+    def get(self, handle: str) -> Optional[Dict]:
+        entry = self.entries.get(handle)
+        if not entry:
+            return None
+        try:
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        except (KeyError, ValueError):
+            return None
+        return entry if datetime.now() - fetched_at < self.ttl else None
+
+    def put(self, handle: str, follower, post, missing: bool = False):
+        with self._lock:
+            self.entries[handle] = {"follower": follower, "post": post, "missing": missing,
+                                    "fetched_at": datetime.now().isoformat(timespec="seconds")}
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def _init_driver(headless: bool):
+    options = FirefoxOptions()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("lang=ko_KR")
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument("--window-size=1280,1024")
+    try:
+        return webdriver.Firefox(options=options, service=Service())
+    except Exception:
+        logger.error("❌ 인스타그램 수집용 WebDriver 초기화 실패", exc_info=True)
+        return None
+
+
+def _fetch_stats(driver, handle: str) -> Optional[Dict]:
+    """
+    embed 페이지에서 팔로워 수/게시글 수를 읽습니다.
+    계정 정보가 없으면 {"follower": None, "post": None, "missing": True}를, 브라우저 오류 등 일시적인 실패는 None을 반환합니다.
+    """
+    try:
+        driver.get(INSTAGRAM_EMBED_URL.format(handle=handle))
+        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.XPATH, NAME_XPATH)))
+        follower = convert_str_to_number(driver.find_element(By.XPATH, FOLLOWER_XPATH).text)
+        post = convert_str_to_number(driver.find_element(By.XPATH, POST_XPATH).text)
+        return {"follower": follower, "post": post}
+    except (NoSuchElementException, TimeoutException) as e:
+        logger.info(f"인스타그램 '{handle}' 정보 없음: {type(e).__name__}")
+        return {"follower": None, "post": None, "missing": True}
+    except WebDriverException as e:
+        logger.warning(f"❌ 인스타그램 '{handle}' 페이지 로딩 실패: {type(e).__name__}")
+        return None
+    except Exception as e:
+        logger.warning(f"❌ 인스타그램 '{handle}' 수집 실패: {e}")
+        return None
+
+
+def fetch_instagram_stats(handles: Iterable[str], cache: Optional[InstagramCache] = None,
+                          max_concurrency: int = 2, headless: bool = True) -> Dict[str, Dict]:
+    """
+    계정 목록의 {follower, post}를 반환합니다. 캐시가 유효한 계정은 요청하지 않으며,
+    나머지는 max_concurrency개의 브라우저가 나눠 조회합니다.
+    계정 정보가 없는 계정(캐시된 missing 포함)과 조회에 실패한 계정은 결과에 포함하지 않습니다.
+    """
+    cache = cache or InstagramCache(None)
+    results: Dict[str, Dict] = {}
+    to_fetch = queue.Queue()
+    cached_count = 0
+    for handle in dict.fromkeys(h for h in handles if h):
+        cached = cache.get(handle)
+        if not cached:
+            to_fetch.put(handle)
+            continue
+        cached_count += 1
+        if not cached.get("missing"):
+            results[handle] = {"follower": cached.get("follower"), "post": cached.get("post")}
+
+    pending = to_fetch.qsize()
+    print(f"인스타그램 보강: 계정 {cached_count + pending}개 중 캐시 사용 {cached_count}개, 조회 {pending}개 (동시 {max_concurrency})")
+    if not pending:
+        return results
+
+    def worker():
+        driver = _init_driver(headless)
+        if driver is None:
+            return
+        try:
+            while True:
+                try:
+                    handle = to_fetch.get_nowait()
+                except queue.Empty:
+                    return
+                stats = _fetch_stats(driver, handle)
+                if stats is None:
+                    continue  # 일시적인 실패는 캐시하지 않고 다음 실행에서 다시 조회
+                cache.put(handle, stats["follower"], stats["post"], missing=stats.get("missing", False))
+                if not stats.get("missing"):
+                    results[handle] = stats
+        finally:
+            driver.quit()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, pending))) as executor:
+        for future in [executor.submit(worker) for _ in range(max(1, min(max_concurrency, pending)))]:
+            future.result()
+    cache.save()
+    return results
+
+
+def load_instagram_cache(enrich_config: Optional[Dict] = None, data_dir: str = 'data') -> InstagramCache:
+    """config.yaml의 instagram_enrichment 설정으로 캐시를 엽니다. cache_file이 비어 있으면 파일에 저장하지 않습니다."""
+    cfg = enrich_config or {}
+    cache_file = cfg.get('cache_file', 'instagram_cache.json')
+    return InstagramCache(os.path.join(data_dir, cache_file) if cache_file else None, cfg.get('cache_ttl_days', 7))
+
+
+def run_instagram_enrichment(df: pd.DataFrame, enrich_config: Optional[Dict] = None, data_dir: str = 'data',
+                             headless: bool = True) -> pd.DataFrame:
+    """
+    네이버 수집 결과의 instagram_link로 instagram_follower, instagram_post를 채웁니다.
+    enrich_config는 config.yaml의 instagram_enrichment 섹션(enabled, max_concurrency, cache_ttl_days, cache_file)입니다.
+    """
+    cfg = enrich_config or {}
+    if df.empty or 'instagram_link' not in df.columns or not cfg.get('enabled', True):
+        return df
+
+    df = df.copy()
+    handles = df['instagram_link'].map(instagram_handle)
+    if handles.notna().sum() == 0:
+        print("인스타그램 계정이 있는 매장이 없어 보강을 건너뜁니다.")
+        return df
+
+    cache = load_instagram_cache(cfg, data_dir)
+    stats = fetch_instagram_stats(handles.dropna(), cache, max_concurrency=cfg.get('max_concurrency', 2), headless=headless)
+
+    df['instagram_follower'] = [stats.get(h, {}).get("follower") if h else None for h in handles]
+    df['instagram_post'] = [stats.get(h, {}).get("post") if h else None for h in handles]
+    print(f"인스타그램 보강 완료: {sum(1 for h in handles if h in stats)}개 매장에 팔로워/게시글 수 반영.")
+    return df
@@ -15,6 +15,8 @@ from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from Crawling.utils.tab_pool import TabPool
+
 
 
 # import Crawling_config as confing
@@ -30,6 +32,9 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:93.0) Gecko/20100101 Firefox/93.0",
 ]
 
+# 탭 풀에서 상세 페이지가 준비되었는지 판단하는 조건 (후기 탭 링크 렌더링 완료)
+DETAIL_READY_JS = "return !!document.querySelector(\"a[href='#comment'].link_tab\");"
+
 # ============ KakaoMapCrawler 클래스 =============
 class KakaoMapCrawler:
     def __init__(self, thread_id: int = 0, headless: bool = True):
@@ -56,41 +61,73 @@ class KakaoMapCrawler:
             print(f"❌ [Thread {self.thread_id}] WebDriver 초기화 실패: {e}", file=sys.stderr)
             return None
 
+    def _resolve_detail_url(self, store: dict):
+        """카카오맵 검색으로 매장 상세 페이지 URL을 찾습니다. 없으면 None."""
+        base_url = "https://map.kakao.com/"
+        self.driver.get(base_url)
+        # 'name' 키가 없을 경우를 대비하여 .get() 사용
+        self._search(store.get("name", ""))
+        time.sleep(1)
+
+        if self._check_result_type() == "single":
+            return self._get_single_result_url()
+        candidates = self._get_multiple_results()
+        best_match = self._match_address(store.get("address", ""), candidates)
+        return best_match["url"] if best_match else None
+
+    def _merge_result(self, store: dict, data: dict) -> dict:
+        # ▼▼▼ [수정] 결과 병합 로직 명확화 ▼▼▼
+        result = {**store}
+        for key, value in data.items():
+            result[f'kakao_{key}'] = value
+        return result
+
     def crawl_store(self, store: dict) -> dict:
         """단일 매장 정보를 크롤링합니다."""
         if not self.driver:
             return {**store, **self._empty_fields(prefix=True)}
 
-        base_url = "https://map.kakao.com/"
         try:
-            self.driver.get(base_url)
-            # 'name' 키가 없을 경우를 대비하여 .get() 사용
-            self._search(store.get("name", ""))
-            time.sleep(1)
-
-            if self._check_result_type() == "single":
-                detail_url = self._get_single_result_url()
-            else:
-                candidates = self._get_multiple_results()
-                best_match = self._match_address(store.get("address", ""), candidates)
-                detail_url = best_match["url"] if best_match else None
-
+            detail_url = self._resolve_detail_url(store)
             if not detail_url:
                 return {**store, **self._empty_fields(prefix=True)}
 
             self.driver.get(detail_url)
             data = self._scrape_detail()
-            
-            # ▼▼▼ [수정] 결과 병합 로직 명확화 ▼▼▼
-            result = {**store}
-            for key, value in data.items():
-                result[f'kakao_{key}'] = value
-            return result
+            return self._merge_result(store, data)
             
         except Exception as e:
             print(f"❌ [Thread {self.thread_id}] 매장 '{store.get('name', 'N/A')}' 크롤링 중 오류: {e}", file=sys.stderr)
             return {**store, **self._empty_fields(prefix=True)}
 
+    def crawl_stores_in_tabs(self, stores: list, tabs: int) -> list:
+        """
+        여러 매장을 하나의 브라우저에서 처리합니다.
+        1) 첫 번째 탭에서 매장별 상세 URL을 찾고 2) 상세 페이지는 여러 탭에서 동시에 로딩해 준비된 순서대로 수집합니다.
+        """
+        if not self.driver:
+            return [{**store, **self._empty_fields(prefix=True)} for store in stores]
+
+        results = [None] * len(stores)
+        targets = []
+        for idx, store in enumerate(stores):
+            try:
+                detail_url = self._resolve_detail_url(store)
+            except Exception as e:
+                print(f"❌ [Thread {self.thread_id}] 매장 '{store.get('name', 'N/A')}' 검색 중 오류: {e}", file=sys.stderr)
+                detail_url = None
+            if detail_url:
+                targets.append((idx, detail_url))
+            else:
+                results[idx] = {**store, **self._empty_fields(prefix=True)}
+
+        pool = TabPool(self.driver, size=tabs)
+        try:
+            for (idx, _), data in pool.run(targets, url_fn=lambda t: t[1], process_fn=lambda t: self._scrape_detail(), ready_js=DETAIL_READY_JS):
+                results[idx] = self._merge_result(stores[idx], data) if data else {**stores[idx], **self._empty_fields(prefix=True)}
+        finally:
+            pool.close()
+        return results
 
     def _empty_fields(self, prefix=False):
         fields = {
@@ -229,7 +266,14 @@ def crawl_one(store: dict, thread_id: int, headless: bool) -> dict:
     crawler.quit()
     return result
 
-def run_kakao_crawling(input_df: pd.DataFrame, max_threads: int, headless: bool) -> pd.DataFrame:
+def crawl_chunk_in_tabs(stores: list, thread_id: int, headless: bool, tabs: int) -> list:
+    crawler = KakaoMapCrawler(thread_id=thread_id, headless=headless)
+    try:
+        return crawler.crawl_stores_in_tabs(stores, tabs)
+    finally:
+        crawler.quit()
+
+def run_kakao_crawling(input_df: pd.DataFrame, max_threads: int, headless: bool, tabs_per_browser: int = 1) -> pd.DataFrame:
     """
     입력받은 DataFrame에 대해 카카오맵 정보를 병렬로 크롤링하여 추가하고 결과를 반환합니다.
 
@@ -237,6 +281,8 @@ def run_kakao_crawling(input_df: pd.DataFrame, max_threads: int, headless: bool)
         input_df (pd.DataFrame): 네이버 크롤링 결과가 담긴 데이터프레임.
         max_threads (int): 실행할 최대 스레드 개수.
         headless (bool): 브라우저 창 숨김 여부.
+        tabs_per_browser (int): 브라우저 1개당 동시에 로딩할 탭 수. 2 이상이면 스레드마다 브라우저 1개를 띄워
+                                담당 매장을 여러 탭으로 처리합니다. (기본값 1: 매장마다 브라우저 생성)
 
     Returns:
         pd.DataFrame: 카카오맵 정보가 추가된 데이터프레임.
@@ -249,6 +295,24 @@ def run_kakao_crawling(input_df: pd.DataFrame, max_threads: int, headless: bool)
     store_list = input_df.to_dict("records")
     results = []
 
+    if tabs_per_browser and tabs_per_browser > 1:
+        # 스레드별로 매장을 나눠 맡기고, 각 스레드는 브라우저 1개에서 여러 탭으로 처리
+        chunks = [store_list[i::max_threads] for i in range(max_threads)]
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            futures = {
+                executor.submit(crawl_chunk_in_tabs, chunk, i, headless, tabs_per_browser): chunk
+                for i, chunk in enumerate(chunks) if chunk
+            }
+            for future in as_completed(futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    print(f"❌ 탭 크롤링 스레드 오류: {e}", file=sys.stderr)
+                    results.extend(futures[future])
+                print(f"\r- 진행률: {len(results)}/{len(store_list)} ({ (len(results) / len(store_list)) * 100:.1f}%)", end="")
+        print("\n카카오맵 크롤링이 완료되었습니다.")
+        return pd.DataFrame(results)
+
     with ThreadPoolExecutor(max_workers=max_threads) as executor:
         futures = {
             executor.submit(crawl_one, store, i % max_threads, headless): store
@@ -5,6 +5,7 @@ import logging
 import os
 import sys
 import ast
+import queue
 from typing import Optional
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -14,6 +15,10 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # 만약 naver_crawler.py와 naver_crawler_detail.py가 같은 폴더에 있다면 아래와 같이 수정합니다.
 from Crawling.naver_crawler_detail import StoreCrawler
 from Crawling.naver_crawler_target import TargetStoreCrawler
+from Crawling.utils.check_franchise import tag_franchise
+from Crawling.naver_http_crawler import NaverHttpCrawler
+from Crawling.utils.crawl_sink import CrawlSink
+from Crawling.utils.crawl_profiles import DEFAULT_PROFILE, profile_sections
 
 # --- 유틸리티 함수 ---
 
@@ -39,7 +44,15 @@ def run_naver_crawling(
     zoom_level: Optional[int] = None, # [신규] zoom_level 인자 추가
     headless_mode: bool = True,
     output_dir: str = 'results',
-    existing_naver_ids: set = None 
+    existing_naver_ids: set = None,
+    num_workers: int = 1,
+    tabs_per_browser: int = 1,
+    detail_backend: str = "browser",
+    http_concurrency: int = 4,
+    run_id: Optional[str] = None,
+    sink_dir: Optional[str] = None,
+    crawl_profile: str = DEFAULT_PROFILE,
+    budget=None
 
 ) -> pd.DataFrame:
     """
@@ -51,13 +64,46 @@ def run_naver_crawling(
         longitude (float, optional): 검색 기준점 경도. Defaults to None.
         headless_mode (bool, optional): 브라우저 창 숨김 여부. Defaults to True.
         output_dir (str, optional): 결과물이 저장될 디렉토리. Defaults to 'results'.
+        num_workers (int, optional): 상세 정보 수집 워커 수. 2 이상이면 ID 수집 후 병렬로 상세 수집. Defaults to 1.
+        tabs_per_browser (int, optional): 브라우저 1개당 동시에 로딩할 탭 수. Defaults to 1.
+        detail_backend (str, optional): 상세 정보 수집 방식. 'http'면 브라우저 없이 먼저 수집하고 실패한 매장만 브라우저로 수집. Defaults to 'browser'.
+        http_concurrency (int, optional): 'http' 방식의 동시 요청 수. Defaults to 4.
+        run_id (str, optional): 실행 ID. 지정하면 수집한 매장을 {sink_dir}/{run_id}.jsonl에 바로 기록하고,
+            같은 run_id로 다시 실행하면 이미 기록된 매장은 건너뛴 뒤 기록 전체를 반환합니다. Defaults to None.
+        sink_dir (str, optional): 실행 기록(JSONL)이 저장될 디렉토리. Defaults to '{output_dir}/runs'.
+        crawl_profile (str, optional): 수집할 섹션을 정하는 크롤링 프로필 ('minimal', 'scoring', 'full'). Defaults to 'full'.
+        budget (CrawlBudget, optional): 요청 단위 매장 수/시간 예산 (utils.budget). 소진되면 새 매장 수집을 멈춥니다. Defaults to None.
 
     Returns:
         pd.DataFrame: 크롤링 결과를 통합한 데이터프레임.
     """
-    print(f"네이버 크롤링 시작... (검색어: '{search_query}')")
+    print(f"네이버 크롤링 시작... (검색어: '{search_query}', 프로필: {crawl_profile})")
+    sections = profile_sections(crawl_profile)
+    sink = None
+    if run_id:
+        sink = CrawlSink(sink_dir or os.path.join(output_dir, 'runs'), run_id)
+        done_ids = sink.completed_ids()
+        print(f"실행 기록 사용: {sink.path} (이미 수집된 매장 {len(done_ids)}건은 건너뜁니다)")
+        # 호출자가 넘긴 set은 수정하지 않도록 새 set으로 합침
+        existing_naver_ids = set(existing_naver_ids or set()) | done_ids
+
+    if (num_workers and num_workers > 1) or detail_backend == "http":
+        final_df = _run_parallel_naver_crawling(
+            search_query, latitude, longitude, zoom_level, headless_mode, output_dir, existing_naver_ids, max(1, num_workers or 1), tabs_per_browser,
+            detail_backend=detail_backend, http_concurrency=http_concurrency, sink=sink, sections=sections, budget=budget
+        )
+        if sink is not None:
+            final_df = pd.DataFrame(sink.load_records())
+        if not final_df.empty and 'naver_id' in final_df.columns:
+            final_df.drop_duplicates(subset=["naver_id"], inplace=True, keep='first')
+            print(f"총 {len(final_df)}개의 고유한 매장 정보 크롤링을 완료했습니다.")
+            tag_franchise(final_df)
+        else:
+            print("크롤링된 데이터가 없습니다.")
+        return final_df
+
     # 1. StoreCrawler 인스턴스 생성
-    crawler = StoreCrawler(headless=headless_mode, output_base_dir=output_dir,existing_naver_ids=existing_naver_ids)
+    crawler = StoreCrawler(headless=headless_mode, output_base_dir=output_dir,existing_naver_ids=existing_naver_ids, tabs_per_browser=tabs_per_browser, sink=sink, sections=sections, budget=budget)
     
     # WebDriver가 성공적으로 초기화되었는지 확인
     if crawler.driver is None:
@@ -71,16 +117,124 @@ def run_naver_crawling(
         longitude=longitude,
         zoom_level=zoom_level
     )
+    # 실행 기록이 있으면 이전 실행분까지 포함한 전체 기록을 결과로 사용
+    if sink is not None:
+        final_df = pd.DataFrame(sink.load_records())
     
     # 3. 중복 제거 (naver_id 기준)
     if not final_df.empty and 'naver_id' in final_df.columns:
         final_df.drop_duplicates(subset=["naver_id"], inplace=True, keep='first')
         print(f"총 {len(final_df)}개의 고유한 매장 정보 크롤링을 완료했습니다.")
+        # 프랜차이즈/체인 여부를 배치 단위로 한 번에 태깅 (이후 단계에서 재계산 없이 사용)
+        tag_franchise(final_df)
     else:
         print("크롤링된 데이터가 없습니다.")
 
     return final_df
 
+def _run_parallel_naver_crawling(
+    search_query: str,
+    latitude: float,
+    longitude: float,
+    zoom_level: Optional[int],
+    headless_mode: bool,
+    output_dir: str,
+    existing_naver_ids: set,
+    num_workers: int,
+    tabs_per_browser: int = 1,
+    detail_backend: str = "browser",
+    http_concurrency: int = 4,
+    sink: Optional[CrawlSink] = None,
+    sections=None,
+    budget=None
+) -> pd.DataFrame:
+    """
+    1단계: 드라이버 1개로 검색 목록의 place ID만 수집
+    2단계: crawl_naver_place_ids로 새 ID의 상세 정보를 수집 (HTTP 우선 수집, 병렬 브라우저 워커)
+    """
+    existing_naver_ids = existing_naver_ids if existing_naver_ids is not None else set()
+
+    harvester = StoreCrawler(headless=headless_mode, output_base_dir=output_dir, existing_naver_ids=existing_naver_ids, budget=budget)
+    if harvester.driver is None:
+        print("WebDriver 초기화에 실패하여 크롤링을 중단합니다.")
+        return pd.DataFrame()
+    place_ids = harvester.run_harvest(search_query=search_query, latitude=latitude, longitude=longitude, zoom_level=zoom_level)
+
+    return crawl_naver_place_ids(
+        place_ids, search_query, headless_mode, output_dir, existing_naver_ids, num_workers, tabs_per_browser,
+        detail_backend=detail_backend, http_concurrency=http_concurrency, sink=sink, sections=sections, budget=budget
+    )
+
+def crawl_naver_place_ids(
+    place_ids: list,
+    search_query: str,
+    headless_mode: bool,
+    output_dir: str,
+    existing_naver_ids: set,
+    num_workers: int,
+    tabs_per_browser: int = 1,
+    detail_backend: str = "browser",
+    http_concurrency: int = 4,
+    sink: Optional[CrawlSink] = None,
+    sections=None,
+    budget=None
+) -> pd.DataFrame:
+    """
+    이미 수집된 place ID 목록의 상세 정보를 수집합니다. (목록 수집 이후 단계, area_sweep.py에서도 사용)
+    (detail_backend='http') HTTP로 먼저 상세 정보를 수집하고, 실패한 ID만 브라우저 워커로 넘깁니다.
+    워커(각자 드라이버 보유)들이 공유 큐에서 ID를 꺼내 상세 정보를 수집한 뒤 결과를 합칩니다.
+    sections는 수집할 선택 섹션(utils.crawl_profiles.profile_sections)이며, 없으면 전체 섹션을 수집합니다.
+    budget(utils.budget.CrawlBudget)이 있으면 매장 수/시간 예산이 소진된 뒤의 ID는 수집하지 않습니다.
+    """
+    existing_naver_ids = existing_naver_ids if existing_naver_ids is not None else set()
+    new_ids = [pid for pid in place_ids if int(pid) not in existing_naver_ids]
+    if new_ids and budget is not None and budget.exhausted():
+        new_ids = []
+    results = []
+
+    # HTTP 백엔드: 브라우저 렌더링 없이 먼저 수집하고, 파싱에 실패한 ID만 브라우저 워커로 넘김
+    if detail_backend == "http" and new_ids:
+        http_crawler = NaverHttpCrawler(max_concurrency=http_concurrency, sections=sections, budget=budget)
+        try:
+            records, new_ids = http_crawler.crawl_place_ids(new_ids, search_word=search_query)
+        finally:
+            http_crawler.close()
+        print(f"HTTP 상세 수집: {len(records)}건 완료, 브라우저 재수집 대상 {len(new_ids)}건.")
+        if sink is not None:
+            for record in records:
+                sink.append(record)
+        if records:
+            results.append(pd.DataFrame(records))
+
+    print(f"목록 ID {len(place_ids)}개 중 {len(new_ids)}개를 상세 수집 워커 {num_workers}개로 처리합니다.")
+    if not new_ids or (budget is not None and budget.exhausted()):
+        return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
+    id_queue = queue.Queue()
+    for pid in new_ids:
+        id_queue.put(pid)
+
+    def worker(worker_id: int) -> pd.DataFrame:
+        crawler = StoreCrawler(headless=headless_mode, output_base_dir=output_dir, thread_id=worker_id, existing_naver_ids=existing_naver_ids, tabs_per_browser=tabs_per_browser, sink=sink, sections=sections, budget=budget)
+        if crawler.driver is None:
+            print(f"[워커 {worker_id}] WebDriver 초기화 실패. 이 워커는 작업에 참여하지 않습니다.")
+            return pd.DataFrame()
+        return crawler.run_detail_worker(id_queue, search_query=search_query)
+
+    # 필요 이상의 드라이버를 띄우지 않도록 워커 수는 ID 수를 넘지 않게 제한
+    worker_count = min(num_workers, len(new_ids))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        futures = [executor.submit(worker, i + 1) for i in range(worker_count)]
+        for future in as_completed(futures):
+            try:
+                df = future.result()
+                if df is not None and not df.empty:
+                    results.append(df)
+            except Exception as e:
+                print(f"상세 수집 워커 오류: {e}")
+
+    return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
 # 타겟 크롤링 (TargetStoreCrawler)
 def run_target_naver_crawling(
     search_query: str,
@@ -90,7 +244,9 @@ def run_target_naver_crawling(
     zoom_level: Optional[int] = None,
     headless_mode: bool = True,
     output_dir: str = 'results',
-    existing_naver_ids: set = None # 이 인자는 타겟 크롤링에선 사용되지 않을 수 있으나 API 호환성을 위해 유지
+    existing_naver_ids: set = None, # 이 인자는 타겟 크롤링에선 사용되지 않을 수 있으나 API 호환성을 위해 유지
+    resolution_cache=None,
+    crawl_profile: str = DEFAULT_PROFILE
 
 ) -> pd.DataFrame:
     """
@@ -103,32 +259,64 @@ def run_target_naver_crawling(
         longitude (float, optional): 검색 기준점 경도. Defaults to None.
         headless_mode (bool, optional): 브라우저 창 숨김 여부. Defaults to True.
         output_dir (str, optional): 결과물이 저장될 디렉토리. Defaults to 'results'.
+        resolution_cache (ResolutionCache, optional): (가게명, 주소, 좌표) → naver_id 매칭 캐시.
+            적중하면 검색/후보 매칭 없이 매장을 바로 열고, 검색으로 찾은 매장은 캐시에 기록합니다.
+        crawl_profile (str, optional): 수집할 섹션을 정하는 크롤링 프로필 ('minimal', 'scoring', 'full'). Defaults to 'full'.
 
     Returns:
         pd.DataFrame: 크롤링 결과를 통합한 데이터프레임.
     """
-    print(f"타겟 네이버 크롤링 시작... (가게명: '{search_query}', 주소: '{address}')")
-    
-    crawler = TargetStoreCrawler(headless=headless_mode, output_base_dir=output_dir,existing_naver_ids=existing_naver_ids)
-    
-    # WebDriver가 성공적으로 초기화되었는지 확인
-    if crawler.driver is None:
-        print("WebDriver 초기화에 실패하여 크롤링을 중단합니다.")
-        return pd.DataFrame()
+    print(f"타겟 네이버 크롤링 시작... (가게명: '{search_query}', 주소: '{address}', 프로필: {crawl_profile})")
+    sections = profile_sections(crawl_profile)
 
-    # 2. 크롤링 실행
-    final_df = crawler.run_crawl(
-        search_query=search_query,
-        address=address,
-        latitude=latitude,
-        longitude=longitude,
-        zoom_level=zoom_level
-    )
+    final_df = pd.DataFrame()
+    cached = resolution_cache.lookup(search_query, address, latitude, longitude) if resolution_cache else None
+    if cached:
+        print(f"매칭 캐시 적중: naver_id={cached['naver_id']} (신뢰도 {cached['confidence']:.2f}, 출처 {cached['source']})")
+        crawler = TargetStoreCrawler(headless=headless_mode, output_base_dir=output_dir, existing_naver_ids=existing_naver_ids, sections=sections)
+        if crawler.driver is None:
+            print("WebDriver 초기화에 실패하여 크롤링을 중단합니다.")
+            return pd.DataFrame()
+        final_df = crawler.run_crawl(search_query=search_query, address=address, place_id=cached['naver_id'])
+        # 이미 수집된 매장이라 건너뛴 경우가 아니면, 열리지 않는 매장으로 보고 캐시에서 지운 뒤 검색으로 진행
+        if final_df.empty and cached['naver_id'] not in (existing_naver_ids or set()):
+            print("캐시된 매장을 열지 못해 캐시에서 제거하고 검색으로 다시 찾습니다.")
+            resolution_cache.invalidate(search_query, cached['naver_id'])
+            resolution_cache.save()
+            cached = None
+
+    if not cached:
+        crawler = TargetStoreCrawler(headless=headless_mode, output_base_dir=output_dir,existing_naver_ids=existing_naver_ids, sections=sections)
+
+        # WebDriver가 성공적으로 초기화되었는지 확인
+        if crawler.driver is None:
+            print("WebDriver 초기화에 실패하여 크롤링을 중단합니다.")
+            return pd.DataFrame()
+
+        # 2. 크롤링 실행
+        final_df = crawler.run_crawl(
+            search_query=search_query,
+            address=address,
+            latitude=latitude,
+            longitude=longitude,
+            zoom_level=zoom_level
+        )
+
+        # 검색으로 찾은 매장을 캐시에 기록 (다음 요청부터는 검색 생략)
+        if resolution_cache and not final_df.empty and crawler.match_confidence is not None:
+            store = final_df.iloc[0]
+            if pd.notna(store.get('naver_id')):
+                resolution_cache.put(search_query, store['naver_id'], address=store.get('address'),
+                                     latitude=store.get('gps_latitude'), longitude=store.get('gps_longitude'),
+                                     confidence=crawler.match_confidence, query_address=address)
+                resolution_cache.save()
     
     # 3. 중복 제거 (naver_id 기준)
     if not final_df.empty and 'naver_id' in final_df.columns:
         final_df.drop_duplicates(subset=["naver_id"], inplace=True, keep='first')
         print(f"총 {len(final_df)}개의 고유한 매장 정보 크롤링을 완료했습니다.")
+        # 프랜차이즈/체인 여부를 배치 단위로 한 번에 태깅 (이후 단계에서 재계산 없이 사용)
+        tag_franchise(final_df)
     else:
         print("크롤링된 데이터가 없습니다.")
 
@@ -2,7 +2,7 @@
 from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException, WebDriverException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium import webdriver
@@ -12,9 +12,9 @@ from selenium.webdriver.firefox.service import Service
 # from Age_balance_store_based_crawling import extract_demographic_data
 from difflib import SequenceMatcher
 from rapidfuzz import fuzz
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
-from datetime import datetime, date
+from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 from shapely.geometry import Point
 
@@ -28,13 +28,21 @@ import logging
 import random
 import subprocess
 import time
+import queue
 
 # 각종 util 함수
 from .utils.get_instagram_link import get_instagram_link
-from .utils.is_within_date import is_within_one_month, is_within_two_weeks, parse_date, is_within_three_months
-from .utils.convert_str_to_number import convert_str_to_number
 from .utils.haversine import haversine
 from .utils.logger_utils import get_thread_logger
+from .utils.wait_strategy import WaitStrategy
+from .utils.dom_inventory import take_section_inventory
+from .utils.list_harvester import LIST_CONTAINER_SELECTOR, harvest_list
+from .utils.tab_extractors import (MENU_EXTRACT_JS, REVIEW_EXTRACT_JS, DATALAB_EXTRACT_JS, AGE_CHART_READY_JS,
+                                   menu_items_from_payload, review_fields_from_payload, datalab_fields_from_payload)
+from .utils.crawl_profiles import (CRAWL_PROFILES, DEFAULT_PROFILE, SECTION_ABSENT, SECTION_FAILED, SECTION_FIELDS, SECTION_OK,
+                                   SECTION_SKIPPED, STATUS_SECTIONS)
+from .utils.apollo_state import FETCH_APOLLO_STATE_JS, load_apollo_state, parse_apollo_state
+from .utils.tab_pool import TabPool
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0",
@@ -44,17 +52,27 @@ USER_AGENTS = [
     "Mozilla/5.0 (Linux; Android 12; SM-S908B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Mobile Safari/537.36",
     ]
 
+# 상세 페이지를 클릭 없이 바로 여는 place URL (entryIframe이 함께 로드됨)
+PLACE_ENTRY_URL = "https://map.naver.com/p/entry/place/{place_id}"
+
+# 탭 풀에서 상세 페이지가 준비되었는지 판단하는 조건 (entryIframe 로딩 완료)
+ENTRY_READY_JS = """
+const frame = document.getElementById('entryIframe');
+return !!(frame && frame.contentDocument && frame.contentDocument.readyState === 'complete');
+"""
+
 
 class StoreCrawler:
     # 크롤링되는 features 리스트
     columns = ['naver_id','search_word','name','category', 'new_store', 'instagram_link', 'instagram_post', 'instagram_follower',
                'visitor_review_count', 'blog_review_count', 'review_category','theme_mood','theme_topic','theme_purpose', 'distance_from_subway', 'distance_from_subway_origin', 'on_tv',
                'parking_available', 'seoul_michelin', 'age-2030', 'gender-balance', 'gender_male', 'gender_female' ,'running_well', 'address', 'phone',
-               'gps_latitude', 'gps_longitude','naver_url','menu_list','review_info', 'Crawl_Date']  
+               'gps_latitude', 'gps_longitude','naver_url','menu_list','review_info', 'section_status', 'Crawl_Date']  
     
-    def __init__(self, output_base_dir: str = None, headless: bool = True, thread_id=None, existing_naver_ids: set = None):
+    def __init__(self, output_base_dir: str = None, headless: bool = True, thread_id=None, existing_naver_ids: set = None, tabs_per_browser: int = 1, sink=None, sections=None, budget=None):
         self.headless = headless
         self.thread_id = thread_id
+        self.tabs_per_browser = max(1, int(tabs_per_browser or 1)) # 브라우저 1개당 동시에 로딩할 탭 수
         self.search_word = "" # [신규] 검색어 저장을 위한 변수
     
         #logger 먼저 정의
@@ -72,7 +90,12 @@ class StoreCrawler:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.output_base_dir = output_base_dir if output_base_dir else os.path.join(current_dir, 'result')
         os.makedirs(self.output_base_dir, exist_ok=True)  #디렉토리 생성 보장
-        self.data = pd.DataFrame(columns=StoreCrawler.columns)
+        # 수집 결과는 dict 리스트로 모으고(매장마다 DataFrame을 복사하지 않음), sink가 있으면 매장 단위로 바로 기록
+        self.records: List[Dict] = []
+        self.sink = sink # utils.crawl_sink.CrawlSink (선택)
+        # 수집할 선택 섹션 (utils.crawl_profiles). 지정하지 않으면 전체 섹션 수집
+        self.sections = frozenset(sections) if sections is not None else CRAWL_PROFILES[DEFAULT_PROFILE]
+        self.budget = budget # utils.budget.CrawlBudget (선택). 소진되면 새 매장 수집을 멈춤
         self.user_agent_index = random.randint(0, len(USER_AGENTS) - 1)
         self.driver = self.init_driver()
         
@@ -84,81 +107,246 @@ class StoreCrawler:
             self.wait_short = WebDriverWait(self.driver, 2)
             self.wait_medium = WebDriverWait(self.driver, 5)
             self.wait = WebDriverWait(self.driver, 10)
+            self.waits = WaitStrategy(self.driver, self.logger)
         else:
             self.wait_short = self.wait_medium = self.wait = None
+            self.waits = None
 
         # 네이버지도에서는 Iframe 태그를 통해서 매장 정보를 제공
         self.search_iframe = "searchIframe"
         self.entry_iframe = "entryIframe"
 
-    # 수정한 것(keyword 합친 것)
-    def run_crawl(self, search_query: str, latitude: float = None, longitude: float = None, zoom_level: Optional[int] = None):
+    # 검색 URL로 이동한 뒤 결과 유형을 판단합니다. ('entry': 단일 상세 페이지, 'list': 목록, 'none': 결과 없음/알 수 없음)
+    def open_search(self, search_query: str, latitude: float = None, longitude: float = None, zoom_level: Optional[int] = None) -> str:
         self.search_word = search_query
-        self.logger.info(f"크롤링 작업 시작. 검색어: '{search_query}', 좌표: ({latitude}, {longitude})")
+        final_zoom_level = zoom_level if zoom_level is not None else 15
+        encoded_query = quote(search_query)
 
-        try:
-            final_zoom_level = zoom_level if zoom_level is not None else 15
-            encoded_query = quote(search_query)
+        # URL 생성
+        if latitude and longitude:
+            
+            self.logger.info(f"좌표 기반 검색 시작 (Zoom: {final_zoom_level})...")
+            url = f"https://map.naver.com/p/search/{encoded_query}?c={final_zoom_level:.2f},{longitude},{latitude},0,0,0,dh"
+        else:
+            url = f"https://map.naver.com/p/search/{encoded_query}?c={final_zoom_level:.2f},0,0,0,0,0,dh"
 
-            # URL 생성
-            if latitude and longitude:
-                
-                self.logger.info(f"좌표 기반 검색 시작 (Zoom: {final_zoom_level})...")
-                url = f"https://map.naver.com/p/search/{encoded_query}?c={final_zoom_level:.2f},{longitude},{latitude},0,0,0,dh"
-                time.sleep(1.5)  # 페이지 로딩 대기
-            else:
-                url = f"https://map.naver.com/p/search/{encoded_query}?c={final_zoom_level:.2f},0,0,0,0,0,dh"
-                time.sleep(2)  # 페이지 로딩 대기
+        self.logger.info(f"[URL 이동] {url}")
+        self.driver.get(url)
+        # 검색 결과 프레임이 나타나고 네트워크 요청이 잦아들 때까지 대기 (기존: 고정 1.5~2초 + 4.5초)
+        self.waits.for_selector("search_frame", "iframe#searchIframe, iframe#entryIframe", timeout=10, baseline=6.0)
+        self.waits.for_network_idle("search_network_idle", idle_ms=500, timeout=4.5)
+
+        # 프레임 감지 및 결과 유형 판단
+        iframe_elements = self.driver.find_elements(By.TAG_NAME, "iframe")
+        iframe_ids = [iframe.get_attribute("id") for iframe in iframe_elements]
+
+        if "entryIframe" in iframe_ids:
+            return "entry"
+        if "searchIframe" in iframe_ids:
+            return "list"
+
+        # fallback: searchIframe 직접 진입해서 '검색 결과 없음' 여부 확인
+        try:
+            self.driver.switch_to.frame("searchIframe")
+            self.waits.for_selector("no_result", ".FYvSc", timeout=2, baseline=1.0)
+            no_result_elem = self.driver.find_element(By.CLASS_NAME, "FYvSc")
+            no_result_text = no_result_elem.text.strip()
+            self.logger.info(f"검색 결과 없음 텍스트: {no_result_text}")
+            if "조건에 맞는 업체가 없습니다" in no_result_text:
+                self.logger.warning("검색 결과 없음 → 크롤링 중단")
+        except Exception:
+            self.logger.warning("프레임도 없고 결과 없음도 확인 불가 → unknown 상태로 간주")
+        return "none"
 
-            self.logger.info(f"[URL 이동] {url}")
-            self.driver.get(url)
-            time.sleep(4.5)
+    # 수정한 것(keyword 합친 것)
+    def run_crawl(self, search_query: str, latitude: float = None, longitude: float = None, zoom_level: Optional[int] = None):
+        self.logger.info(f"크롤링 작업 시작. 검색어: '{search_query}', 좌표: ({latitude}, {longitude})")
 
-            # 프레임 감지 및 결과 유형 판단
-            iframe_elements = self.driver.find_elements(By.TAG_NAME, "iframe")
-            iframe_ids = [iframe.get_attribute("id") for iframe in iframe_elements]
+        try:
+            result_type = self.open_search(search_query, latitude, longitude, zoom_level)
 
-            if "entryIframe" in iframe_ids:
+            if result_type == "entry":
                 self.logger.info("검색 결과: 단일 상세 페이지. 해당 가게 정보를 크롤링합니다.")
                 self.init_dictionary()
                 self.get_store_details()
 
-            elif "searchIframe" in iframe_ids:
+            elif result_type == "list":
                 self.logger.info("검색 결과: 목록 페이지. 전체 목록 크롤링을 시작합니다.")
                 self.crawl_all_results_in_list()
 
-            else:
-                # fallback: searchIframe 직접 진입해서 '검색 결과 없음' 여부 확인
-                try:
-                    self.driver.switch_to.frame("searchIframe")
-                    time.sleep(1)
-                    no_result_elem = self.driver.find_element(By.CLASS_NAME, "FYvSc")
-                    no_result_text = no_result_elem.text.strip()
-                    self.logger.info(f"검색 결과 없음 텍스트: {no_result_text}")
-                    if "조건에 맞는 업체가 없습니다" in no_result_text:
-                        self.logger.warning("검색 결과 없음 → 크롤링 중단")
-                        return self.data
-                except Exception:
-                    self.logger.warning("프레임도 없고 결과 없음도 확인 불가 → unknown 상태로 간주")
-
         except Exception as e:
             self.logger.error(f"크롤링 실행 중 심각한 오류 발생: {e}", exc_info=True)
 
         finally:
             self.quit()
-            self.logger.info(f"크롤링 작업 완료. 총 {len(self.data)}개 데이터 수집.")
+            self.logger.info(f"크롤링 작업 완료. 총 {len(self.records)}개 데이터 수집.")
             return self.data
 
+    # [병렬 수집 1단계] 검색 결과의 place ID만 수집하고 상세 페이지는 열지 않습니다.
+    # new_only=True면 목록에 '새로오픈' 필터를 적용한 뒤 수집합니다. (필터를 적용할 수 없으면 빈 목록)
+    def run_harvest(self, search_query: str, latitude: float = None, longitude: float = None, zoom_level: Optional[int] = None,
+                    new_only: bool = False) -> List[str]:
+        self.logger.info(f"ID 수집 작업 시작. 검색어: '{search_query}', 좌표: ({latitude}, {longitude}){' [새로오픈]' if new_only else ''}")
+        place_ids: List[str] = []
+        try:
+            result_type = self.open_search(search_query, latitude, longitude, zoom_level)
+
+            if new_only:
+                # 단일 상세 페이지로 열린 결과는 새로오픈 여부를 알 수 없으므로 수집하지 않음
+                if result_type == "list" and self.click_new_option():
+                    place_ids = self.harvest_place_ids()
+
+            elif result_type == "entry":
+                self.move_to_default_content()
+                ifram_src = self.driver.find_element(By.ID, self.entry_iframe).get_attribute("src")
+                match = re.search(r'/place/(\d+)', ifram_src or "")
+                if match:
+                    place_ids = [match.group(1)]
+
+            elif result_type == "list":
+                place_ids = self.harvest_place_ids()
+
+        except Exception as e:
+            self.logger.error(f"ID 수집 중 심각한 오류 발생: {e}", exc_info=True)
+
+        finally:
+            self.quit()
+            self.logger.info(f"ID 수집 작업 완료. 총 {len(place_ids)}개 ID 수집.")
+            return place_ids
+
+    # [병렬 수집 2단계] 공유 큐에서 place ID를 꺼내 상세 정보를 수집합니다. (워커 1개 = 드라이버 1개)
+    def run_detail_worker(self, id_queue, search_query: str = ""):
+        self.search_word = search_query
+
+        def drain_queue():
+            while True:
+                try:
+                    place_id = id_queue.get_nowait()
+                except queue.Empty:
+                    return # 큐가 비면 종료
+                if int(place_id) not in self.existing_naver_ids:
+                    yield place_id
+
+        try:
+            self.crawl_place_ids(drain_queue())
+        finally:
+            self.quit()
+            self.logger.info(f"상세 수집 워커 종료. 총 {len(self.records)}개 데이터 수집.")
+        return self.data
+
     # [신규] 검색 목록의 모든 가게를 크롤링하는 메소드
-    # naver_crawler_detail.py의 crawl_all_results_in_list 메소드 (최종 완성본)
+    # 1) 모든 페이지의 place ID를 먼저 한 번에 수집 → 2) 마스터에 있는 ID 제외 → 3) 새 ID만 place URL로 직접 방문
+    # ID를 추출하지 못한 페이지가 나오면 그 페이지부터는 클릭 방식으로 수집하고, 앞 페이지에서 모은 ID는 이어서 직접 방문합니다.
     def crawl_all_results_in_list(self):
+        harvested, unresolved_page = self._harvest_pages(stop_at_unresolved=True)
+        if unresolved_page is not None or not harvested:
+            self.logger.warning(f"{unresolved_page or 1} 페이지 목록에서 place ID를 추출하지 못했습니다. 이 페이지부터 클릭 방식으로 크롤링합니다.")
+            self.crawl_all_results_by_click()
+        if not harvested:
+            return
+
+        new_ids = [pid for pid in harvested if int(pid) not in self.existing_naver_ids]
+        self.logger.info(f"목록 ID {len(harvested)}개 중 기존 매장 {len(harvested) - len(new_ids)}개 제외, 신규 {len(new_ids)}개 상세 수집 시작.")
+        self.crawl_place_ids(new_ids)
+
+    def crawl_place_ids(self, place_ids):
+        """place ID 목록의 상세 정보를 수집합니다. tabs_per_browser가 2 이상이면 여러 탭에서 동시에 로딩합니다."""
+        if self.budget is not None:
+            place_ids = self.budget.gate(place_ids)
+        if self.tabs_per_browser > 1:
+            self.crawl_place_ids_in_tabs(place_ids)
+            return
+
+        for idx, place_id in enumerate(place_ids, start=1):
+            self.logger.info(f"--- {idx}번째 매장(ID: {place_id}) 처리 시작 ---")
+            try:
+                if not self.open_place_by_id(place_id):
+                    continue
+                self.init_dictionary()
+                self.get_store_details()
+            except Exception as e:
+                self.logger.error(f"매장(ID: {place_id}) 처리 중 오류 발생. 건너뜁니다. 에러: {e}", exc_info=True)
+                continue
+
+    def crawl_place_ids_in_tabs(self, place_ids):
+        """하나의 브라우저에서 여러 탭으로 상세 페이지를 동시에 로딩하고, 먼저 준비된 탭부터 수집합니다."""
+        def process(place_id):
+            self.init_dictionary()
+            self.get_store_details()
+
+        pool = TabPool(self.driver, size=self.tabs_per_browser, logger=self.logger)
+        try:
+            for idx, (place_id, _) in enumerate(pool.run(
+                place_ids,
+                url_fn=lambda pid: PLACE_ENTRY_URL.format(place_id=pid),
+                process_fn=process,
+                ready_js=ENTRY_READY_JS,
+            ), start=1):
+                self.logger.info(f"--- 탭 수집 {idx}번째 매장(ID: {place_id}) 처리 완료 ---")
+        finally:
+            pool.close()
+
+    def harvest_place_ids(self) -> List[str]:
+        """검색 결과 전체 페이지를 돌며 place ID를 순서대로(중복 없이) 수집합니다. (ID를 추출하지 못한 아이템은 경고 후 건너뜀)"""
+        return self._harvest_pages()[0]
+
+    def _harvest_pages(self, stop_at_unresolved: bool = False) -> Tuple[List[str], Optional[int]]:
+        """
+        페이지별 ID 수집 본체입니다. 반환: (수집한 ID 목록, ID를 추출하지 못해 멈춘 페이지 번호 또는 None)
+        stop_at_unresolved=True면 ID 수가 목록 아이템 수보다 적은 페이지에서, 그 페이지의 ID는 넣지 않고 멈춥니다.
+        (그 페이지부터는 호출 측이 클릭 방식으로 수집)
+        """
+        harvested: Dict[str, str] = {}
+        unresolved_page = None
+        page = 1
+        while True:
+            if self.budget is not None and self.budget.exhausted():
+                break
+            try:
+                self.move_to_search_iframe()
+                self.logger.info(f"===== {page} 페이지 ID 수집 시작 =====")
+                result = self.scroll_to_end()
+                items = result.get("items", [])
+                dom_count = result.get("dom_count", 0)
+                # 목록 아이템 중 ID를 찾지 못한 것이 있으면 이 페이지의 ID 목록은 불완전함
+                if len(items) < dom_count and stop_at_unresolved:
+                    unresolved_page = page
+                    break
+                before = len(harvested)
+                for item in items:
+                    harvested.setdefault(str(item["id"]), item.get("name", ""))
+                self.logger.info(f"{page} 페이지: 목록 {dom_count}개, 신규 ID {len(harvested) - before}개 수집 (누적 {len(harvested)}개)")
+                if len(items) < dom_count:
+                    self.logger.warning(f"{page} 페이지 목록 {dom_count}개 중 {dom_count - len(items)}개는 place ID를 추출하지 못해 건너뜁니다.")
+            except Exception as e:
+                self.logger.warning(f"{page} 페이지 ID 수집 중 오류: {e}")
+                break
+
+            if not self.move_to_next_page():
+                break
+            page += 1
+        return list(harvested.keys()), unresolved_page
+
+    def open_place_by_id(self, place_id) -> bool:
+        """목록 클릭 없이 place URL로 상세 페이지를 직접 열고 entryIframe 로딩을 기다립니다."""
+        try:
+            self.driver.get(PLACE_ENTRY_URL.format(place_id=place_id))
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.ID, self.entry_iframe))
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning(f"❌ 매장(ID: {place_id}) entryIframe 로딩 실패 (Timeout)")
+            return False
+
+    # [기존 방식] 목록의 가게를 하나씩 클릭해서 상세 정보를 여는 방식 (ID 추출 실패 시 fallback)
+    def crawl_all_results_by_click(self):
         page = 1
         while True:
             try:
                 self.move_to_search_iframe()
                 self.logger.info(f"===== {page} 페이지 크롤링 시작 =====")
                 self.scroll_to_end()
-                time.sleep(2)
                 store_elements_xpath = "//*[@id='_pcmap_list_scroll_container']/ul/li"
                 WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.XPATH, store_elements_xpath)))
                 store_elements = self.driver.find_elements(By.XPATH, store_elements_xpath)
@@ -168,6 +356,8 @@ class StoreCrawler:
                 break
 
             for i in range(len(store_elements)):
+                if self.budget is not None and self.budget.exhausted():
+                    return
                 store_name_for_log = "[이름 확인 불가]"
                 try:
                     # [중요] StaleElementReferenceException을 원천적으로 방지하기 위해
@@ -296,23 +486,31 @@ class StoreCrawler:
             "naver_url": None,
             "review_info": [],
             "menu_list": [],
+            "section_status": {}, # {섹션: ok/failed/skipped/absent} (section_retry.py에서 failed 섹션만 재수집)
             "Crawl_Date": datetime.now().strftime("%Y-%m-%d")
         }
-    # "새로오픈" 태그를 가진 매장만을 겨냥한 크롤링 진행 시, 본격적인 매장 크롤링 직전에 실행
-    def click_new_option(self):
-        time.sleep(1)
+    # "새로오픈" 태그를 가진 매장만을 겨냥한 크롤링 진행 시, 본격적인 매장 크롤링 직전에 실행 (필터 적용 여부 반환)
+    def click_new_option(self) -> bool:
         self.logger.info("새로오픈 태그 클릭")
-        self.move_to_search_iframe()
-        # "더보기" 버튼 클릭
-        more_xpath = """//a[span[contains(text(),'더보기')]]"""
-        more_button = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, more_xpath)))
-        self.driver.execute_script("arguments[0].click()", more_button)
-        # "새로오픈" 버튼 클릭
-        new_xpath = """//a[contains(text(),'새로오픈')]"""
-        new_button = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, new_xpath)))
-        self.driver.execute_script("arguments[0].click()", new_button)
+        try:
+            self.move_to_search_iframe()
+            # "더보기" 버튼 클릭
+            more_xpath = """//a[span[contains(text(),'더보기')]]"""
+            more_button = self.wait_medium.until(
+                EC.element_to_be_clickable((By.XPATH, more_xpath)))
+            self.driver.execute_script("arguments[0].click()", more_button)
+            # "새로오픈" 버튼 클릭
+            new_xpath = """//a[contains(text(),'새로오픈')]"""
+            new_button = self.wait_medium.until(
+                EC.element_to_be_clickable((By.XPATH, new_xpath)))
+            self.driver.execute_script("arguments[0].click()", new_button)
+        except TimeoutException:
+            self.logger.warning("❌ 새로오픈 필터를 찾지 못했습니다.")
+            return False
+        # 필터가 적용된 목록으로 다시 그려질 때까지 대기 (기존: 고정 1초)
+        self.waits.for_network_idle("new_option_network_idle", idle_ms=500, timeout=4.5, baseline=1.0)
+        self.waits.for_dom_quiet("new_option_render", quiet_ms=300, timeout=3)
+        return True
 
     def move_to_entry_iframe(self):
         try:
@@ -326,7 +524,7 @@ class StoreCrawler:
             raise
 
 
-    # 탭 이동 후 직접 time sleep을 사용해 대시한다
+    # 탭 이동 후 준비 신호(탭 선택 상태, 탭 콘텐츠 DOM 안정화)로 대기한다
     def move_to_tab(self, tab_name):
         tab_xpath = f"""//a[@role='tab' and .//span[text()='{tab_name}']]"""
         # tab_element = self.driver.find_element(By.XPATH, tab_xpath)
@@ -334,13 +532,166 @@ class StoreCrawler:
             EC.element_to_be_clickable((By.XPATH, tab_xpath))
         )        
         self.driver.execute_script("arguments[0].click()", tab_element)
-        time.sleep(2)
+        self.waits.until(f"tab_selected:{tab_name}", lambda: tab_element.get_attribute("aria-selected") == "true", timeout=3, baseline=1.0)
+        self.waits.for_dom_quiet(f"tab_render:{tab_name}", quiet_ms=300, timeout=3, baseline=1.0)
+
+
+    # 홈 탭 데이터랩(테마키워드, 연령별/성별 비율)을 스크립트 한 번으로 수집 (성공 여부 반환)
+    def collect_datalab(self) -> bool:
+        try:
+            self.move_to_tab('홈')
+
+            # 페이지 끝까지 스크롤하여 지연 로딩되는 데이터랩 영역을 불러옴
+            last_height = self.driver.execute_script("return document.body.scrollHeight")
+            while True:
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(0.5)
+                new_height = self.driver.execute_script("return document.body.scrollHeight")
+                if new_height == last_height:
+                    break
+                last_height = new_height
+            self.waits.for_dom_quiet("home_after_scroll", quiet_ms=300, timeout=3, baseline=1.0)
+
+            # 연령별 차트는 화면에 보여야 그려지므로, 영역이 있으면 스크롤 후 값이 채워질 때까지 대기
+            age_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.gZ4G4")
+            if age_containers:
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", age_containers[0])
+                self.waits.for_script("age_chart", AGE_CHART_READY_JS, timeout=4, baseline=2.0 + 4.0 + 0.7 * 6)
+
+            payload = self.driver.execute_script(DATALAB_EXTRACT_JS) or {}
+            fields = datalab_fields_from_payload(payload)
+            self.store_dict.update(fields)
+            if not payload.get("has_datalab"):
+                self.logger.info("데이터랩 섹션이 없어 홈 탭 수집을 건너뜁니다.")
+            else:
+                self.logger.info(f"데이터랩 수집 완료: 연령(2030)={fields['age-2030']}, 남성={fields['gender_male']}%, 여성={fields['gender_female']}%")
+            return True
+        except Exception as e:
+            self.logger.warning("❌ 홈 탭 데이터랩 수집 실패")
+            self.logger.warning(e)
+            self.store_dict.update(datalab_fields_from_payload(None))
+            return False
+
+    # 메뉴 탭의 메뉴 목록을 스크립트 한 번으로 수집 (성공 여부 반환)
+    def collect_menu_tab(self) -> bool:
+        try:
+            self.move_to_tab("메뉴")
+            self.waits.for_selector("menu_list", "li.E2jtL, div.info_detail", timeout=3, baseline=2.0, section="menu")
+            payload = self.driver.execute_script(MENU_EXTRACT_JS) or {}
+            menu_items = menu_items_from_payload(payload)
+            self.logger.info(f"메뉴 구조: {payload.get('layout')}, 메뉴 개수: {len(menu_items)}")
+            self.store_dict["menu_list"] = menu_items
+            return True
+        except Exception as e:
+            self.logger.warning("메뉴 탭 크롤링 실패")
+            self.logger.warning(e)
+            self.store_dict["menu_list"] = []
+            return False
+
+    # 리뷰 탭의 리뷰 키워드와 최근 방문 리뷰를 스크립트 한 번으로 수집하고 운영 상태를 평가 (성공 여부 반환)
+    def collect_review_tab(self):
+        try:
+            self.driver.switch_to.default_content()
+            self.move_to_entry_iframe()
+
+            tab_xpath = """//a[@role='tab']//span[text()='리뷰']"""
+            self.wait_short.until(EC.presence_of_element_located((By.XPATH, tab_xpath)))
+            self.move_to_tab('리뷰')
+
+            # 리뷰 콘텐츠 렌더링 대기 (선택자가 저하 상태면 짧게만 확인)
+            if not self.waits.for_xpath("review_list", '//li[contains(@class, "place_apply_pui")]', timeout=5, section="reviews"):
+                raise TimeoutException("리뷰 목록(place_apply_pui)을 찾지 못했습니다.")
+
+            # 최신순 정렬 시도
+            try:
+                sort_selector = "div.mlywZ > span.v6aH1:nth-child(2) > a"
+                if not self.waits.for_selector("review_sort", sort_selector, timeout=5, section="reviews"):
+                    raise TimeoutException("최신순 정렬 버튼(mlywZ/v6aH1)을 찾지 못했습니다.")
+                latest_sort_elem = self.driver.find_element(By.CSS_SELECTOR, sort_selector)
+                self.driver.execute_script("arguments[0].click();", latest_sort_elem)
+                self.waits.for_dom_quiet("review_sort_latest", quiet_ms=300, timeout=3)
+            except Exception as e:
+                self.logger.warning(f"❌ 최신순 클릭 실패: {e}")
+
+            payload = self.driver.execute_script(REVIEW_EXTRACT_JS) or {}
+            self.store_dict.update(review_fields_from_payload(payload))
+            self.store_dict["crawling_date"] = datetime.now().strftime("%Y-%m-%d")
+            self.logger.info(f"리뷰 키워드: {self.store_dict['review_category']}")
+            self.logger.info(f"수집된 리뷰(날짜+댓글): {self.store_dict['review_info']}, 운영 상태 평가: {self.store_dict['running_well']}")
+            return True
+
+        except Exception as e:
+            self.logger.warning("❌ 리뷰 탭 전체 수집 실패")
+            self.logger.warning(e)
+            self.store_dict["review_category"] = ''
+            self.store_dict["review_info"] = []
+            self.store_dict["running_well"] = None  # 수집 실패는 "운영 안 함(0)"이 아니라 알 수 없음
+            return False
+
+    # [갱신 모드] 이미 수집된 매장에서 요청된 그룹의 필드만 다시 수집합니다. (Crawling/naver_refresh.py에서 사용)
+    # - review_counts: 상세 페이지 Apollo 상태의 방문자/블로그 리뷰 수 (탭 이동 없음)
+    # - reviews: 리뷰 탭으로 바로 이동해 리뷰 키워드/최근 리뷰/운영 상태 수집
+    # (인스타그램 지표는 instagram_enricher.py에서 계정 단위로 갱신)
+    # 반환: {그룹: 갱신된 필드}. 수집에 실패한 그룹은 포함하지 않으며, 상세 페이지를 열지 못하면 None
+    def refresh_store(self, place_id, groups) -> Optional[Dict[str, Dict]]:
+        self.waits.reset()
+        self.init_dictionary()
+        self.store_dict["naver_id"] = int(place_id)
+
+        if not self.open_place_by_id(place_id):
+            return None
+        try:
+            self.move_to_entry_iframe()
+        except TimeoutException:
+            return None
+
+        refreshed: Dict[str, Dict] = {}
+        if "review_counts" in groups:
+            try:
+                raw_state = WebDriverWait(self.driver, 10).until(
+                    lambda d: d.execute_script(FETCH_APOLLO_STATE_JS)
+                )
+                fields = parse_apollo_state(load_apollo_state(raw_state), place_id)
+                counts = {k: fields[k] for k in ("visitor_review_count", "blog_review_count") if k in fields}
+                if len(counts) == 2:
+                    refreshed["review_counts"] = counts
+            except Exception as e:
+                self.logger.warning(f"❌ 리뷰 수 갱신 실패 (ID: {place_id}): {e}")
+
+        if "reviews" in groups and self.collect_review_tab():
+            refreshed["reviews"] = {k: self.store_dict[k] for k in ("review_category", "review_info", "running_well")}
+
+        self.waits.log_report(f"(갱신 ID: {place_id})")
+        return refreshed
 
+    # [섹션 재수집] 수집에 실패(section_status가 failed)했던 섹션만 다시 수집합니다. (Crawling/section_retry.py에서 사용)
+    # 반환: {섹션: 수집된 필드}. 다시 실패한 섹션은 포함하지 않으며, 상세 페이지를 열지 못하면 None
+    def retry_sections(self, place_id, sections) -> Optional[Dict[str, Dict]]:
+        self.waits.reset()
+        self.init_dictionary()
+        self.store_dict["naver_id"] = int(place_id)
+
+        if not self.open_place_by_id(place_id):
+            return None
+        try:
+            self.move_to_entry_iframe()
+        except TimeoutException:
+            return None
+
+        collectors = {"datalab": self.collect_datalab, "menu": self.collect_menu_tab, "reviews": self.collect_review_tab}
+        recovered: Dict[str, Dict] = {}
+        for section in STATUS_SECTIONS:  # 상세 수집과 같은 순서 (홈 → 메뉴 → 리뷰)
+            if section in sections and collectors[section]():
+                recovered[section] = {k: self.store_dict.get(k) for k in SECTION_FIELDS[section]}
+
+        self.waits.log_report(f"(섹션 재수집 ID: {place_id})")
+        return recovered
 
     # [수정] naver_id 인자를 제거하고, 내부 로직을 '현재 로드된 페이지' 기준으로 변경 
     def get_store_details(self):
         try:
             self.logger.info("매장 상세 정보 수집 시작...")
+            self.waits.reset()
             
             # [수정 1] iframe에 들어가기 전에 URL과 ID를 먼저 확인
             try:
@@ -377,199 +728,196 @@ class StoreCrawler:
                 return False
             
 
+            # [Apollo 우선] __APOLLO_STATE__에서 상세 정보를 한 번에 추출하고, 없는 필드만 아래에서 DOM으로 수집
+            apollo_fields = {}
             try:
-                # 1. __APOLLO_STATE__가 로드될 때까지 명시적으로 대기합니다.
-                WebDriverWait(self.driver, 10).until(
-                    lambda d: d.execute_script("return window.__APOLLO_STATE__;")
+                raw_state = WebDriverWait(self.driver, 10).until(
+                    lambda d: d.execute_script(FETCH_APOLLO_STATE_JS)
                 )
-                
-                # 2. execute_script로 __APOLLO_STATE__ 객체 자체를 가져옵니다.
-                apollo_state = self.driver.execute_script("return window.__APOLLO_STATE__;")
-                
-                is_gps_found = False
-                # 3. 파이썬 딕셔너리로 순회하며 'coordinate' 키를 탐색합니다.
-                for key, value in apollo_state.items():
-                    if isinstance(value, dict) and "coordinate" in value and value["coordinate"] is not None:
-                        # [수정] 'Place:'로 시작한다는 가정을 버리고, 'coordinate' 키 존재 여부만 확인
-                        coords = value["coordinate"]
-                        if coords.get("x") and coords.get("y"):
-                            self.store_dict["gps_longitude"] = float(coords.get("x"))
-                            self.store_dict["gps_latitude"] = float(coords.get("y"))
-                            self.logger.info(f"✅ GPS 좌표 추출 성공: 키 '{key}'에서 찾음 -> ({self.store_dict['gps_latitude']}, {self.store_dict['gps_longitude']})")
-                            is_gps_found = True
-                            break  # 좌표를 찾았으면 더 이상 탐색할 필요가 없습니다.
-                
-                if not is_gps_found:
+                apollo_fields = parse_apollo_state(load_apollo_state(raw_state), self.store_dict.get("naver_id"))
+                self.store_dict.update(apollo_fields)
+                self.logger.info(f"✅ Apollo 상태에서 {len(apollo_fields)}개 필드 추출: {sorted(apollo_fields.keys())}")
+                if "gps_latitude" not in apollo_fields:
                     self.logger.warning("❌ __APOLLO_STATE__ 데이터 안에서 'coordinate' 정보를 찾지 못했습니다.")
-                    # [진단 코드] 어떤 키들이 있는지 확인하기 위해 모든 키 목록을 출력합니다.
-                    self.logger.warning(f"전체 APOLLO_STATE 키 목록: {list(apollo_state.keys())}")
-
             except Exception as e:
-                self.logger.error(f"❌ GPS 좌표 추출 중 심각한 오류 발생: {e}")
+                self.logger.warning(f"❌ __APOLLO_STATE__ 추출 실패, DOM에서 수집합니다: {e}")
                 self.store_dict["gps_latitude"] = None
                 self.store_dict["gps_longitude"] = None
 
+            # [DOM 인벤토리] 선택 섹션의 존재 여부를 한 번에 확인하고, 없는 섹션은 기다리지 않고 기본값으로 처리
+            self.waits.for_selector("entry_title", "#_title", timeout=5)
+            inventory = take_section_inventory(self.driver, self.logger)
+            inventory.fill_missing(self.store_dict, keep_keys=apollo_fields.keys())
+            if inventory.missing():
+                self.logger.info(f"ℹ️ 페이지에 없는 섹션(대기 생략): {inventory.missing()}")
+
             # 3. 이름, 카테고리, 새로오픈 여부
-            try:
-                store_name_xpath = """//*[@id="_title"]/div/span"""
-                title_element = self.wait_medium.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, store_name_xpath)))
+            if not {"name", "category", "new_store"} <= apollo_fields.keys():
+                try:
+                    store_name_xpath = """//*[@id="_title"]/div/span"""
+                    title_element = self.wait_medium.until(EC.presence_of_all_elements_located(
+                        (By.XPATH, store_name_xpath)))
 
-                self.store_dict['name'] = title_element[0].text
-                self.store_dict['category'] = title_element[1].text
+                    self.store_dict['name'] = title_element[0].text
+                    self.store_dict['category'] = title_element[1].text
                 
-                # <새로오픈> 여부 확인
-                if len(title_element) > 2:
-                    third_span = title_element[2]
-                    self.logger.info(f"span[3] 텍스트: {third_span.text}, 클래스: {third_span.get_attribute('class')}")
-                    if third_span.text.strip() == "새로오픈" and "PI7f0" in third_span.get_attribute("class"):
-                        self.store_dict['new_store'] = True
-                        self.logger.info(f"새로오픈 매장 확인: {self.store_dict['name']}")
+                    # <새로오픈> 여부 확인
+                    if len(title_element) > 2:
+                        third_span = title_element[2]
+                        self.logger.info(f"span[3] 텍스트: {third_span.text}, 클래스: {third_span.get_attribute('class')}")
+                        if third_span.text.strip() == "새로오픈" and "PI7f0" in third_span.get_attribute("class"):
+                            self.store_dict['new_store'] = True
+                            self.logger.info(f"새로오픈 매장 확인: {self.store_dict['name']}")
+                        else:
+                            self.store_dict['new_store'] = False
                     else:
                         self.store_dict['new_store'] = False
-                else:
-                    self.store_dict['new_store'] = False
             
-            except TimeoutException as e:
-                self.logger.warning("❌ 매장 이름, 카테고리, 새로오픈 여부 확인 중 TimeoutException 발생")
-                self.logger.warning(e)
-                return False
-            except Exception as e:
-                self.logger.warning("❌ 매장 이름, 카테고리, 새로오픈 여부 확인 중 에러 발생")
-                self.logger.warning(e)
-                return False
+                except TimeoutException as e:
+                    self.logger.warning("❌ 매장 이름, 카테고리, 새로오픈 여부 확인 중 TimeoutException 발생")
+                    self.logger.warning(e)
+                    return False
+                except Exception as e:
+                    self.logger.warning("❌ 매장 이름, 카테고리, 새로오픈 여부 확인 중 에러 발생")
+                    self.logger.warning(e)
+                    return False
 
             # <인스타그램 계정 추출 및 저장> -> 여기서 확인 후에 추후에 자세한 정보 탭에서 팔로워 수, 포스트 수 확인
-            try:
-                elem = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'instagram.com')]"))
-                )
-                instagram_url = elem.get_attribute('href')
-                result = get_instagram_link(instagram_url)
-
-                # 인스타그램 계정 url이 올바르지 않은 경우
-                if result == None:
+            if "instagram_link" not in apollo_fields and "instagram" in self.sections and inventory.has("instagram"):
+                try:
+                    elem = WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'instagram.com')]"))
+                    )
+                    instagram_url = elem.get_attribute('href')
+                    result = get_instagram_link(instagram_url)
+
+                    # 인스타그램 계정 url이 올바르지 않은 경우
+                    if result == None:
+                        self.store_dict['instagram_link'] = None
+                        self.store_dict['instagram_post'] = None
+                        self.store_dict['instagram_follower'] = None
+                    # 올바른 경우
+                    elif result != None:
+                        self.store_dict['instagram_link'] = result
+                    else:
+                        self.store_dict['instagram_link'] = None
+                        self.store_dict['instagram_post'] = None
+                        self.store_dict['instagram_follower'] = None
+        
+                # 매장이 네이버지도에 인스타그램 계정을 등록해두지 않은 경우
+                except (NoSuchElementException, TimeoutException) as e:
                     self.store_dict['instagram_link'] = None
                     self.store_dict['instagram_post'] = None
                     self.store_dict['instagram_follower'] = None
-                # 올바른 경우
-                elif result != None:
-                    self.store_dict['instagram_link'] = result
-                else:
+                except Exception as e:
+                    self.logger.warning("❌ 인스타그램 크롤링 실패")
+                    self.logger.warning(e)
                     self.store_dict['instagram_link'] = None
                     self.store_dict['instagram_post'] = None
                     self.store_dict['instagram_follower'] = None
-        
-            # 매장이 네이버지도에 인스타그램 계정을 등록해두지 않은 경우
-            except (NoSuchElementException, TimeoutException) as e:
-                self.store_dict['instagram_link'] = None
-                self.store_dict['instagram_post'] = None
-                self.store_dict['instagram_follower'] = None
-            except Exception as e:
-                self.logger.warning("❌ 인스타그램 크롤링 실패")
-                self.logger.warning(e)
-                self.store_dict['instagram_link'] = None
-                self.store_dict['instagram_post'] = None
-                self.store_dict['instagram_follower'] = None
 
             # <주소 저장>
-            try: 
-                address_xpath = "//strong[contains(.,'주소')]/following-sibling::div/a/span"
-                address_elem = WebDriverWait(self.driver, 10).until(
-                    EC.visibility_of_element_located((By.XPATH, address_xpath))
-                )
-                # 요소가 headless 모드에서도 화면에 보이도록 스크롤 이동
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", address_elem)
-                time.sleep(1)  # 추가 대기 (동적 렌더링 보완)
-
-                # 요소의 텍스트를 추출 (headless 모드에서 .text가 비어있을 수 있으므로 JS로도 추출)
-                address_text = address_elem.text.strip()
-                if not address_text:
-                    address_text = self.driver.execute_script("return arguments[0].textContent;", address_elem).strip()
-                if address_text:
-                    self.store_dict["address"] = address_text
-                else:
-                    self.store_dict["address"] = None
+            if "address" not in apollo_fields and inventory.has("address"):
+                try: 
+                    address_xpath = "//strong[contains(.,'주소')]/following-sibling::div/a/span"
+                    address_elem = WebDriverWait(self.driver, 10).until(
+                        EC.visibility_of_element_located((By.XPATH, address_xpath))
+                    )
+                    # 요소가 headless 모드에서도 화면에 보이도록 스크롤 이동
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", address_elem)
+                    self.waits.until("address_text", lambda: bool((address_elem.get_attribute("textContent") or "").strip()), timeout=2, baseline=1.0)
+
+                    # 요소의 텍스트를 추출 (headless 모드에서 .text가 비어있을 수 있으므로 JS로도 추출)
+                    address_text = address_elem.text.strip()
+                    if not address_text:
+                        address_text = self.driver.execute_script("return arguments[0].textContent;", address_elem).strip()
+                    if address_text:
+                        self.store_dict["address"] = address_text
+                    else:
+                        self.store_dict["address"] = None
 
-            except NoSuchElementException as e:
-                self.store_dict["address"] = None
+                except NoSuchElementException as e:
+                    self.store_dict["address"] = None
 
-            except Exception as e:
-                self.logger.warning(f"❌ 주소 또는 address 추출 실패: {e}")
-                self.logger.warning(e)
-                self.store_dict["address"] = None
+                except Exception as e:
+                    self.logger.warning(f"❌ 주소 또는 address 추출 실패: {e}")
+                    self.logger.warning(e)
+                    self.store_dict["address"] = None
 
 
             # <매장 전화번호>
-            try:
-                phone_xpath = "//strong[contains(.,'전화번호')]/following-sibling::div/span"
-                phone_elem = self.driver.find_element(By.XPATH, phone_xpath)
-                phone_text = phone_elem.text
-                if phone_text != "":
-                    self.store_dict["phone"] = phone_text
-            except NoSuchElementException:
-                self.store_dict["phone"] = None
-            except Exception as e:
-                self.logger.warning("❌ 매장 전화번호 크롤링 실패")
-                self.logger.warning(e)
-                self.store_dict["phone"] = None
+            if "phone" not in apollo_fields and inventory.has("phone"):
+                try:
+                    phone_xpath = "//strong[contains(.,'전화번호')]/following-sibling::div/span"
+                    phone_elem = self.driver.find_element(By.XPATH, phone_xpath)
+                    phone_text = phone_elem.text
+                    if phone_text != "":
+                        self.store_dict["phone"] = phone_text
+                except NoSuchElementException:
+                    self.store_dict["phone"] = None
+                except Exception as e:
+                    self.logger.warning("❌ 매장 전화번호 크롤링 실패")
+                    self.logger.warning(e)
+                    self.store_dict["phone"] = None
 
 
             # <서울 미쉐린 가이드 등재 여부> 확인 및 저장
-            try:
-                self.move_to_tab("홈")
-                time.sleep(2)
-                # "미쉐린 가이드 서울" 텍스트를 포함하는지 여부로 확인
-                michelin_xpath = """//div[a[contains(text(), '미쉐린 가이드 서울')]]"""
-                self.driver.find_element(By.XPATH, michelin_xpath)
-                self.store_dict['seoul_michelin'] = True
-            except NoSuchElementException:
-                self.store_dict['seoul_michelin'] = False
-            except Exception as e:
-                # self.logger.warning("서울 미쉐린 가이드 크롤링 실패")
-                # self.logger.warning(e)
-                self.store_dict['seoul_michelin'] = False
+            if "seoul_michelin" not in apollo_fields and inventory.has("michelin"):
+                try:
+                    self.move_to_tab("홈")
+                    self.waits.skip("michelin_home_tab", 2.0)
+                    # "미쉐린 가이드 서울" 텍스트를 포함하는지 여부로 확인
+                    michelin_xpath = """//div[a[contains(text(), '미쉐린 가이드 서울')]]"""
+                    self.driver.find_element(By.XPATH, michelin_xpath)
+                    self.store_dict['seoul_michelin'] = True
+                except NoSuchElementException:
+                    self.store_dict['seoul_michelin'] = False
+                except Exception as e:
+                    # self.logger.warning("서울 미쉐린 가이드 크롤링 실패")
+                    # self.logger.warning(e)
+                    self.store_dict['seoul_michelin'] = False
 
 
             # <지하철역 출구로부터 거리 추출 및 저장>
-            try:
-                # 'nZapA' 클래스를 가지면서 '출구'라는 텍스트를 포함하는 div를 특정
-                subway_div_xpath = "//div[contains(@class, 'nZapA') and contains(., '출구')]"
-                subway_div = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, subway_div_xpath))
-                )
+            if "distance_from_subway_origin" not in apollo_fields and inventory.has("subway"):
+                try:
+                    # 'nZapA' 클래스를 가지면서 '출구'라는 텍스트를 포함하는 div를 특정
+                    subway_div_xpath = "//div[contains(@class, 'nZapA') and contains(., '출구')]"
+                    if not self.waits.for_xpath("subway_distance", subway_div_xpath, timeout=10, section="subway"):
+                        raise TimeoutException("지하철역 거리(nZapA) 요소를 찾지 못했습니다.")
+                    subway_div = self.driver.find_element(By.XPATH, subway_div_xpath)
 
-                # div 요소의 전체 텍스트를 한 번에 가져옴
-                full_text = subway_div.text.strip().replace('\n', ' ')
+                    # div 요소의 전체 텍스트를 한 번에 가져옴
+                    full_text = subway_div.text.strip().replace('\n', ' ')
 
-                # 전체 텍스트를 distance_from_subway_origin에 저장
-                self.store_dict["distance_from_subway_origin"] = full_text
+                    # 전체 텍스트를 distance_from_subway_origin에 저장
+                    self.store_dict["distance_from_subway_origin"] = full_text
                 
-                # 전체 텍스트에서 숫자 그룹들을 추출
-                numbers = re.findall(r'\d+', full_text)
+                    # 전체 텍스트에서 숫자 그룹들을 추출
+                    numbers = re.findall(r'\d+', full_text)
                 
-                if numbers:
-                    # 마지막 숫자 그룹을 가져옴 (예: "230")
-                    last_number_str = numbers[-1]
+                    if numbers:
+                        # 마지막 숫자 그룹을 가져옴 (예: "230")
+                        last_number_str = numbers[-1]
                     
-                    # [핵심 수정] 숫자 외의 모든 문자를 제거하여 순수한 숫자만 남김
-                    distance_value = int(re.sub(r'[^0-9]', '', last_number_str))
+                        # [핵심 수정] 숫자 외의 모든 문자를 제거하여 순수한 숫자만 남김
+                        distance_value = int(re.sub(r'[^0-9]', '', last_number_str))
                     
-                    self.store_dict["distance_from_subway"] = distance_value
-                    self.logger.info(f"✅ 지하철역 거리 정보 추출 성공: '{full_text}' -> {distance_value}m")
-                else:
-                    self.store_dict["distance_from_subway"] = None
-                    self.logger.warning("❌ 지하철역 거리 텍스트에서 숫자 부분을 찾지 못했습니다.")
+                        self.store_dict["distance_from_subway"] = distance_value
+                        self.logger.info(f"✅ 지하철역 거리 정보 추출 성공: '{full_text}' -> {distance_value}m")
+                    else:
+                        self.store_dict["distance_from_subway"] = None
+                        self.logger.warning("❌ 지하철역 거리 텍스트에서 숫자 부분을 찾지 못했습니다.")
 
-            except (NoSuchElementException, TimeoutException):
-                # 요소를 찾지 못하면 정보가 없는 것이므로 경고 대신 정보 로그를 남김
-                self.logger.info("ℹ️ 페이지에 지하철역 거리 정보가 없습니다.")
-                self.store_dict["distance_from_subway"] = None
-                self.store_dict["distance_from_subway_origin"] = None
-            except Exception as e:
-                self.logger.error(f"❌ 지하철역 거리 크롤링 중 예외 발생: {e}", exc_info=True)
-                self.store_dict["distance_from_subway"] = None
-                self.store_dict["distance_from_subway_origin"] = None
+                except (NoSuchElementException, TimeoutException):
+                    # 요소를 찾지 못하면 정보가 없는 것이므로 경고 대신 정보 로그를 남김
+                    self.logger.info("ℹ️ 페이지에 지하철역 거리 정보가 없습니다.")
+                    self.store_dict["distance_from_subway"] = None
+                    self.store_dict["distance_from_subway_origin"] = None
+                except Exception as e:
+                    self.logger.error(f"❌ 지하철역 거리 크롤링 중 예외 발생: {e}", exc_info=True)
+                    self.store_dict["distance_from_subway"] = None
+                    self.store_dict["distance_from_subway_origin"] = None
 
             # <주차 가능> 확인 및 저장
             try:
@@ -591,531 +939,65 @@ class StoreCrawler:
                 self.store_dict["parking_available"] = False
 
 
-            # 홈 탭에 있는 영역 크롤랑 
-            try:
-                # '홈' 탭으로 이동 후 스크롤로 모든 콘텐츠 로드
-                self.move_to_tab('홈')
-
-                # 페이지 끝까지 스크롤하여 모든 동적 콘텐츠 로드
-                last_height = self.driver.execute_script("return document.body.scrollHeight")
-                while True:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(0.5)
-                    new_height = self.driver.execute_script("return document.body.scrollHeight")
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
-                time.sleep(1) # 스크롤 후 DOM 안정화 대기
-                
-                # [모듈 0] 데이터랩 섹션이 없으면 모든 과정을 건너뜀
-                datalab_sections = self.driver.find_elements(By.CSS_SELECTOR, "div.place_section.I_y6k")
-                if not datalab_sections:
-                    self.logger.info("데이터랩 섹션이 없어 홈 탭 수집을 건너뜁니다.")
-                else:
-                    datalab_section = datalab_sections[0]
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", datalab_section)
-                    time.sleep(1)
-
-
-                # [모듈 1] 테마키워드 및 '더보기' 처리
-                try:
-                    # 키워드 요소 찾기
-                    theme_keyword_xpath = "//h3[contains(text(), '테마키워드')]"
-                    theme_keyword_elem = WebDriverWait(self.driver, 10).until(
-                        EC.visibility_of_element_located((By.XPATH, theme_keyword_xpath))
-                    )
-                    if theme_keyword_elem:
-
-                        self.logger.info(f"테마키워드 HTML: {theme_keyword_elem.get_attribute('outerHTML')}")
-
-                        # 테마키워드 수집
-                        try:
-                            theme_container = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.XPATH, ".//div[@class='WXrhH']"))
-                            )
-                            li_elements = theme_container.find_elements(By.XPATH, ".//ul[@class='v4tIa']/li")
-
-                            theme_by_category = {
-                                "분위기": [],
-                                "인기토픽": [],
-                                "찾는목적": []
-                            }
-                            for li in li_elements:
-                                # 메인 카테고리
-                                main_category = li.find_element(By.CLASS_NAME, "pNnVF").text.strip()
-                                # 세부 키워드 추출
-                                if main_category in theme_by_category:  # 조건 추가
-                                    sub_items = li.find_elements(By.XPATH, ".//span[@class='sJgQj']/span")
-                                    extracted = [s.text.replace(",", "").strip() for s in sub_items if s.text.strip()]
-                                    theme_by_category[main_category].extend(extracted)
-
-                            # 결과 저장
-                            # 개별 항목별로 store_dict에 저장
-                            self.store_dict["theme_mood"] = theme_by_category["분위기"]
-                            self.store_dict["theme_topic"] = theme_by_category["인기토픽"]
-                            self.store_dict["theme_purpose"] = theme_by_category["찾는목적"]
-
-                        except Exception as e:
-                            self.logger.warning("❌ 테마키워드 수집 실패")
-                            self.store_dict["theme_mood"] = []
-                            self.store_dict["theme_topic"] = []
-                            self.store_dict["theme_purpose"] = []
-                            self.logger.info(f"테마키워드 수집 실패: {e}")
-                            
-                        # '더보기' 버튼 클릭 (존재 여부 파악이 우선적으로 필요함. 없는 경우도 존재하기 때문)
-                        try:
-                            # 1. '더보기' 버튼이 존재하는지 먼저 빠르게 확인합니다.
-                            more_button_selector = ".//div[contains(@class, 'NSTUp')]//span[contains(text(), '더보기')]"
-                            more_buttons = datalab_section.find_elements(By.XPATH, more_button_selector)
-                            if more_buttons:
-                                self.logger.info("'더보기' 버튼이 존재합니다. 클릭을 시도합니다.")
-                                for attempt in range(5):  # 최대 2회 시도
-                                    try:
-                                        self.logger.info(f"더보기 버튼 클릭 시도 {attempt + 1}회차")
-                                        button_elem = WebDriverWait(datalab_section, 10).until(
-                                            EC.element_to_be_clickable((By.XPATH, ".//div[contains(@class, 'NSTUp')]//span[contains(text(), '더보기')]"))
-                                        )
-                                        # 🔹 스크롤 내리고 클릭 재시도
-                                        for _ in range(3):
-                                            self.driver.execute_script("arguments[0].scrollIntoView(true);", button_elem)
-                                            time.sleep(0.5)
-                                            self.driver.execute_script("arguments[0].click();", button_elem)
-                                            # 클릭 성공했으면 루프 탈출
-                                            if "expanded" in button_elem.get_attribute("class"):
-                                                break
-
-                                        # 🔹 클릭 후 확장된 UI 요소가 등장할 때까지 대기
-                                        WebDriverWait(self.driver, 10).until(
-                                            EC.presence_of_element_located((By.XPATH, "//div[@class='WXrhH']"))
-                                        )
-                                        self.logger.info("테마 키워드 확장 완료!")
-
-                                        break  #성공했으니 재시도 루프 탈출!
-
-                                    except (TimeoutException, NoSuchElementException) as e:
-                                        self.logger.warning(f"❌ 더보기 버튼 클릭 실패 (시도 {attempt + 1})")
-                                        self.logger.warning(e)
-                                        time.sleep(2)  # 실패 시 약간 대기 후 재시도
-                                    except Exception as e:
-                                        self.logger.warning("❌ Datalab 더보기 버튼 클릭 중 예기치 못한 오류")
-                                        self.logger.warning(e)
-                                        break  # 예상 못한 에러면 반복 안 하고 탈출
-                            else:
-                                # 3. 버튼이 존재하지 않으면, 로그만 남기고 넘어갑니다.
-                                self.logger.info("'더보기' 버튼이 없어 확장 과정을 건너뜁니다.")
-
-                        except Exception as e:
-                            self.logger.warning(f"❌ '더보기' 버튼 처리 중 오류 발생: {e}")
-                except Exception as e:
-                    self.logger.warning(f"❌ 테마키워드 모듈 처리 중 오류: {e}")
-                
-                # [모듈 2] 연령별/성별 데이터 처리
-                try:
-                    # 🔹 **연령별 데이터를 포함하는 div.gZ4G4 요소 찾기**
-                    gender_age_container_xpath = "//div[contains(@class, 'gZ4G4')]"
-                    if len(self.driver.find_elements(By.XPATH, gender_age_container_xpath)) == 0:
-                        self.logger.warning("연령별 비율 정보가 없음, 기본값 None 설정")
-                        self.store_dict["age-2030"] = None
-
-                    else:
-                        gender_age_container = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, gender_age_container_xpath))
-                    )
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", gender_age_container)
-                    time.sleep(2)
-
-                    # 연령별 데이터 추출: bar_chart_container의 ul.Pu5eW가 보일 때까지 대기
-                    ul_locator = (By.CSS_SELECTOR, "#bar_chart_container > ul.Pu5eW")
-                    WebDriverWait(self.driver, 10).until(
-                        EC.visibility_of_element_located(ul_locator)
-                    )
-
-                    # 여러 번 스크롤해서 모든 li 요소가 로드되도록 시도 (최대 3회 반복)
-                    for _ in range(2):
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(2)
-                    li_elements = self.driver.find_elements(
-                        By.CSS_SELECTOR, "#bar_chart_container > ul.Pu5eW > li.JkrLe"
-                    )
-
-                    if len(li_elements) < 6:
-                        self.logger.warning("연령별 li 요소가 6개 미만, 데이터 부족으로 간주.")
-                        self.store_dict["age-2030"] = 0
-                    else:
-                        scores = [0] * 6  # 10대,20대,30대,40대,50대,60대
-                        for idx, li in enumerate(li_elements):
-                            # 해당 li를 스크롤해서 보이게 하고 추가 대기
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", li)
-                            time.sleep(0.7)
-                            try:
-                                # span.NwNob에서 텍스트 추출 (text 없으면 textContent 재시도)
-                                value_span = li.find_element(By.CSS_SELECTOR, "span.NwNob")
-                                text = value_span.text.strip()
-                                if not text:
-                                    text = self.driver.execute_script("return arguments[0].textContent;", value_span).strip()
-                                scores[idx] = int(text) if text.isdigit() else 0
-                            except Exception as err:
-                                # self.logger.warning(f"[{idx}]번째 li에서 점수 추출 실패: {err}")
-                                scores[idx] = 0
-
-                        score_20 = scores[1]
-                        score_30 = scores[2]
-                        # 최종 점수 계산: 둘 다 1 또는 2면 2, 둘 중 하나만 1 또는 2면 1, 아니면 0
-                        if (score_20 in [1, 2]) and (score_30 in [1, 2]):
-                            final_score = 2
-                        elif (score_20 in [1, 2]) or (score_30 in [1, 2]):
-                            final_score = 1
-                        else:
-                            final_score = 0
-
-                        self.store_dict["age-2030"] = final_score
-                        self.logger.info(f"연령별 점수 계산 완료: 20대={score_20}, 30대={score_30}, 최종={final_score}")
-
-                except Exception as e:
-                    self.logger.warning("연령별 비율 계산 실패")
-                    self.logger.warning(e)
-                    self.store_dict["age-2030"] = None
-
-
-                # 성별 데이터 추출 수정 후
-                try:
-                
-                    self.driver.execute_script("return document.readyState") == "complete"
-
-                    # 직접 JS로 접근
-                    male_text = self.driver.execute_script("""
-                        const el = document.querySelector('#_datalab_chart_donut1_0')
-                                        ?.querySelector('g.c3-target-male text');
-                        if (el) {
-                            el.style.display = 'block';
-                            return el.textContent.trim();
-                        }
-                        return null;
-                    """)
-                    
-                    female_text = self.driver.execute_script("""
-                        const el = document.querySelector('#_datalab_chart_donut1_0')
-                                        ?.querySelector('g.c3-target-female text');
-                        if (el) {
-                            el.style.display = 'block';
-                            return el.textContent.trim();
-                        }
-                        return null;
-                    """)
-
-                    self.logger.info(f"male_text: {male_text}, female_text: {female_text}")
-
-
-                    # 🔹 텍스트 처리 및 결과 저장 (기존 코드 유지)
-                    try:
-                        male = round(float(male_text), 0) if male_text.replace(".", "").isdigit() else 0
-                        female = round(float(female_text), 0) if female_text.replace(".", "").isdigit() else 0
-                    except ValueError:
-                        self.logger.warning(f"⚠️ 숫자 변환 실패 - 남성: {male_text}, 여성: {female_text}")
-                        male, female = 0, 0
-
-                    self.store_dict["gender_male"] = male
-                    self.store_dict["gender_female"] = female
-                    self.store_dict["gender-balance"] = (male < 55)
-                    self.logger.info(f"최종 성별 비율 - 남성: {male}%, 여성: {female}%")
-                    self.logger.info(f"gender-balance: {'균형 잡힘 (True)' if male < 55 else '균형 안 잡힘 (False)'}")
-
-                
-                except TimeoutException:
-                    self.logger.warning("⛔ 성별 데이터 찾기 실패. 기본값 설정")
-                    self.store_dict["gender-balance"] = None
-                    self.store_dict["gender_male"] = None
-                    self.store_dict["gender_female"] = None
-                except Exception as e:
-                    self.logger.warning("성별 데이터 처리 중 오류 발생")
-                    self.logger.warning(e)
-                    self.store_dict["gender-balance"] = None
-                    self.store_dict["gender_male"] = None
-                    self.store_dict["gender_female"] = None  
-
-            except NoSuchElementException as e:
-                # 요소 탐색 실패 시 기본값 설정
-                self.store_dict["age-2030"] = None
-                self.store_dict["gender-balance"] = None
-                self.store_dict["gender_male"] = None
-                self.store_dict["gender_female"] = None
-                self.logger.warning("요소 탐색 실패.")
-            except Exception as e:
-                # 예기치 않은 오류 처리
-                self.store_dict["age-2030"] = None
-                self.store_dict["gender-balance"] = None
-                self.store_dict["gender_male"] = None
-                self.store_dict["gender_female"] = None
-                
+            # 홈 탭 데이터랩(테마키워드, 연령/성별) 수집 (크롤링 프로필에 포함된 섹션만 탭 이동/대기)
+            status = self.store_dict["section_status"]
+            if "datalab" in self.sections:
+                status["datalab"] = SECTION_OK if self.collect_datalab() else SECTION_FAILED
+            else:
+                status["datalab"] = SECTION_SKIPPED
 
             # 방문자 리뷰, 블로그 리뷰 개수 추출 및 저장
-            try:
-                # 방문자 리뷰
-                elem_visitor = self.driver.find_element(
-                    By.XPATH, value="//a[contains(text(), '방문자 리뷰')]")
-                visitor_review_count = int(re.findall(
-                    r'\d+', elem_visitor.text.replace(",", ""))[0])
-                self.store_dict['visitor_review_count'] = visitor_review_count
-            except NoSuchElementException:
-                self.store_dict['visitor_review_count'] = 0
-            except Exception as e:
-                self.logger.warning("방문자 리뷰 크롤링 실패")
-                self.logger.warning(e)
-
-            try:
-                # 블로그 리뷰
-                elem_blog = self.driver.find_element(
-                    By.XPATH, value="//a[contains(text(), '블로그 리뷰')]")
-                blog_review_count = int(re.findall(
-                    r'\d+', elem_blog.text.replace(",", ""))[0])
-                time.sleep(random.uniform(0.5, 2.5))
-                self.store_dict['blog_review_count'] = blog_review_count
-            except NoSuchElementException:
-                self.store_dict['blog_review_count'] = 0
-            except Exception as e:
-                self.logger.warning("❌ 블로그 리뷰 크롤링 실패")
-                self.logger.warning(e)
-
-            # 메뉴 탭으로 이동 및 메뉴 정보 크롤링
-            try:
-                self.move_to_tab("메뉴")
-                time.sleep(2)
-
-                # 신규 스마트주문 구조] 존재 여부 확인
-                if self.driver.find_elements(By.CSS_SELECTOR, "div.order_list_wrap.order_list_category.store_delivery"):
-                    self.logger.info("📦 스마트주문 메뉴 구조 감지")
-                    detail_blocks = self.driver.find_elements(By.CSS_SELECTOR, "div.info_detail")
-                    menu_items = []
-                    for block in detail_blocks:
-                        try:
-                            is_representative = bool(block.find_elements(By.CSS_SELECTOR, "span.menu_tag.default"))
-
-                            name_elem = block.find_element(By.CSS_SELECTOR, "div.tit")
-                            menu_name = name_elem.text.strip()
-
-                            intro_elem = block.find_element(By.CSS_SELECTOR, "span.detail_txt")
-                            menu_intro = intro_elem.text.strip().replace("\\/", "/")
-
-                            price_elem = block.find_element(By.CSS_SELECTOR, "div.price")
-                            menu_price = price_elem.text.strip()
-
-                            menu_items.append({
-                                "name": menu_name,
-                                "intro": menu_intro,
-                                "price": menu_price,
-                                "is_representative": is_representative
-                            })
-                        except Exception as e:
-                            self.logger.warning(f"⚠️ 스마트주문 메뉴 블록 파싱 실패: {e}")
-                            continue
-
-                else:
-                    self.logger.info("기본 메뉴 구조 사용")
-                    menu_ul = self.driver.find_element(By.CSS_SELECTOR, "div.place_section_content > ul")
-                    li_elements = menu_ul.find_elements(By.CSS_SELECTOR, "li.E2jtL")
-                    self.logger.info(f"메뉴 개수: {len(li_elements)}")
-
-                    menu_items = []
-                    for li in li_elements:
-                        try:
-                            is_representative = False
-                            try:
-                                rep_elem = li.find_element(By.CSS_SELECTOR, "span.QM_zp > span.place_blind")
-                                if rep_elem.text.strip() == "대표":
-                                    is_representative = True
-                            except NoSuchElementException:
-                                pass  # 대표 표시 없는 경우 무시
-
-                            # 메뉴명
-                            menu_name = li.find_element(By.CSS_SELECTOR, "span.lPzHi").text.strip()
-
-                            # 메뉴 설명 (kPogF 없을 수 있음)
-                            try:
-                                menu_intro = li.find_element(By.CSS_SELECTOR, "div.kPogF").text.strip()
-                            except NoSuchElementException:
-                                menu_intro = None
-
-                            # 가격
-                            try:
-                                menu_price = li.find_element(By.CSS_SELECTOR, "div.GXS1X").text.strip()
-                            except NoSuchElementException:
-                                menu_price = None
-
-                            # 저장
-                            menu_items.append({
-                                "name": menu_name,
-                                "intro": menu_intro,
-                                "price": menu_price,
-                                "is_representative": is_representative
-                            })
-                        except Exception as e:
-                            self.logger.warning(f"⚠️ 일반 메뉴 항목 파싱 실패: {e}")
-                            continue
-
-                self.store_dict["menu_list"] = menu_items
-                # self.logger.info(f"🍽️ 메뉴 정보: {menu_items}")
-
-            except Exception as e:
-                self.logger.warning("메뉴 탭 크롤링 실패")
-                self.logger.warning(e)
-                self.store_dict["menu_list"] = []
-
-        
-            # 리뷰 수집
-            try:
-                self.driver.switch_to.default_content()
-                self.move_to_entry_iframe()
-
-                tab_xpath = """//a[@role='tab']//span[text()='리뷰']"""
-                self.wait_short.until(EC.presence_of_element_located((By.XPATH, tab_xpath)))
-                self.logger.info("리뷰 탭 존재 확인됨")
-
-                # 리뷰 탭 클릭
-                self.move_to_tab('리뷰')
-
-                # 리뷰 콘텐츠 렌더링 대기
-                self.wait_medium.until(
-                    EC.presence_of_element_located((By.XPATH, '//li[contains(@class, "place_apply_pui")]'))
-                )
-                self.logger.info("리뷰 탭 콘텐츠 렌더링 완료됨")
-
-                # 최신순 정렬 시도
-                try:
-                    latest_sort_elem = self.wait_medium.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "div.mlywZ > span.v6aH1:nth-child(2) > a"))
-                    )
-                    self.driver.execute_script("arguments[0].click();", latest_sort_elem)
-                    self.logger.info("최신순 정렬 버튼 클릭 완료")
-                except Exception as e:
-                    self.logger.warning(f"❌ 최신순 클릭 실패: {e}")
-
-                # 리뷰 키워드 수집
-                data = {}
+            if not {"visitor_review_count", "blog_review_count"} <= apollo_fields.keys():
                 try:
-                    review_items = self.wait_medium.until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.MHaAm"))
-                    )
-                    for item in review_items:
-                        try:
-                            category = item.find_element(By.CSS_SELECTOR, "span.t3JSf").text.strip().replace('"', '')
-                            score_text = item.find_element(By.CSS_SELECTOR, "span.CUoLy").text.strip()
-                            score_text = score_text.replace("이 키워드를 선택한 인원", "").strip()
-                            score = int(score_text) if score_text.isdigit() else 0
-                            data[category] = score
-                        except Exception as e:
-                            self.logger.warning(f"❌ 키워드 파싱 실패: {e}")
-                            continue
+                    # 방문자 리뷰
+                    elem_visitor = self.driver.find_element(
+                        By.XPATH, value="//a[contains(text(), '방문자 리뷰')]")
+                    visitor_review_count = int(re.findall(
+                        r'\d+', elem_visitor.text.replace(",", ""))[0])
+                    self.store_dict['visitor_review_count'] = visitor_review_count
+                except NoSuchElementException:
+                    self.store_dict['visitor_review_count'] = 0
                 except Exception as e:
-                    self.logger.warning("❌ 리뷰 키워드 수집 실패")
+                    self.logger.warning("방문자 리뷰 크롤링 실패")
                     self.logger.warning(e)
-                self.store_dict['review_category'] = data
-                self.logger.info(f"리뷰 키워드: {data}")
 
-                # 방문자 리뷰 날짜/댓글 수집
-                review_info = []
                 try:
-                    review_elements = self.driver.find_elements(By.XPATH, '//li[contains(@class, "place_apply_pui")]')
-                    for li in review_elements:
-                        try:
-                            date_elem = li.find_element(By.XPATH, './/span[contains(text(), "방문일")]/following-sibling::span')
-                            date_text = date_elem.text.strip()
-                            parsed_date = parse_date(date_text)
-
-                            comment_elems = li.find_elements(By.XPATH, './/div[contains(@class, "pui__vn15t2")]//a')
-                            comment_texts = [a.text.strip() for a in comment_elems if a.text.strip()]
-                            comment_text = " ".join(comment_texts).replace("\n", " ").replace("더보기", "").strip()
-
-                            if parsed_date:
-                                date_str = parsed_date.strftime("%Y-%m-%d") if isinstance(parsed_date, (datetime, date)) else str(parsed_date)
-                                review_info.append({"date": date_str, "comment": comment_text})
-                        except Exception:
-                            continue
+                    # 블로그 리뷰
+                    elem_blog = self.driver.find_element(
+                        By.XPATH, value="//a[contains(text(), '블로그 리뷰')]")
+                    blog_review_count = int(re.findall(
+                        r'\d+', elem_blog.text.replace(",", ""))[0])
+                    self.waits.skip("blog_review_random", 1.5)
+                    self.store_dict['blog_review_count'] = blog_review_count
+                except NoSuchElementException:
+                    self.store_dict['blog_review_count'] = 0
                 except Exception as e:
-                    self.logger.warning("❌ 리뷰 댓글 수집 실패")
+                    self.logger.warning("❌ 블로그 리뷰 크롤링 실패")
                     self.logger.warning(e)
 
-                review_info = sorted(review_info, key=lambda x: x["date"], reverse=True)[:5]
-                self.store_dict["review_info"] = review_info
-                self.store_dict["crawling_date"] = datetime.now().strftime("%Y-%m-%d")
-                self.logger.info(f"수집된 리뷰(날짜+댓글): {review_info}")
-
-                # 운영 상태 평가
-                self.store_dict['running_well'] = 0
-                visit_review_dates = []
-                for item in review_info:
-                    try:
-                        d = item["date"]
-                        visit_review_dates.append(d if isinstance(d, date) else datetime.strptime(d, "%Y-%m-%d").date())
-                    except Exception:
-                        continue
-
-                if not visit_review_dates:
-                    self.logger.warning("리뷰 데이터 없음 → 운영 상태 평가: 0")
-                elif not any(is_within_three_months(d) for d in visit_review_dates):
-                    self.logger.warning("최근 3개월 내 방문 없음 → 운영 상태 평가: 0")
-                elif any(is_within_one_month(d) for d in visit_review_dates):
-                    self.store_dict["running_well"] = 3 if any(is_within_two_weeks(d) for d in visit_review_dates) else 2
-                else:
-                    self.store_dict["running_well"] = 1
-
-            except Exception as e:
-                self.logger.warning("❌ 리뷰 탭 전체 수집 실패")
-                self.logger.warning(e)
-                self.store_dict["review_category"] = ''
-                self.store_dict["review_info"] = []
-                self.store_dict["running_well"] = 0
-         
-            # 인스타그램 게시글 수, 팔로워 수 추출 및 저장
-            if self.store_dict.get('instagram_link'):
-                main_tab = self.driver.window_handles[0]
-                insta_tab = self.driver.window_handles[1]
-
-                try:
-                    self.logger.info("인스타그램 정보 수집 시작...")
-                    instagram_embed_url = self.store_dict['instagram_link'] + "/embed"
-
-                    # 2번째 탭(인스타그램)으로 이동
-                    self.driver.switch_to.window(insta_tab)
-                    self.driver.get(instagram_embed_url)
-
-                    name_xpath = """/html/body/div/div/div/div/div/div/div/div/div[1]/div[2]/div[1]/a/div"""
-                    self.wait_medium.until(EC.presence_of_element_located(
-                        (By.XPATH, name_xpath)))
-
-                    #  insta follower , post 위치 변경 반영
-                    follower_xpath = """/html/body/div/div/div/div/div/div/div/div/div[1]/div[2]/div[3]/span/div[1]/span/span"""
-                    post_xpath = """/html/body/div/div/div/div/div/div/div/div/div[1]/div[2]/div[3]/span/div[2]/span/span"""
-
-                    follower_elem = self.driver.find_element(By.XPATH, follower_xpath)
-                    post_elem = self.driver.find_element(By.XPATH, post_xpath)
-
-                    follower = convert_str_to_number(follower_elem.text)
-                    post = convert_str_to_number(post_elem.text)
+            # 메뉴 탭으로 이동 및 메뉴 정보 크롤링
+            if "menu_list" in apollo_fields:
+                status["menu"] = SECTION_OK
+            elif "menu" not in self.sections:
+                status["menu"] = SECTION_SKIPPED
+            elif not inventory.has_tab("메뉴"):
+                status["menu"] = SECTION_ABSENT
+            else:
+                status["menu"] = SECTION_OK if self.collect_menu_tab() else SECTION_FAILED
 
-                    self.logger.info(f'follower : {follower}, post : {post}')
-                    self.store_dict["instagram_follower"] = follower
-                    self.store_dict["instagram_post"] = post
+            # 리뷰 수집 (방문자 리뷰가 없는 매장은 리뷰 목록이 렌더링되지 않으므로 대기 없이 absent로 기록)
+            if "reviews" not in self.sections:
+                status["reviews"] = SECTION_SKIPPED
+            elif not inventory.has("visitor_review") or self.store_dict.get("visitor_review_count") == 0:
+                status["reviews"] = SECTION_ABSENT
+            else:
+                status["reviews"] = SECTION_OK if self.collect_review_tab() else SECTION_FAILED
 
-                except (NoSuchElementException, TimeoutException, WebDriverException):
-                    self.store_dict['instagram_link'] = None
-                    self.store_dict["instagram_follower"] = None
-                    self.store_dict["instagram_post"] = None
+            # 인스타그램 팔로워/게시글 수는 상세 수집 이후 별도 단계(Crawling/instagram_enricher.py)에서 계정 단위로 수집
 
-                except Exception as e:
-                    self.logger.warning("❌ 인스타그램 크롤링 실패")
-                    self.logger.warning(e)
-                    self.store_dict['instagram_link'] = None
-                    self.store_dict["instagram_follower"] = None
-                    self.store_dict["instagram_post"] = None
-                
-                finally:
-                    # [중요 사항] 어떠한 일이 있어도 반드시 원래 탭으로 복귀하게 하기
-                    self.logger.info("네이버 지도 탭으로 복귀합니다.")
-                    self.driver.switch_to.window(main_tab)
-                    # [중요 사항] 네이버 지도의 entry iframe으로 다시 전환
-                    self.move_to_entry_iframe()   
+            # 매장 단위 대기 리포트 (기존 고정 대기 대비 절약 시간)
+            self.waits.log_report(f"'{self.store_dict.get('name', 'N/A')}'")
 
-            
             # 5. 모든 정보 수집 후 데이터프레임에 추가
             self.insert_into_dataframe()
             self.logger.info(f"'{self.store_dict.get('name', 'N/A')}' 상세 정보 수집 완료.")
@@ -1134,14 +1016,17 @@ class StoreCrawler:
                 self.wait_short = WebDriverWait(self.driver, 2)
                 self.wait_medium = WebDriverWait(self.driver, 5)
                 self.wait = WebDriverWait(self.driver, 10)
+                self.waits = WaitStrategy(self.driver, self.logger)
                 self.logger.info("WebDriver 재초기화 완료")
             else:
                 self.wait_short = self.wait_medium = self.wait = None
+                self.waits = None
                 self.logger.error("❌ WebDriver 재초기화 실패")
         except Exception as e:
             self.logger.error(f"❌ WebDriver 재초기화 중 오류 발생: {e}")
             self.driver = None
             self.wait_short = self.wait_medium = self.wait = None
+            self.waits = None
 
     def insert_into_dataframe(self):
         if not self.store_dict or not self.store_dict.get('name'):
@@ -1150,75 +1035,29 @@ class StoreCrawler:
         
         try:
             ordered_dict = {col: self.store_dict.get(col) for col in self.columns}
-            new_data = pd.DataFrame([ordered_dict])
-            self.data = pd.concat([self.data, new_data], ignore_index=True)
-            self.logger.info(f"'{self.store_dict['name']}' 정보 추가 완료. 현재 수집 개수: {len(self.data)}")
+            self.records.append(ordered_dict)
+            if self.sink is not None:
+                self.sink.append(ordered_dict)
+            if self.budget is not None:
+                self.budget.add_store()
+            self.logger.info(f"'{self.store_dict['name']}' 정보 추가 완료. 현재 수집 개수: {len(self.records)}")
         except Exception as e:
-            self.logger.warning(f"❌ DataFrame에 데이터 추가 실패: {e}")
-    
-    def scroll_to_end(self):
-            try:
-                scroll_container_selector = "#_pcmap_list_scroll_container"
-                
-                # 💡 회원님의 아이디어를 적용한 핵심 변경 부분
-                # generic 'li' 대신, 실제 목록 아이템을 가리키는 구체적인 클래스로 변경합니다.
-                # 클래스 이름에 공백이 있으므로 '.'으로 연결하여 두 클래스를 모두 가진 요소를 찾습니다.
-                list_item_selector = "li.UEzoS.rTjJo" 
-
-                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, scroll_container_selector)))
-                self.logger.info(f"하이브리드 스크롤 시작 (타겟 요소: '{list_item_selector}')")
-
-                last_height = 0
-                last_item_count = 0
-                patience = 3
-                no_change_streak = 0
-
-                # --- 1단계: 빠른 스크롤 ---
-                self.logger.info("==> 1단계: 빠른 스크롤을 시작합니다.")
-                while no_change_streak < patience:
-                    self.driver.execute_script(f"document.querySelector('{scroll_container_selector}').scrollTo(0, document.querySelector('{scroll_container_selector}').scrollHeight);")
-                    time.sleep(2.0)
-
-                    current_height = self.driver.execute_script(f"return document.querySelector('{scroll_container_selector}').scrollHeight")
-                    # 변경된 선택자로 아이템 개수를 셉니다.
-                    current_item_count = len(self.driver.find_elements(By.CSS_SELECTOR, list_item_selector))
-
-                    if current_height == last_height and current_item_count == last_item_count:
-                        no_change_streak += 1
-                        self.logger.info(f"빠른 스크롤 중 변경 없음 ({no_change_streak}/{patience})")
-                    else:
-                        no_change_streak = 0
-                        self.logger.info(f"빠른 스크롤로 새 콘텐츠 감지됨 (높이: {current_height}, 아이템: {current_item_count})")
-                    
-                    last_height = current_height
-                    last_item_count = current_item_count
-                
-                self.logger.info("1단계: 빠른 스크롤 완료. 최종 확인을 위해 정밀 스캔을 1회 실행합니다.")
+            self.logger.warning(f"❌ 수집 결과 기록 실패: {e}")
 
-                # --- 2단계: 정밀 스캔 (마지막 1회) ---
-                self.logger.info("==> 2단계: 최종 정밀 스캔을 시작합니다.")
-                
-                scroll_metrics = self.driver.execute_script(f"""
-                    const sc = document.querySelector('{scroll_container_selector}');
-                    return {{ scrollHeight: sc.scrollHeight, clientHeight: sc.clientHeight }};
-                """)
-                
-                current_scroll_pos = 0
-                while current_scroll_pos < scroll_metrics['scrollHeight']:
-                    self.driver.execute_script(f"document.querySelector('{scroll_container_selector}').scrollTo(0, {current_scroll_pos});")
-                    time.sleep(0.3)
-                    current_scroll_pos += scroll_metrics['clientHeight']
-
-                time.sleep(2.0)
-                
-                # 변경된 선택자로 최종 아이템 개수를 셉니다.
-                final_item_count = len(self.driver.find_elements(By.CSS_SELECTOR, list_item_selector))
-                self.logger.info(f"스크롤 최종 완료. 총 {final_item_count}개의 아이템 로드를 확인했습니다.")
-
-            except TimeoutException:
-                self.logger.info("스크롤할 매장 목록이 로드되지 않았습니다.")
-            except Exception as e:
-                self.logger.warning(f"스크롤 중 예상치 못한 오류 발생: {e}", exc_info=True)
+    # 수집 결과를 DataFrame으로 반환 (호출 시점에 한 번만 생성)
+    @property
+    def data(self) -> pd.DataFrame:
+        return pd.DataFrame(self.records, columns=self.columns)
+    
+    # 검색 결과 목록을 끝까지 불러오고 목록 아이템(ID, 이름, 주소)을 반환합니다.
+    # MutationObserver로 아이템 추가가 멈추는 시점을 감지하므로 고정 대기 없이 WebDriver 왕복 1회로 끝납니다.
+    def scroll_to_end(self) -> Dict:
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, LIST_CONTAINER_SELECTOR)))
+        except TimeoutException:
+            self.logger.info("스크롤할 매장 목록이 로드되지 않았습니다.")
+            return {"items": [], "dom_count": 0}
+        return harvest_list(self.driver, self.logger)
 
     def move_to_search_iframe(self):
         try:
@@ -1245,7 +1084,8 @@ class StoreCrawler:
                 # XPath를 사용해 text가 정확히 일치하는 요소를 찾습니다.
                 next_page_button = self.driver.find_element(By.XPATH, f"//a[@class='mBN2s' and text()='{next_page_num}']")
                 next_page_button.click()
-                time.sleep(2)
+                self.waits.for_network_idle("next_page_network_idle", idle_ms=300, timeout=4, baseline=2.0)
+                self.waits.for_dom_quiet("next_page_render", quiet_ms=300, timeout=3)
                 self.logger.info(f"{next_page_num} 페이지로 이동했습니다.")
                 return True
             except NoSuchElementException:
@@ -1258,7 +1098,8 @@ class StoreCrawler:
                 # class가 'eUTV2'이고 비활성화되지 않은(aria-disabled='false') 버튼을 찾습니다.
                 next_arrow_button = self.driver.find_element(By.XPATH, "//a[@class='eUTV2' and @aria-disabled='false']")
                 next_arrow_button.click()
-                time.sleep(2)
+                self.waits.for_network_idle("next_page_network_idle", idle_ms=300, timeout=4, baseline=2.0)
+                self.waits.for_dom_quiet("next_page_render", quiet_ms=300, timeout=3)
                 self.logger.info("다음 화살표 버튼을 클릭해 페이지 블록을 넘겼습니다.")
                 return True
             except NoSuchElementException:
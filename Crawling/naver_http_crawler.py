@@ -0,0 +1,193 @@
+# naver_http_crawler.py
+# 브라우저 없이 HTTP 요청만으로 네이버 플레이스 상세 정보를 수집하는 백엔드입니다.
+# 상세 페이지(pcmap.place.naver.com)의 HTML에는 화면을 그리는 데 쓰이는 window.__APOLLO_STATE__가
+# 그대로 포함되어 있으므로, Firefox 렌더링 없이 이 상태를 파싱해 store_dict를 만듭니다.
+#
+# - 연결 재사용(keep-alive)을 위해 requests.Session 하나를 공유하고, 동시 요청 수는 max_concurrency로 제한합니다.
+# - 필수 필드(required_fields)를 채우지 못한 place ID는 실패 목록으로 돌려주며,
+#   호출 측(naver_crawler.py)에서 해당 ID만 브라우저(StoreCrawler)로 다시 수집합니다.
+# - base_url, session을 주입할 수 있어 로컬 HTTP 서버에 저장해 둔 페이지로도 동작을 확인할 수 있습니다.
+
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from Crawling.utils.apollo_state import parse_apollo_reviews, parse_apollo_state
+from Crawling.utils.crawl_profiles import CRAWL_PROFILES, DEFAULT_PROFILE, SECTION_FAILED, SECTION_OK, SECTION_SKIPPED
+
+DEFAULT_BASE_URL = "https://pcmap.place.naver.com"
+PLACE_HOME_PATH = "/restaurant/{place_id}/home"
+PLACE_REVIEW_PATH = "/restaurant/{place_id}/review/visitor"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": "https://map.naver.com/",
+}
+
+APOLLO_STATE_PATTERN = re.compile(r"window\.__APOLLO_STATE__\s*=\s*")
+
+# 이 필드를 HTTP로 채우지 못하면 브라우저로 다시 수집합니다.
+DEFAULT_REQUIRED_FIELDS = ("name", "category", "address")
+
+
+def extract_apollo_state_from_html(html: str) -> Optional[Dict[str, Any]]:
+    """HTML의 <script> 안에 포함된 window.__APOLLO_STATE__ = {...}; 객체를 dict로 파싱합니다."""
+    if not html:
+        return None
+    match = APOLLO_STATE_PATTERN.search(html)
+    if not match:
+        return None
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html, match.end())
+        return state if isinstance(state, dict) else None
+    except ValueError:
+        return None
+
+
+def empty_store_dict(place_id, search_word: str = "") -> Dict[str, Any]:
+    """StoreCrawler.init_dictionary와 같은 컬럼 구성의 빈 레코드를 만듭니다."""
+    return {
+        "search_word": search_word,
+        "naver_id": int(place_id),
+        "name": None,
+        "category": None,
+        "new_store": False,
+        "instagram_link": None,
+        "instagram_post": None,
+        "instagram_follower": None,
+        "visitor_review_count": None,
+        "blog_review_count": None,
+        "review_category": None,
+        "theme_mood": None,
+        "theme_topic": None,
+        "theme_purpose": None,
+        "distance_from_subway": None,
+        "distance_from_subway_origin": None,
+        "on_tv": None,
+        "parking_available": False,
+        "seoul_michelin": None,
+        "age-2030": None,
+        "gender-balance": None,
+        "gender_male": None,
+        "gender_female": None,
+        "running_well": None,
+        "address": None,
+        "phone": None,
+        "gps_latitude": None,
+        "gps_longitude": None,
+        "naver_url": None,
+        "review_info": [],
+        "menu_list": [],
+        "section_status": {},
+        "Crawl_Date": datetime.now().strftime("%Y-%m-%d"),
+    }
+
+
+class NaverHttpCrawler:
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, session: Optional[requests.Session] = None,
+                 max_concurrency: int = 4, timeout: float = 10.0,
+                 required_fields: Iterable[str] = DEFAULT_REQUIRED_FIELDS,
+                 logger: Optional[logging.Logger] = None, sections: Optional[Iterable[str]] = None, budget=None):
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.timeout = timeout
+        self.required_fields = tuple(required_fields)
+        self.logger = logger or logging.getLogger(__name__)
+        # 수집할 선택 섹션 (utils.crawl_profiles). 'reviews'가 없으면 리뷰 페이지를 요청하지 않음
+        self.sections = frozenset(sections) if sections is not None else CRAWL_PROFILES[DEFAULT_PROFILE]
+        self.budget = budget  # utils.budget.CrawlBudget (선택). 소진되면 남은 ID는 요청하지 않음
+
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+        if self._owns_session:
+            # 동시 요청 수만큼 연결을 유지해 매 요청마다 TCP/TLS 연결을 새로 맺지 않도록 함
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency, max_retries=1)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.session.headers.update(DEFAULT_HEADERS)
+
+    def fetch_state(self, path: str) -> Optional[Dict[str, Any]]:
+        """페이지를 요청해 Apollo 상태를 반환합니다. 요청 실패나 상태가 없으면 None."""
+        url = f"{self.base_url}{path}"
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.warning(f"❌ HTTP 요청 실패: {url} ({e})")
+            return None
+        return extract_apollo_state_from_html(response.text)
+
+    def fetch_place(self, place_id, search_word: str = "") -> Optional[Dict[str, Any]]:
+        """
+        place ID 하나의 상세 정보를 HTTP로 수집합니다.
+        필수 필드를 채우지 못하면 None을 반환합니다. (브라우저 재수집 대상)
+        """
+        home_state = self.fetch_state(PLACE_HOME_PATH.format(place_id=place_id))
+        fields = parse_apollo_state(home_state, place_id)
+        missing = [f for f in self.required_fields if not fields.get(f)]
+        if missing:
+            self.logger.info(f"HTTP 파싱 결과 필수 필드 누락 {missing}: {place_id} → 브라우저 수집 대상")
+            return None
+
+        store_dict = empty_store_dict(place_id, search_word)
+        store_dict.update(fields)
+        store_dict["naver_url"] = f"{self.base_url}{PLACE_HOME_PATH.format(place_id=place_id)}"
+
+        # 데이터랩은 HTTP로 수집하지 않으며, 메뉴는 홈 페이지 상태에 있을 때만 채워짐
+        status = store_dict["section_status"]
+        status["datalab"] = SECTION_SKIPPED
+        status["menu"] = SECTION_OK if "menu_list" in fields else SECTION_SKIPPED
+
+        # 리뷰 키워드/최근 방문 리뷰는 리뷰 페이지 상태에 있으므로 한 번 더 요청 (실패해도 기본 정보는 유지)
+        if "reviews" in self.sections:
+            review_fields = parse_apollo_reviews(self.fetch_state(PLACE_REVIEW_PATH.format(place_id=place_id)))
+            store_dict.update(review_fields)
+            status["reviews"] = SECTION_OK if "review_info" in review_fields else SECTION_FAILED
+        else:
+            status["reviews"] = SECTION_SKIPPED
+        store_dict["crawling_date"] = datetime.now().strftime("%Y-%m-%d")
+        return store_dict
+
+    def crawl_place_ids(self, place_ids: Iterable, search_word: str = "") -> Tuple[List[Dict[str, Any]], List]:
+        """
+        place ID 목록을 max_concurrency만큼 동시에 수집합니다.
+        반환: (수집된 레코드 목록, HTTP로 수집하지 못한 place ID 목록)
+        예산(budget)이 소진된 뒤의 ID는 요청하지 않으며, 브라우저 재수집 대상에도 넣지 않습니다.
+        """
+        place_ids = list(place_ids)
+        records, failed_ids = [], []
+        skipped = object()
+
+        def fetch(place_id):
+            if self.budget is not None and self.budget.exhausted():
+                return place_id, skipped
+            try:
+                return place_id, self.fetch_place(place_id, search_word)
+            except Exception as e:
+                self.logger.warning(f"❌ HTTP 상세 수집 중 오류: {place_id} ({e})")
+                return place_id, None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for place_id, record in executor.map(fetch, place_ids):
+                if record is skipped:
+                    continue
+                if record is None:
+                    failed_ids.append(place_id)
+                else:
+                    records.append(record)
+                    if self.budget is not None:
+                        self.budget.add_store()
+
+        self.logger.info(f"HTTP 상세 수집 완료: {len(place_ids)}건 중 {len(records)}건 성공, {len(failed_ids)}건 브라우저 재수집 필요")
+        return records, failed_ids
+
+    def close(self):
+        if self._owns_session:
+            self.session.close()
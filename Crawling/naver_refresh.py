@@ -0,0 +1,289 @@
+# naver_refresh.py
+# 이미 마스터 데이터에 있는 매장의 '자주 바뀌는 필드'만 다시 수집해 마스터 레코드를 갱신하는 경량 갱신 모드입니다.
+# 메뉴/주소/카테고리는 거의 바뀌지 않지만, 리뷰 수, 최근 리뷰(review_info), running_well, 인스타그램 지표는 자주 바뀝니다.
+# 필드 그룹별 갱신 주기(TTL, 일)를 두고, 마지막 갱신 후 TTL이 지난 그룹만 해당 탭으로 바로 이동해 수집합니다.
+# (get_store_details 전체를 다시 실행하지 않으므로 매장당 비용이 훨씬 적습니다)
+#
+# 필드 그룹
+#  - review_counts : visitor_review_count, blog_review_count (상세 페이지 Apollo 상태, 탭 이동 없음)
+#  - reviews       : review_category, review_info, running_well (리뷰 탭)
+#  - instagram     : instagram_post, instagram_follower (instagram_link가 있는 매장만, instagram_enricher의 계정 캐시 사용)
+# 그룹별 마지막 갱신일은 레코드의 refresh_dates({그룹: 'YYYY-MM-DD'})에 기록되며, 기록이 없으면 Crawl_Date를 기준으로 합니다.
+
+import ast
+import json
+import queue
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+import yaml
+
+from Crawling.instagram_enricher import fetch_instagram_stats, instagram_handle, load_instagram_cache
+from Crawling.naver_crawler_detail import StoreCrawler
+from Crawling.naver_http_crawler import PLACE_HOME_PATH, PLACE_REVIEW_PATH, NaverHttpCrawler
+from Crawling.utils.apollo_state import parse_apollo_reviews, parse_apollo_state
+from Crawling.utils.crawl_profiles import SECTION_OK, parse_section_status
+from Crawling.utils.master_loader import load_master_data, save_master_data, save_results_file
+
+# 갱신 그룹 → 갱신할 필드
+REFRESH_GROUPS: Dict[str, List[str]] = {
+    "review_counts": ["visitor_review_count", "blog_review_count"],
+    "reviews": ["review_category", "review_info", "running_well"],
+    "instagram": ["instagram_post", "instagram_follower"],
+}
+
+# 그룹별 기본 갱신 주기(일). config.yaml의 naver_refresh.ttl_days로 덮어쓸 수 있습니다.
+DEFAULT_TTL_DAYS: Dict[str, int] = {"review_counts": 7, "reviews": 7, "instagram": 14}
+
+# HTTP(브라우저 없이)로 갱신할 수 있는 그룹
+HTTP_GROUPS = ("review_counts", "reviews")
+
+
+def _parse_refresh_dates(value) -> Dict[str, str]:
+    """레코드의 refresh_dates 값(딕셔너리 또는 문자열)을 딕셔너리로 변환합니다."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value:
+        for loader in (json.loads, ast.literal_eval):
+            try:
+                parsed = loader(value)
+                if isinstance(parsed, dict):
+                    return parsed
+            except (ValueError, SyntaxError):
+                continue
+    return {}
+
+
+def _to_date(value) -> Optional[date]:
+    """'YYYY-MM-DD' 문자열, 날짜 객체, (JSON 저장 시 변환된) epoch 밀리초를 날짜로 변환합니다."""
+    if isinstance(value, bool) or not isinstance(value, (str, date, int, float)):
+        return None
+    if isinstance(value, (int, float)):
+        parsed = pd.to_datetime(value, unit='ms', errors='coerce')
+    else:
+        parsed = pd.to_datetime(value, errors='coerce')
+    return None if pd.isna(parsed) else parsed.date()
+
+
+def _instagram_link(record: Dict) -> Optional[str]:
+    link = record.get("instagram_link")
+    return link if isinstance(link, str) and link.strip() else None  # 마스터에서 읽으면 빈 값이 NaN일 수 있음
+
+
+def stale_groups(record: Dict, ttl_days: Dict[str, int], today: date) -> List[str]:
+    """레코드에서 마지막 갱신 후 TTL이 지난 그룹 목록을 반환합니다."""
+    dates = _parse_refresh_dates(record.get("refresh_dates"))
+    fallback = _to_date(record.get("Crawl_Date")) or _to_date(record.get("crawling_date"))
+
+    groups = []
+    for group, ttl in ttl_days.items():
+        if group not in REFRESH_GROUPS:
+            continue
+        if group == "instagram" and not _instagram_link(record):
+            continue
+        last = _to_date(dates.get(group)) or fallback
+        if last is None or (today - last).days >= int(ttl):
+            groups.append(group)
+    return groups
+
+
+def plan_refresh(master_df: pd.DataFrame, ttl_days: Dict[str, int], naver_ids: Optional[Iterable[int]] = None,
+                 today: Optional[date] = None) -> Dict[int, List[str]]:
+    """
+    갱신 대상 매장과 그룹을 정합니다. naver_ids를 주면 해당 매장만 대상으로 합니다.
+    반환값: {행 위치: [갱신할 그룹, ...]}
+    """
+    today = today or date.today()
+    targets = {int(i) for i in naver_ids} if naver_ids is not None else None
+    ids = pd.to_numeric(master_df['naver_id'], errors='coerce')
+
+    plan: Dict[int, List[str]] = {}
+    for pos, record in enumerate(master_df.to_dict('records')):
+        if pd.isna(ids.iloc[pos]) or (targets is not None and int(ids.iloc[pos]) not in targets):
+            continue
+        groups = stale_groups(record, ttl_days, today)
+        if groups:
+            plan[pos] = groups
+    return plan
+
+
+def _refresh_over_http(http_crawler: NaverHttpCrawler, place_id: int, groups: List[str]) -> Dict[str, Dict]:
+    """리뷰 수/리뷰 그룹을 HTTP로 갱신합니다. 파싱에 실패한 그룹은 결과에 포함하지 않습니다."""
+    refreshed: Dict[str, Dict] = {}
+    if "review_counts" in groups:
+        fields = parse_apollo_state(http_crawler.fetch_state(PLACE_HOME_PATH.format(place_id=place_id)), place_id)
+        if all(k in fields for k in REFRESH_GROUPS["review_counts"]):
+            refreshed["review_counts"] = {k: fields[k] for k in REFRESH_GROUPS["review_counts"]}
+    if "reviews" in groups:
+        fields = parse_apollo_reviews(http_crawler.fetch_state(PLACE_REVIEW_PATH.format(place_id=place_id)))
+        if "review_info" in fields:
+            refreshed["reviews"] = {
+                "review_category": fields.get("review_category", {}),
+                "review_info": fields["review_info"],
+                "running_well": fields["running_well"],
+            }
+    return refreshed
+
+
+def _refresh_in_browser(jobs: List[Dict], headless_mode: bool, num_workers: int) -> Dict[int, Dict[str, Dict]]:
+    """워커(각자 드라이버 보유)들이 공유 큐에서 매장을 꺼내 refresh_store로 갱신합니다. (리뷰 수/리뷰 그룹)"""
+    job_queue = queue.Queue()
+    for job in jobs:
+        job_queue.put(job)
+    results: Dict[int, Dict[str, Dict]] = {}
+
+    def worker(worker_id: int):
+        crawler = StoreCrawler(headless=headless_mode, thread_id=worker_id)
+        if crawler.driver is None:
+            print(f"[갱신 워커 {worker_id}] WebDriver 초기화 실패. 이 워커는 작업에 참여하지 않습니다.")
+            return
+        try:
+            while True:
+                try:
+                    job = job_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    refreshed = crawler.refresh_store(job["naver_id"], job["groups"])
+                    if refreshed:
+                        results[job["naver_id"]] = refreshed
+                except Exception as e:
+                    print(f"[갱신 워커 {worker_id}] 매장(ID: {job['naver_id']}) 갱신 중 오류: {e}")
+        finally:
+            crawler.quit()
+
+    worker_count = max(1, min(num_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        for future in [executor.submit(worker, i + 1) for i in range(worker_count)]:
+            future.result()
+    return results
+
+
+def apply_refresh(record: Dict, refreshed: Dict[str, Dict], today_str: str) -> Dict:
+    """갱신된 그룹의 필드만 레코드에 덮어쓰고, 그룹별 갱신일을 기록합니다."""
+    updated = dict(record)
+    dates = dict(_parse_refresh_dates(record.get("refresh_dates")))
+    for group, fields in refreshed.items():
+        updated.update(fields)
+        dates[group] = today_str
+    updated["refresh_dates"] = dates
+    # 리뷰 탭을 다시 수집했으면 이전 실패 상태도 해소 (section_retry 대상에서 제외)
+    if "reviews" in refreshed:
+        status = dict(parse_section_status(record.get("section_status")))
+        status["reviews"] = SECTION_OK
+        updated["section_status"] = status
+    return updated
+
+
+def run_naver_refresh(config: Dict, storage_mode: Optional[str] = None, naver_ids: Optional[Iterable[int]] = None,
+                      ttl_days: Optional[Dict[str, int]] = None, headless_mode: Optional[bool] = None) -> Dict:
+    """
+    마스터 데이터에서 갱신 주기가 지난 필드 그룹만 다시 수집하고 마스터에 반영합니다.
+    갱신된 레코드는 개별 결과 파일로도 저장되어, 이후 통합 배치 작업에서 덮어써지지 않습니다.
+    반환값: 작업 요약 딕셔너리
+    """
+    storage_mode = storage_mode or config.get('storage_mode', 'local')
+    refresh_config = config.get('naver_refresh') or {}
+    ttl = dict(DEFAULT_TTL_DAYS)
+    ttl.update(refresh_config.get('ttl_days') or {})
+    ttl.update(ttl_days or {})
+    headless_mode = config.get('headless_mode', True) if headless_mode is None else headless_mode
+    print(f"네이버 경량 갱신 작업을 시작합니다. (스토리지 모드: {storage_mode.upper()}, 갱신 주기: {ttl})")
+
+    master_df = load_master_data(storage_mode, config)
+    if master_df.empty or 'naver_id' not in master_df.columns:
+        print("갱신할 마스터 데이터가 없습니다.")
+        return {"total": 0, "planned": 0, "refreshed": 0}
+
+    master_df = master_df.reset_index(drop=True)
+    plan = plan_refresh(master_df, ttl, naver_ids)
+    group_counts = {g: sum(1 for groups in plan.values() if g in groups) for g in REFRESH_GROUPS}
+    print(f"총 {len(master_df)}건 중 {len(plan)}건이 갱신 대상입니다. (그룹별: {group_counts})")
+    if not plan:
+        return {"total": len(master_df), "planned": 0, "refreshed": 0}
+
+    records = master_df.to_dict('records')
+    jobs = [{
+        "pos": pos,
+        "naver_id": int(records[pos]['naver_id']),
+        "groups": groups,
+        "instagram_link": _instagram_link(records[pos]),
+    } for pos, groups in plan.items()]
+    refreshed_by_id: Dict[int, Dict[str, Dict]] = {}
+
+    # HTTP 백엔드: 리뷰 수/리뷰 그룹은 브라우저 없이 먼저 갱신하고, 남은 그룹(인스타그램, HTTP 실패분)만 브라우저로 수집
+    if config.get('naver_detail_backend', 'browser') == 'http':
+        http_crawler = NaverHttpCrawler(max_concurrency=config.get('naver_http_concurrency', 4))
+        try:
+            http_jobs = [job for job in jobs if any(g in HTTP_GROUPS for g in job["groups"])]
+            with ThreadPoolExecutor(max_workers=http_crawler.max_concurrency) as executor:
+                for job, refreshed in zip(http_jobs, executor.map(
+                        lambda j: _refresh_over_http(http_crawler, j["naver_id"], j["groups"]), http_jobs)):
+                    if refreshed:
+                        refreshed_by_id[job["naver_id"]] = refreshed
+        finally:
+            http_crawler.close()
+        print(f"HTTP 갱신: {len(refreshed_by_id)}건 완료.")
+
+    # 인스타그램 그룹: 계정 단위 캐시와 동시성 제한이 있는 instagram_enricher로 갱신 (네이버 페이지를 열지 않음)
+    insta_jobs = [job for job in jobs if "instagram" in job["groups"]]
+    if insta_jobs:
+        enrich_config = config.get('instagram_enrichment') or {}
+        stats = fetch_instagram_stats(
+            [instagram_handle(job["instagram_link"]) for job in insta_jobs],
+            load_instagram_cache(enrich_config, config.get('data_dir', 'data')),
+            max_concurrency=enrich_config.get('max_concurrency', 2), headless=headless_mode,
+        )
+        for job in insta_jobs:
+            found = stats.get(instagram_handle(job["instagram_link"]))
+            if found:
+                refreshed_by_id.setdefault(job["naver_id"], {})["instagram"] = {
+                    "instagram_follower": found["follower"], "instagram_post": found["post"]}
+
+    browser_jobs = []
+    for job in jobs:
+        remaining = [g for g in job["groups"] if g != "instagram" and g not in refreshed_by_id.get(job["naver_id"], {})]
+        if remaining:
+            browser_jobs.append(dict(job, groups=remaining))
+    if browser_jobs:
+        print(f"브라우저 갱신 대상 {len(browser_jobs)}건을 워커 {config.get('naver_detail_workers', 1)}개로 처리합니다.")
+        for naver_id, refreshed in _refresh_in_browser(browser_jobs, headless_mode, config.get('naver_detail_workers', 1)).items():
+            refreshed_by_id.setdefault(naver_id, {}).update(refreshed)
+
+    today_str = date.today().strftime('%Y-%m-%d')
+    patched_records = []
+    for job in jobs:
+        refreshed = refreshed_by_id.get(job["naver_id"])
+        if not refreshed:
+            continue
+        updated = apply_refresh(records[job["pos"]], refreshed, today_str)
+        records[job["pos"]] = updated
+        patched_records.append(updated)
+
+    failed = len(jobs) - len(patched_records)
+    print(f"갱신 완료: {len(patched_records)}건 반영, {failed}건 실패(기존 값 유지).")
+    if patched_records:
+        save_master_data(pd.DataFrame(records), storage_mode, config)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        patch_df = pd.DataFrame(patched_records)
+        file_name = f"refresh_{timestamp}_{uuid.uuid4().hex[:8]}_{len(patch_df)}.json"
+        saved_path = save_results_file(patch_df, storage_mode, config, file_name)
+        print(f"갱신 결과 파일 저장 완료: {saved_path}")
+
+    print("네이버 경량 갱신 작업을 성공적으로 마쳤습니다.")
+    return {"total": len(records), "planned": len(jobs), "refreshed": len(patched_records), "failed": failed, "groups": group_counts}
+
+
+if __name__ == '__main__':
+    try:
+        config = yaml.safe_load(open("config.yaml", 'r', encoding='utf-8'))
+        ids = [int(x) for x in sys.argv[1:]] or None  # 인자로 naver_id를 주면 해당 매장만 갱신
+        summary = run_naver_refresh(config, naver_ids=ids)
+        print(f"갱신 요약: {summary}")
+    except Exception as e:
+        print(f"네이버 경량 갱신 중 오류 발생: {e}", file=sys.stderr)
+        raise
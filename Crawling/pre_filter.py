@@ -0,0 +1,128 @@
+# pre_filter.py
+# 네이버 크롤링 직후, 비용이 큰 카카오 크롤링(매장별 브라우저)과 LLM 점수 산정 전에
+# 수집 대상이 아닌 매장을 걸러내는 사전 필터 단계입니다.
+#
+# 필터 기준 (config.yaml의 pre_filter 섹션으로 설정)
+#  - franchise        : 프랜차이즈/체인 매장 (check_franchise.py)
+#  - inactive         : 크롤러가 운영 부진으로 판단한 매장 (리뷰 섹션을 정상 수집했고 running_well == 0)
+#  - out_of_service_area : 서비스 지역 Polygon 밖에 있는 매장
+#  - excluded_category   : 제외 카테고리에 해당하는 매장
+# 걸러진 매장은 filter_reason 컬럼에 사유가 기록되어 별도로 반환됩니다.
+# 사용자가 매장을 직접 지정한 타겟 요청은 annotate_only=True로 걸러내지 않고 filter_reason만 기록합니다.
+
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import shapely
+from shapely import wkt
+from shapely.ops import unary_union
+
+from Crawling.utils.check_franchise import check_franchise_list
+from Crawling.utils.crawl_profiles import SECTION_OK, parse_section_status
+
+DEFAULT_PRE_FILTER_CONFIG = {
+    "enabled": True,
+    "exclude_franchise": True,
+    "exclude_inactive": True,
+    "service_area_file": "",
+    "exclude_categories": [],
+}
+
+_service_area_cache: Dict[Tuple[str, float], object] = {}
+
+
+def load_service_area(file_path: str):
+    """서비스 지역 Polygon CSV(polygon_str 컬럼)를 읽어 하나의 영역으로 합칩니다. 파일이 바뀌면 다시 읽습니다."""
+    if not file_path or not os.path.exists(file_path):
+        if file_path:
+            print(f"경고: 서비스 지역 파일 '{file_path}'를 찾을 수 없어 지역 필터를 건너뜁니다.")
+        return None
+
+    cache_key = (file_path, os.path.getmtime(file_path))
+    if cache_key not in _service_area_cache:
+        polygons = []
+        for polygon_str in pd.read_csv(file_path).get("polygon_str", pd.Series(dtype=str)).dropna():
+            try:
+                polygons.append(wkt.loads(polygon_str))
+            except Exception:
+                continue # 실패한 폴리곤은 건너뛰기
+        area = unary_union(polygons) if polygons else None
+        if area is not None:
+            shapely.prepare(area)
+        _service_area_cache.clear()
+        _service_area_cache[cache_key] = area
+    return _service_area_cache[cache_key]
+
+
+def run_pre_filter(df: pd.DataFrame, filter_config: Optional[Dict] = None, data_dir: str = 'data',
+                   annotate_only: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    사전 필터를 적용합니다.
+    annotate_only=True면 매장을 제외하지 않고, 전체 매장에 filter_reason(통과한 매장은 빈 문자열)만 기록해 반환합니다.
+
+    Returns:
+        (통과한 매장 DataFrame, 걸러진 매장 DataFrame(filter_reason 컬럼 포함))
+        annotate_only=True면 (filter_reason이 기록된 전체 매장 DataFrame, 빈 DataFrame)
+    """
+    cfg = {**DEFAULT_PRE_FILTER_CONFIG, **(filter_config or {})}
+    if df is None or df.empty or not cfg["enabled"]:
+        return df, pd.DataFrame()
+
+    df = df.reset_index(drop=True)
+    reasons = pd.Series([[] for _ in range(len(df))], dtype=object)
+
+    def mark(mask, reason):
+        for pos in np.nonzero(np.asarray(mask, dtype=bool))[0]:
+            reasons[pos].append(reason)
+
+    # 1. 프랜차이즈/체인 (크롤링 단계에서 태깅된 is_franchise가 있으면 그대로 사용)
+    if cfg["exclude_franchise"] and "name" in df.columns:
+        is_franchise = df["is_franchise"] if "is_franchise" in df.columns else pd.Series(check_franchise_list(df))
+        mark(is_franchise.fillna(False).astype(bool), "franchise")
+
+    # 2. 운영 부진 매장 (running_well == 0)
+    #    리뷰 섹션을 건너뛰었거나 수집에 실패한(또는 상태 기록이 없는) 매장은 리뷰가 없는 것인지 알 수 없으므로 판단하지 않음
+    if cfg["exclude_inactive"] and {"running_well", "section_status"} <= set(df.columns):
+        running_well = pd.to_numeric(df["running_well"], errors="coerce")
+        reviews_ok = df["section_status"].map(lambda v: parse_section_status(v).get("reviews") == SECTION_OK)
+        mark((running_well == 0) & reviews_ok, "inactive")
+
+    # 3. 서비스 지역 밖 (좌표가 없는 매장은 판단하지 않음)
+    service_area_file = cfg["service_area_file"]
+    if service_area_file and not os.path.isabs(service_area_file):
+        service_area_file = os.path.join(data_dir, service_area_file)
+    area = load_service_area(service_area_file)
+    if area is not None and {"gps_latitude", "gps_longitude"} <= set(df.columns):
+        lat = pd.to_numeric(df["gps_latitude"], errors="coerce").to_numpy(dtype=float)
+        lng = pd.to_numeric(df["gps_longitude"], errors="coerce").to_numpy(dtype=float)
+        has_gps = ~(np.isnan(lat) | np.isnan(lng))
+        inside = np.zeros(len(df), dtype=bool)
+        inside[has_gps] = shapely.contains_xy(area, lng[has_gps], lat[has_gps])
+        mark(has_gps & ~inside, "out_of_service_area")
+
+    # 4. 제외 카테고리 (카테고리 문자열에 키워드가 포함되면 제외)
+    exclude_categories = [c for c in (cfg["exclude_categories"] or []) if c]
+    if exclude_categories and "category" in df.columns:
+        category = df["category"].fillna("").astype(str)
+        mark(category.apply(lambda c: any(k in c for k in exclude_categories)), "excluded_category")
+
+    if annotate_only:
+        annotated_df = df.copy()
+        annotated_df["filter_reason"] = [", ".join(r) for r in reasons]
+        flagged = int(reasons.apply(bool).sum())
+        print(f"사전 필터(표시만) 완료: 전체 {len(df)}건 중 {flagged}건에 제외 사유 표시.")
+        return annotated_df, pd.DataFrame()
+
+    filtered_mask = reasons.apply(bool).to_numpy()
+    kept_df = df[~filtered_mask].reset_index(drop=True)
+    filtered_df = df[filtered_mask].reset_index(drop=True)
+    if not filtered_df.empty:
+        filtered_df["filter_reason"] = [", ".join(r) for r in reasons[filtered_mask]]
+
+    print(f"사전 필터 완료: 전체 {len(df)}건 중 {len(kept_df)}건 통과, {len(filtered_df)}건 제외.")
+    if not filtered_df.empty:
+        for reason, count in pd.Series([r for rs in reasons[filtered_mask] for r in rs]).value_counts().items():
+            print(f"  - {reason}: {count}건")
+    return kept_df, filtered_df
@@ -0,0 +1,198 @@
+# section_retry.py
+# 상세 수집 중 일부 섹션만 실패한 매장(예: "❌ 리뷰 탭 전체 수집 실패")을 섹션 단위로 다시 수집하는 재시도 큐입니다.
+# 기존에는 실패한 섹션이 빈 값으로 저장되어, 복구하려면 매장 전체를 다시 상세 수집해야 했습니다.
+#
+#  - 레코드의 section_status({섹션: ok/failed/skipped/absent})에서 failed인 섹션만 골라 재수집합니다.
+#  - 워커(각자 드라이버 보유)들이 공유 큐에서 매장을 꺼내 상세 페이지를 열고, 실패했던 탭만 다시 수집합니다.
+#  - 다시 실패한 섹션은 지수 백오프(backoff_seconds * 2^(시도-1), 최대 backoff_max_seconds) 후 max_attempts까지 재시도합니다.
+#  - 복구된 섹션의 필드만 마스터 레코드에 덮어쓰고 section_status를 ok로 바꿉니다.
+
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import count
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+import yaml
+
+from Crawling.naver_crawler_detail import StoreCrawler
+from Crawling.utils.crawl_profiles import SECTION_FAILED, SECTION_OK, STATUS_SECTIONS, parse_section_status
+from Crawling.utils.master_loader import load_master_data, save_master_data, save_results_file
+
+
+def failed_sections(record: Dict) -> List[str]:
+    """
+    레코드에서 수집에 실패한 섹션 목록을 반환합니다.
+    방문자 리뷰가 0건인 매장은 리뷰 목록 자체가 없으므로, 리뷰가 failed로 남아 있어도 재수집하지 않습니다.
+    """
+    status = parse_section_status(record.get("section_status"))
+    sections = [section for section in STATUS_SECTIONS if status.get(section) == SECTION_FAILED]
+    if "reviews" in sections and pd.to_numeric(record.get("visitor_review_count"), errors='coerce') == 0:
+        sections.remove("reviews")
+    return sections
+
+
+def plan_section_retry(master_df: pd.DataFrame, naver_ids: Optional[Iterable[int]] = None) -> Dict[int, List[str]]:
+    """
+    재수집 대상 매장과 섹션을 정합니다. naver_ids를 주면 해당 매장만 대상으로 합니다.
+    반환값: {행 위치: [재수집할 섹션, ...]}
+    """
+    if 'section_status' not in master_df.columns:
+        return {}
+    targets = {int(i) for i in naver_ids} if naver_ids is not None else None
+    ids = pd.to_numeric(master_df['naver_id'], errors='coerce')
+
+    plan: Dict[int, List[str]] = {}
+    for pos, record in enumerate(master_df.to_dict('records')):
+        if pd.isna(ids.iloc[pos]) or (targets is not None and int(ids.iloc[pos]) not in targets):
+            continue
+        sections = failed_sections(record)
+        if sections:
+            plan[pos] = sections
+    return plan
+
+
+def backoff_delay(attempt: int, backoff_seconds: float, backoff_max_seconds: float) -> float:
+    """attempt번째 시도가 실패한 뒤 기다릴 시간(초). 여러 매장이 동시에 재시도하지 않도록 ±20% 지터를 더합니다."""
+    delay = min(backoff_max_seconds, backoff_seconds * (2 ** (attempt - 1)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _retry_in_browser(jobs: List[Dict], headless_mode: bool, num_workers: int, max_attempts: int,
+                      backoff_seconds: float, backoff_max_seconds: float) -> Dict[int, Dict[str, Dict]]:
+    """
+    워커들이 (재시도 가능 시각 순) 우선순위 큐에서 매장을 꺼내 실패했던 섹션만 retry_sections로 다시 수집합니다.
+    다시 실패한 섹션은 백오프 후 큐에 다시 넣습니다. 반환값: {naver_id: {섹션: 필드}}
+    """
+    job_queue = queue.PriorityQueue()
+    seq = count()  # 같은 시각의 작업끼리 dict를 비교하지 않도록 순번을 둠
+    for job in jobs:
+        job_queue.put((0.0, next(seq), dict(job, attempt=0)))
+    results: Dict[int, Dict[str, Dict]] = {}
+    lock = threading.Lock()
+
+    def worker(worker_id: int):
+        crawler = StoreCrawler(headless=headless_mode, thread_id=worker_id)
+        if crawler.driver is None:
+            print(f"[재수집 워커 {worker_id}] WebDriver 초기화 실패. 이 워커는 작업에 참여하지 않습니다.")
+            return
+        try:
+            while True:
+                try:
+                    not_before, _, job = job_queue.get_nowait()
+                except queue.Empty:
+                    return
+                wait = not_before - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+
+                job["attempt"] += 1
+                try:
+                    recovered = crawler.retry_sections(job["naver_id"], job["sections"]) or {}
+                except Exception as e:
+                    print(f"[재수집 워커 {worker_id}] 매장(ID: {job['naver_id']}) 재수집 중 오류: {e}")
+                    recovered = {}
+                if recovered:
+                    with lock:
+                        results.setdefault(job["naver_id"], {}).update(recovered)
+
+                remaining = [s for s in job["sections"] if s not in recovered]
+                if remaining and job["attempt"] < max_attempts:
+                    delay = backoff_delay(job["attempt"], backoff_seconds, backoff_max_seconds)
+                    print(f"[재수집 워커 {worker_id}] 매장(ID: {job['naver_id']}) {remaining} 재실패 → {delay:.1f}초 후 재시도 ({job['attempt']}/{max_attempts})")
+                    job_queue.put((time.monotonic() + delay, next(seq), dict(job, sections=remaining)))
+        finally:
+            crawler.quit()
+
+    worker_count = max(1, min(num_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        for future in [executor.submit(worker, i + 1) for i in range(worker_count)]:
+            future.result()
+    return results
+
+
+def apply_section_retry(record: Dict, recovered: Dict[str, Dict]) -> Dict:
+    """복구된 섹션의 필드만 레코드에 덮어쓰고, 해당 섹션의 상태를 ok로 바꿉니다."""
+    updated = dict(record)
+    status = dict(parse_section_status(record.get("section_status")))
+    for section, fields in recovered.items():
+        updated.update(fields)
+        status[section] = SECTION_OK
+    updated["section_status"] = status
+    return updated
+
+
+def run_section_retry(config: Dict, storage_mode: Optional[str] = None, naver_ids: Optional[Iterable[int]] = None,
+                      headless_mode: Optional[bool] = None) -> Dict:
+    """
+    마스터 데이터에서 수집에 실패한 섹션만 다시 수집하고 마스터에 반영합니다.
+    복구된 레코드는 개별 결과 파일로도 저장되어, 이후 통합 배치 작업에서 덮어써지지 않습니다.
+    반환값: 작업 요약 딕셔너리
+    """
+    storage_mode = storage_mode or config.get('storage_mode', 'local')
+    retry_config = config.get('section_retry') or {}
+    max_attempts = max(1, int(retry_config.get('max_attempts', 3)))
+    headless_mode = config.get('headless_mode', True) if headless_mode is None else headless_mode
+    print(f"섹션 재수집 작업을 시작합니다. (스토리지 모드: {storage_mode.upper()}, 최대 시도: {max_attempts}회)")
+
+    master_df = load_master_data(storage_mode, config)
+    if master_df.empty or 'naver_id' not in master_df.columns:
+        print("재수집할 마스터 데이터가 없습니다.")
+        return {"total": 0, "planned": 0, "recovered": 0}
+
+    master_df = master_df.reset_index(drop=True)
+    plan = plan_section_retry(master_df, naver_ids)
+    section_counts = {s: sum(1 for sections in plan.values() if s in sections) for s in STATUS_SECTIONS}
+    print(f"총 {len(master_df)}건 중 {len(plan)}건에 실패한 섹션이 있습니다. (섹션별: {section_counts})")
+    if not plan:
+        return {"total": len(master_df), "planned": 0, "recovered": 0}
+
+    records = master_df.to_dict('records')
+    jobs = [{"pos": pos, "naver_id": int(records[pos]['naver_id']), "sections": sections} for pos, sections in plan.items()]
+    recovered_by_id = _retry_in_browser(
+        jobs, headless_mode, config.get('naver_detail_workers', 1), max_attempts,
+        float(retry_config.get('backoff_seconds', 5)), float(retry_config.get('backoff_max_seconds', 60)),
+    )
+
+    patched_records = []
+    for job in jobs:
+        recovered = recovered_by_id.get(job["naver_id"])
+        if not recovered:
+            continue
+        updated = apply_section_retry(records[job["pos"]], recovered)
+        records[job["pos"]] = updated
+        patched_records.append(updated)
+
+    recovered_sections = sum(len(r) for r in recovered_by_id.values())
+    planned_sections = sum(len(job["sections"]) for job in jobs)
+    print(f"섹션 재수집 완료: {planned_sections}개 섹션 중 {recovered_sections}개 복구 ({len(patched_records)}개 매장 반영).")
+    if patched_records:
+        save_master_data(pd.DataFrame(records), storage_mode, config)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        patch_df = pd.DataFrame(patched_records)
+        file_name = f"section_retry_{timestamp}_{uuid.uuid4().hex[:8]}_{len(patch_df)}.json"
+        saved_path = save_results_file(patch_df, storage_mode, config, file_name)
+        print(f"재수집 결과 파일 저장 완료: {saved_path}")
+
+    print("섹션 재수집 작업을 성공적으로 마쳤습니다.")
+    return {
+        "total": len(records), "planned": len(jobs), "recovered": len(patched_records),
+        "sections_planned": planned_sections, "sections_recovered": recovered_sections, "sections": section_counts,
+    }
+
+
+if __name__ == '__main__':
+    try:
+        config = yaml.safe_load(open("config.yaml", 'r', encoding='utf-8'))
+        ids = [int(x) for x in sys.argv[1:]] or None  # 인자로 naver_id를 주면 해당 매장만 재수집
+        summary = run_section_retry(config, naver_ids=ids)
+        print(f"재수집 요약: {summary}")
+    except Exception as e:
+        print(f"섹션 재수집 중 오류 발생: {e}", file=sys.stderr)
+        raise
@@ -0,0 +1,221 @@
+# 네이버 플레이스 상세 페이지(entryIframe)의 window.__APOLLO_STATE__에서
+# 매장 상세 정보를 한 번에 추출합니다.
+# 화면에 보이는 이름/카테고리/주소/전화번호/리뷰 수/메뉴/지하철 정보는 모두 이 캐시에서 렌더링되므로,
+# execute_script 한 번으로 상태 전체를 가져와 파이썬에서 store_dict 필드로 변환합니다.
+# 상태에 없는 필드는 결과에 포함하지 않으며, 크롤러는 해당 필드만 DOM에서 수집합니다.
+
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .get_instagram_link import get_instagram_link
+from .is_within_date import compute_running_well, parse_date
+
+# entryIframe 안에서 Apollo 캐시 전체를 가져오는 스크립트 (JSON 문자열로 받아 WebDriver 직렬화 비용을 줄임)
+FETCH_APOLLO_STATE_JS = """
+const state = window.__APOLLO_STATE__;
+if (!state || Object.keys(state).length === 0) return null;
+try { return JSON.stringify(state); } catch (e) { return null; }
+"""
+
+MICHELIN_SEOUL_TEXT = "미쉐린 가이드 서울"
+
+
+def load_apollo_state(raw) -> Optional[Dict[str, Any]]:
+    """FETCH_APOLLO_STATE_JS 결과(JSON 문자열 또는 dict)를 dict로 변환합니다."""
+    if isinstance(raw, dict):
+        return raw
+    if isinstance(raw, str) and raw:
+        try:
+            state = json.loads(raw)
+            return state if isinstance(state, dict) else None
+        except ValueError:
+            return None
+    return None
+
+
+def _deref(state: Dict[str, Any], value):
+    """{"__ref": "Menu:123_0"} 형태의 참조를 실제 객체로 바꿉니다."""
+    if isinstance(value, dict) and "__ref" in value:
+        return state.get(value["__ref"])
+    return value
+
+
+def _objects_of_type(state: Dict[str, Any], typename: str) -> List[Dict[str, Any]]:
+    return [v for v in state.values() if isinstance(v, dict) and v.get("__typename") == typename]
+
+
+def _find_base(state: Dict[str, Any], place_id=None) -> Optional[Dict[str, Any]]:
+    """매장 기본 정보 객체(PlaceDetailBase)를 찾습니다. place_id가 있으면 해당 매장을 우선합니다."""
+    if place_id is not None:
+        base = state.get(f"PlaceDetailBase:{place_id}")
+        if isinstance(base, dict):
+            return base
+    candidates = _objects_of_type(state, "PlaceDetailBase")
+    if place_id is not None:
+        for obj in candidates:
+            if str(obj.get("id")) == str(place_id):
+                return obj
+    return candidates[0] if candidates else None
+
+
+def _to_int(value) -> Optional[int]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(re.sub(r"[^0-9]", "", str(value)))
+    except ValueError:
+        return None
+
+
+def _parse_menus(state: Dict[str, Any], base: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """메뉴 객체를 크롤러의 menu_list 형식({name, intro, price, is_representative})으로 변환합니다."""
+    menus = [_deref(state, m) for m in (base.get("menus") or [])]
+    if not menus:
+        menus = _objects_of_type(state, "Menu")
+
+    menu_items = []
+    for menu in menus:
+        if not isinstance(menu, dict) or not menu.get("name"):
+            continue
+        price = menu.get("price")
+        menu_items.append({
+            "name": str(menu["name"]).strip(),
+            "intro": (menu.get("description") or None),
+            "price": f"{int(price):,}원" if isinstance(price, (int, float)) or (isinstance(price, str) and price.isdigit()) else price,
+            "is_representative": bool(menu.get("recommend")),
+        })
+    return menu_items
+
+
+def _parse_subway(state: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    """가장 가까운 지하철역 출구 정보를 DOM 텍스트와 같은 형식('OO역 N번 출구에서 230m')으로 만듭니다."""
+    stations = [_deref(state, s) for s in (base.get("subwayStations") or [])]
+    if not stations:
+        stations = _objects_of_type(state, "SubwayStationInfo")
+    stations = [s for s in stations if isinstance(s, dict) and s.get("name")]
+    if not stations:
+        return {}
+
+    station = stations[0]
+    distance = _to_int(station.get("walkingDistance") or station.get("distance"))
+    exit_no = station.get("nearestExit")
+    origin = f"{station['name']}"
+    if exit_no:
+        origin += f" {exit_no}번 출구"
+    if distance is not None:
+        origin += f"에서 {distance}m"
+    return {"distance_from_subway_origin": origin, "distance_from_subway": distance}
+
+
+def _parse_instagram(state: Dict[str, Any], base: Dict[str, Any]) -> Optional[str]:
+    homepages = _deref(state, base.get("homepages")) or {}
+    urls = []
+    if isinstance(homepages, dict):
+        for entry in [homepages.get("repr")] + list(homepages.get("etc") or []):
+            entry = _deref(state, entry)
+            if isinstance(entry, dict) and entry.get("url"):
+                urls.append(entry["url"])
+    for url in urls:
+        if "instagram.com" in url:
+            return get_instagram_link(url)
+    return None
+
+
+def parse_apollo_state(state: Optional[Dict[str, Any]], place_id=None) -> Dict[str, Any]:
+    """
+    Apollo 캐시에서 store_dict 필드를 추출합니다.
+    상태에서 확인된 필드만 반환하므로, 반환 dict에 없는 필드는 DOM에서 수집해야 합니다.
+    """
+    if not state:
+        return {}
+
+    fields: Dict[str, Any] = {}
+    base = _find_base(state, place_id)
+
+    # GPS 좌표: 기본 정보 객체가 없으면 coordinate를 가진 아무 객체에서 찾음 (기존 방식)
+    coord_sources = ([base] if base else []) + [v for v in state.values() if isinstance(v, dict)]
+    for obj in coord_sources:
+        coords = obj.get("coordinate")
+        if isinstance(coords, dict) and coords.get("x") and coords.get("y"):
+            fields["gps_longitude"] = float(coords["x"])
+            fields["gps_latitude"] = float(coords["y"])
+            break
+
+    if base is None:
+        return fields
+
+    if base.get("name"):
+        fields["name"] = base["name"]
+    if base.get("category"):
+        fields["category"] = base["category"]
+    if isinstance(base.get("newOpening"), bool):
+        fields["new_store"] = base["newOpening"]
+
+    address = base.get("roadAddress") or base.get("address")
+    if address:
+        fields["address"] = address
+    phone = base.get("phone") or base.get("virtualPhone")
+    if phone:
+        fields["phone"] = phone
+
+    instagram_link = _parse_instagram(state, base)
+    if instagram_link:
+        fields["instagram_link"] = instagram_link
+
+    visitor_total = _to_int(base.get("visitorReviewsTotal"))
+    if visitor_total is not None:
+        fields["visitor_review_count"] = visitor_total
+    for result in _objects_of_type(state, "FsasReviewsResult"):
+        blog_total = _to_int(result.get("total"))
+        if blog_total is not None:
+            fields["blog_review_count"] = blog_total
+            break
+
+    menu_items = _parse_menus(state, base)
+    if menu_items:
+        fields["menu_list"] = menu_items
+
+    fields.update(_parse_subway(state, base))
+
+    # 미쉐린 가이드 배지는 상태의 문자열로 렌더링되므로, 상태 전체에서 문구 포함 여부로 판단
+    fields["seoul_michelin"] = MICHELIN_SEOUL_TEXT in json.dumps(state, ensure_ascii=False)
+    return fields
+
+
+def parse_apollo_reviews(state: Optional[Dict[str, Any]], max_reviews: int = 5) -> Dict[str, Any]:
+    """
+    리뷰 페이지의 Apollo 캐시에서 review_category(키워드별 선택 수), review_info(최근 방문 리뷰),
+    running_well을 추출합니다. 방문자 리뷰 객체가 없으면 빈 dict를 반환합니다.
+    """
+    if not state:
+        return {}
+
+    fields: Dict[str, Any] = {}
+    for stats in _objects_of_type(state, "VisitorReviewStatsResult"):
+        analysis = _deref(state, stats.get("analysis")) or {}
+        voted = _deref(state, analysis.get("votedKeyword")) or {}
+        details = [_deref(state, d) for d in (voted.get("details") or [])]
+        keywords = {d["displayName"].replace('"', ''): _to_int(d.get("count")) or 0
+                    for d in details if isinstance(d, dict) and d.get("displayName")}
+        if keywords:
+            fields["review_category"] = keywords
+            break
+
+    reviews = _objects_of_type(state, "VisitorReview")
+    if not reviews:
+        return fields
+
+    review_info = []
+    for review in reviews:
+        parsed_date = parse_date(str(review.get("visited") or ""))
+        if parsed_date:
+            review_info.append({
+                "date": parsed_date.strftime("%Y-%m-%d"),
+                "comment": str(review.get("body") or "").replace("\n", " ").strip(),
+            })
+    review_info = sorted(review_info, key=lambda x: x["date"], reverse=True)[:max_reviews]
+    fields["review_info"] = review_info
+    fields["running_well"] = compute_running_well([datetime.strptime(r["date"], "%Y-%m-%d").date() for r in review_info])
+    return fields
@@ -0,0 +1,164 @@
+# 블루리본서베이 매장 목록을 한 번만 읽어 격자(grid) 공간 색인을 만들고,
+# 크롤링된 매장들을 배치 단위로 "좌표 근접 + 이름 유사도"로 매칭합니다.
+# 매칭 결과(blue_ribbon, blue_ribbon_type)는 점수 산정 단계에서 추가 점수 항목으로 사용됩니다.
+
+import glob
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz
+from rapidfuzz.process import cpdist
+
+from .check_franchise import remove_last_word_if_endswith_jum
+from .load_bluer import load_bluer
+
+EARTH_RADIUS_M = 6371000.0
+METERS_PER_DEG_LAT = 111320.0
+
+
+def normalize_store_name(name) -> str:
+    """지점명('OO점')과 공백을 제거하고 소문자로 변환한 비교용 이름을 반환합니다."""
+    if not isinstance(name, str):
+        return ""
+    return remove_last_word_if_endswith_jum(name.strip()).replace(" ", "").lower()
+
+
+class BlueRibbonIndex:
+    """
+    블루리본 매장 테이블(컬럼 단위 numpy 배열)과 격자 색인.
+    격자 한 칸의 크기는 매칭 반경과 같아서, 주변 3x3 칸만 보면 반경 내 후보를 모두 찾을 수 있습니다.
+    """
+
+    def __init__(self, bluer_df: pd.DataFrame, radius_m: float = 100.0, min_name_score: float = 85.0):
+        table = bluer_df.dropna(subset=["latitude", "longitude"]).reset_index(drop=True)
+        self.radius_m = radius_m
+        self.min_name_score = min_name_score
+
+        self.names = table["name"].fillna("").astype(str).to_numpy()
+        self.norm_names = np.array([normalize_store_name(n) for n in self.names], dtype=object)
+        self.ribbon_types = table["ribbon_type"].fillna("").astype(str).to_numpy()
+        self.lat = table["latitude"].to_numpy(dtype=float)
+        self.lon = table["longitude"].to_numpy(dtype=float)
+
+        # 서울 위도 기준으로 경도 방향 격자 크기를 고정 (반경 100m 수준에서는 오차가 무시 가능)
+        ref_lat = float(np.nanmean(self.lat)) if len(self.lat) else 37.5
+        self.cell_lat = radius_m / METERS_PER_DEG_LAT
+        self.cell_lon = radius_m / (METERS_PER_DEG_LAT * np.cos(np.radians(ref_lat)))
+
+        self.cells = pd.DataFrame({
+            "cx": np.floor(self.lon / self.cell_lon).astype(np.int64),
+            "cy": np.floor(self.lat / self.cell_lat).astype(np.int64),
+            "ribbon_idx": np.arange(len(self.lat)),
+        })
+
+    def __len__(self):
+        return len(self.lat)
+
+    def _candidate_pairs(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """격자 3x3 이웃 칸을 merge해서 (매장 인덱스, 블루리본 인덱스) 후보 쌍을 구합니다."""
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+        store_idx = np.nonzero(valid)[0]
+        if len(store_idx) == 0 or len(self) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+
+        base_cx = np.floor(lon[valid] / self.cell_lon).astype(np.int64)
+        base_cy = np.floor(lat[valid] / self.cell_lat).astype(np.int64)
+
+        frames = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                frames.append(pd.DataFrame({"cx": base_cx + dx, "cy": base_cy + dy, "store_idx": store_idx}))
+        pairs = pd.concat(frames, ignore_index=True).merge(self.cells, on=["cx", "cy"], how="inner")
+        return pairs["store_idx"].to_numpy(), pairs["ribbon_idx"].to_numpy()
+
+    def _haversine(self, lat1, lon1, lat2, lon2) -> np.ndarray:
+        lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+    def match(self, names: List[str], lat: List[float], lon: List[float]) -> pd.DataFrame:
+        """
+        매장 목록 전체를 한 번에 매칭합니다.
+        반환값: 입력 순서와 같은 행 순서의 DataFrame
+                (blue_ribbon, blue_ribbon_type, blue_ribbon_name, blue_ribbon_distance)
+        """
+        n = len(names)
+        result = pd.DataFrame({
+            "blue_ribbon": np.zeros(n, dtype=bool),
+            "blue_ribbon_type": [None] * n,
+            "blue_ribbon_name": [None] * n,
+            "blue_ribbon_distance": [None] * n,
+        })
+
+        lat = pd.to_numeric(pd.Series(lat, dtype=object), errors='coerce').to_numpy(dtype=float)
+        lon = pd.to_numeric(pd.Series(lon, dtype=object), errors='coerce').to_numpy(dtype=float)
+        store_idx, ribbon_idx = self._candidate_pairs(lat, lon)
+        if len(store_idx) == 0:
+            return result
+
+        # 1. 거리 필터 (벡터 연산)
+        dist = self._haversine(lat[store_idx], lon[store_idx], self.lat[ribbon_idx], self.lon[ribbon_idx])
+        near = dist <= self.radius_m
+        store_idx, ribbon_idx, dist = store_idx[near], ribbon_idx[near], dist[near]
+        if len(store_idx) == 0:
+            return result
+
+        # 2. 이름 유사도 (rapidfuzz 쌍별 일괄 계산)
+        norm_store_names = [normalize_store_name(names[i]) for i in store_idx]
+        name_scores = cpdist(norm_store_names, list(self.norm_names[ribbon_idx]), scorer=fuzz.WRatio, workers=-1)
+        ok = name_scores >= self.min_name_score
+        if not ok.any():
+            return result
+
+        # 3. 매장별 최고 점수(동점이면 가까운 곳) 후보 선택
+        matched = pd.DataFrame({
+            "store_idx": store_idx[ok], "ribbon_idx": ribbon_idx[ok],
+            "score": name_scores[ok], "dist": dist[ok],
+        }).sort_values(["store_idx", "score", "dist"], ascending=[True, False, True])
+        best = matched.drop_duplicates(subset="store_idx", keep="first")
+
+        rows = best["store_idx"].to_numpy()
+        result.loc[rows, "blue_ribbon"] = True
+        result.loc[rows, "blue_ribbon_type"] = self.ribbon_types[best["ribbon_idx"].to_numpy()]
+        result.loc[rows, "blue_ribbon_name"] = self.names[best["ribbon_idx"].to_numpy()]
+        result.loc[rows, "blue_ribbon_distance"] = best["dist"].round(1).to_numpy()
+        return result
+
+
+@lru_cache(maxsize=4)
+def _load_index(csv_paths: Tuple[str, ...], mtimes: Tuple[float, ...], radius_m: float) -> Optional[BlueRibbonIndex]:
+    frames = [load_bluer(os.path.basename(p), directory=os.path.dirname(p)) for p in csv_paths]
+    if not frames:
+        return None
+    return BlueRibbonIndex(pd.concat(frames, ignore_index=True), radius_m=radius_m)
+
+
+def get_blue_ribbon_index(blueribbon_dir: str, radius_m: float = 100.0) -> Optional[BlueRibbonIndex]:
+    """
+    디렉토리 내 모든 블루리본 CSV로 색인을 만듭니다. 프로세스당 한 번만 만들어지며,
+    CSV 파일이 바뀌면(수정 시각 변경) 다시 만듭니다. CSV가 없으면 None을 반환합니다.
+    """
+    csv_paths = tuple(sorted(glob.glob(os.path.join(blueribbon_dir, "*.csv"))))
+    if not csv_paths:
+        return None
+    mtimes = tuple(os.path.getmtime(p) for p in csv_paths)
+    return _load_index(csv_paths, mtimes, radius_m)
+
+
+def tag_blue_ribbon(stores: List[Dict], blueribbon_dir: str) -> List[Dict]:
+    """매장 딕셔너리 목록에 블루리본 매칭 결과를 일괄로 채워 넣습니다. (입력 리스트를 직접 수정)"""
+    index = get_blue_ribbon_index(blueribbon_dir)
+    if index is None or not stores:
+        return stores
+
+    flags = index.match(
+        [s.get("name") for s in stores],
+        [s.get("gps_latitude") for s in stores],
+        [s.get("gps_longitude") for s in stores],
+    )
+    for store, flag in zip(stores, flags.to_dict("records")):
+        store.update(flag)
+    return stores
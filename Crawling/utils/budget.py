@@ -0,0 +1,99 @@
+# 파이프라인 요청 단위의 매장 수/시간 예산입니다.
+# 넓은 검색어의 /pipeline/run은 한 시간 넘게 걸려도 멈출 방법이 없고, 세 단계가 모두 끝나기 전에는 결과가 없었습니다.
+#
+#  - max_stores  : 네이버 상세 수집 매장 수 상한. 도달하면 새 매장 수집을 멈춥니다.
+#  - max_duration: 요청 전체 시간 목표(초). 네이버 상세 수집은 max_duration * naver_share까지만 새 매장을 시작하고,
+#      나머지 시간은 이미 모은 매장의 카카오 크롤링/점수 산정에 남겨 둡니다.
+#  - 예산은 새 매장 수집만 멈춥니다. 이미 수집한 매장은 카카오 크롤링과 LLM 점수 산정을 모두 거쳐 저장되므로
+#    (일부 단계를 건너뛴 채 점수가 매겨진 레코드는 만들지 않음) 뒤 단계 때문에 max_duration을 넘길 수 있으며,
+#    작업 결과에 partial 표시가 붙습니다.
+
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_STAGE_SHARES = {"naver": 0.6}
+
+MAX_STORES = "max_stores"
+MAX_DURATION = "max_duration"
+
+
+class CrawlBudget:
+    def __init__(self, max_stores: Optional[int] = None, max_duration: Optional[float] = None,
+                 stage_shares: Optional[Dict[str, float]] = None):
+        self.max_stores = max_stores
+        self.max_duration = max_duration
+        self.stage_shares = {**DEFAULT_STAGE_SHARES, **(stage_shares or {})}
+        self.started = time.monotonic()
+        self._stores = 0
+        self._stopped: Dict[str, str] = {}  # {단계: 중단 사유}
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def add_store(self):
+        """네이버 상세 수집을 마친 매장 1건을 기록합니다. (스레드 안전)"""
+        with self._lock:
+            self._stores += 1
+
+    def check(self, stage: str = "naver") -> Optional[str]:
+        """해당 단계의 예산이 남아 있으면 None, 소진되었으면 사유(max_stores/max_duration)를 반환합니다."""
+        if stage == "naver" and self.max_stores and self._stores >= self.max_stores:
+            return MAX_STORES
+        if self.max_duration and self.elapsed() >= self.max_duration * self.stage_shares.get(stage, 1.0):
+            return MAX_DURATION
+        return None
+
+    def exhausted(self, stage: str = "naver") -> bool:
+        """예산이 소진되었는지 확인합니다. 소진되었으면 해당 단계를 중단한 것으로 기록합니다. (작업을 건너뛸 때만 호출)"""
+        reason = self.check(stage)
+        if reason:
+            with self._lock:
+                if stage not in self._stopped:
+                    self._stopped[stage] = reason
+                    print(f"⏳ 예산 소진({reason})으로 '{stage}' 단계의 새 작업을 멈춥니다. (경과 {self.elapsed():.0f}초, 수집 {self._stores}건)")
+        return reason is not None
+
+    def gate(self, items: Iterable[T], stage: str = "naver") -> Iterator[T]:
+        """예산이 남아 있는 동안만 items를 내보냅니다. (남은 항목이 있을 때만 중단으로 기록)"""
+        for item in items:
+            if self.exhausted(stage):
+                return
+            yield item
+
+    def limit(self, df):
+        """워커들이 동시에 수집하느라 max_stores를 넘긴 결과를 상한에 맞춰 자릅니다."""
+        if self.max_stores and len(df) > self.max_stores:
+            with self._lock:
+                self._stopped.setdefault("naver", MAX_STORES)
+            return df.head(self.max_stores).reset_index(drop=True)
+        return df
+
+    @property
+    def partial(self) -> bool:
+        return bool(self._stopped)
+
+    def summary(self) -> Dict:
+        return {
+            "max_stores": self.max_stores,
+            "max_duration": self.max_duration,
+            "elapsed_s": round(self.elapsed(), 1),
+            "stores": self._stores,
+            "stopped": dict(self._stopped),
+            "partial": self.partial,
+        }
+
+
+def budget_from_config(max_stores: Optional[int] = None, max_duration: Optional[float] = None,
+                       budget_config: Optional[Dict] = None) -> Optional[CrawlBudget]:
+    """요청값(없으면 config.yaml의 budget 기본값)으로 예산을 만듭니다. 상한이 하나도 없으면 None."""
+    cfg = budget_config or {}
+    max_stores = max_stores or cfg.get('max_stores')
+    max_duration = max_duration or cfg.get('max_duration')
+    if not (max_stores or max_duration):
+        return None
+    shares = {stage: cfg[f"{stage}_share"] for stage in DEFAULT_STAGE_SHARES if cfg.get(f"{stage}_share")}
+    return CrawlBudget(max_stores=max_stores, max_duration=max_duration, stage_shares=shares)
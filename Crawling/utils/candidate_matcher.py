@@ -0,0 +1,54 @@
+# 타겟 크롤링(TargetStoreCrawler)에서 검색 결과 목록의 후보들을 "이름 유사도 + 주소 토큰 일치율"로 평가합니다.
+# 기존에는 후보 li마다 WebDriver로 이름/주소를 읽고 SequenceMatcher로 하나씩 점수를 매겼습니다.
+# 여기서는 목록 수집 스크립트(list_harvester)가 돌려준 아이템 전체를 rapidfuzz로 한 번에 점수화하고,
+# 정규화한 이름이 같고 주소 토큰이 모두 일치하는 후보는 확정 매칭(exact)으로 표시해 탐색을 바로 끝낼 수 있게 합니다.
+
+import re
+from typing import Dict, List
+
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
+
+NAME_WEIGHT = 0.8
+ADDRESS_WEIGHT = 0.2
+
+_NON_WORD = re.compile(r"[\s\W_]+")
+
+
+def normalize_candidate_name(name) -> str:
+    """공백/특수문자를 제거하고 소문자로 변환한 비교용 이름을 반환합니다. (지점명은 구분해야 하므로 유지)"""
+    if not isinstance(name, str):
+        return ""
+    return _NON_WORD.sub("", name).lower()
+
+
+def score_candidates(search_word: str, address: str, items: List[Dict]) -> List[Dict]:
+    """
+    items([{"id", "name", "address", "index"}])를 한 번에 평가해 같은 순서로
+    {"id", "name", "address", "index", "name_score", "address_score", "score", "exact"} 목록을 반환합니다.
+    id가 없는 아이템(목록에서 place ID를 찾지 못한 후보)도 점수화하며, index(목록 li 순서)로 클릭할 수 있습니다.
+    """
+    if not items:
+        return []
+
+    query = normalize_candidate_name(search_word)
+    names = [normalize_candidate_name(item.get("name")) for item in items]
+    name_scores = cdist([query], names, scorer=fuzz.ratio, workers=-1)[0] / 100.0
+
+    address_tokens = (address or "").split()
+    scored = []
+    for item, norm_name, name_score in zip(items, names, name_scores):
+        addr_txt = item.get("address") or ""
+        address_score = sum(1 for token in address_tokens if token in addr_txt) / len(address_tokens) if address_tokens else 0.0
+        scored.append({
+            "id": item.get("id"),
+            "name": item.get("name"),
+            "address": addr_txt,
+            "index": item.get("index"),
+            "name_score": float(name_score),
+            "address_score": address_score,
+            "score": float(name_score) * NAME_WEIGHT + address_score * ADDRESS_WEIGHT,
+            # 주소 없이 이름만 같은 경우는 다른 지점일 수 있으므로 확정하지 않음
+            "exact": bool(query) and norm_name == query and address_score >= 1.0,
+        })
+    return scored
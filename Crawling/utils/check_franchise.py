@@ -61,41 +61,85 @@ def remove_last_word_if_endswith_jum(store_name):
     return store_name
 
 
-def check_franchise(store_name):
+FRANCHISE_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/', "franchise.csv")
 
-    directory = os.path.dirname(os.path.abspath(__file__))
-    csv_file_path = os.path.join(directory, 'data/', "franchise.csv")
 
-    df = pd.read_csv(csv_file_path, encoding='utf-8-sig')
+def normalize_brand_name(name):
+    """비교용 이름: 공백 제거 + 소문자"""
+    if not isinstance(name, str):
+        return ""
+    return name.replace(" ", "").lower()
 
-    store_name = remove_last_word_if_endswith_jum(
-        store_name)
 
-    return df['영업표지'].replace(" ", "").str.contains(store_name.lower().replace(" ", ""), na=False).sum() > 0
+class FranchiseMatcher:
+    """
+    프랜차이즈(정보공개서 영업표지) + 레귤러 체인(chain_list) 브랜드명으로 만든 부분 문자열 색인.
+    기존 판정 규칙("매장명이 어떤 브랜드명의 일부인가")을 그대로 따르되,
+    브랜드명의 모든 부분 문자열을 한 번만 색인해 두어 매장 한 곳당 해시 조회 한 번으로 판정합니다.
+    (브랜드 수와 무관하게 매장 수에 선형)
+    """
 
+    def __init__(self, brand_names):
+        self.brand_count = 0
+        self._substrings = set()
+        for brand in {normalize_brand_name(b) for b in brand_names}:
+            if not brand:
+                continue
+            self.brand_count += 1
+            length = len(brand)
+            for i in range(length):
+                for j in range(i + 1, length + 1):
+                    self._substrings.add(brand[i:j])
 
-def check_franchise_list(crawled_data):
+    def is_match(self, store_name):
+        if not isinstance(store_name, str) or not store_name.strip():
+            return False
+        return remove_last_word_if_endswith_jum(store_name).lower() in self._substrings
+
+    def tag(self, store_names):
+        return [self.is_match(name) for name in store_names]
+
+
+def _load_franchise_brand_names(csv_file_path=FRANCHISE_CSV_PATH):
+    try:
+        df = pd.read_csv(csv_file_path, encoding='utf-8-sig', usecols=['영업표지'])
+        return df['영업표지'].dropna().astype(str).tolist()
+    except FileNotFoundError:
+        print(f"경고: 프랜차이즈 목록 파일 '{csv_file_path}'를 찾을 수 없어 chain_list만 사용합니다.")
+    except Exception as e:
+        print(f"경고: 프랜차이즈 목록 파일 로드 실패({e}). chain_list만 사용합니다.")
+    return []
 
-    directory = os.path.dirname(os.path.abspath(__file__))
-    csv_file_path = os.path.join(directory, 'data/', "franchise.csv")
 
-    df = pd.read_csv(csv_file_path, encoding='utf-8-sig')
-    franchise_names = df['영업표지'].str.replace(" ", "").str.lower()
-    chain_names = [x.replace(" ", "").lower() for x in chain_list]
+_matcher_cache = {}
 
-    crawled_store_name = crawled_data["name"].apply(
-        remove_last_word_if_endswith_jum)
-    crawled_store_name = crawled_store_name.str.lower()
 
-    is_franchise = [any(store in franchise for franchise in franchise_names)
-                    for store in crawled_store_name]
+def get_franchise_matcher(csv_file_path=FRANCHISE_CSV_PATH):
+    """프로세스당 한 번만 매처를 만들고, franchise.csv가 바뀌면(수정 시각 변경) 다시 만듭니다."""
+    mtime = os.path.getmtime(csv_file_path) if os.path.exists(csv_file_path) else None
+    cache_key = (csv_file_path, mtime)
+    if cache_key not in _matcher_cache:
+        _matcher_cache.clear()
+        _matcher_cache[cache_key] = FranchiseMatcher(_load_franchise_brand_names(csv_file_path) + chain_list)
+    return _matcher_cache[cache_key]
 
-    is_chain = [any(store in chain for chain in chain_names)
-                for store in crawled_store_name]
 
-    result = [a or b for a, b in zip(is_franchise, is_chain)]
+def check_franchise(store_name):
+    return get_franchise_matcher().is_match(store_name)
+
+
+def check_franchise_list(crawled_data):
+    """DataFrame의 name 컬럼 전체에 대해 프랜차이즈/체인 여부 리스트를 반환합니다."""
+    if crawled_data is None or len(crawled_data) == 0 or "name" not in crawled_data.columns:
+        return []
+    return get_franchise_matcher().tag(crawled_data["name"].tolist())
+
 
-    return result
+def tag_franchise(crawled_data):
+    """크롤링 결과 DataFrame에 is_franchise 컬럼을 추가합니다. (입력 DataFrame을 직접 수정)"""
+    if crawled_data is not None and not crawled_data.empty and "name" in crawled_data.columns:
+        crawled_data["is_franchise"] = check_franchise_list(crawled_data)
+    return crawled_data
 
 
 # if __name__ == "__main__":
@@ -0,0 +1,65 @@
+# 네이버 상세 수집에서 어떤 섹션까지 수집할지 정하는 크롤링 프로필입니다.
+# get_store_details는 항상 모든 섹션을 수집했는데, 가장 오래 걸리는 부분(홈 탭 데이터랩 스크롤/차트 대기,
+# 메뉴 탭, 리뷰 탭, 인스타그램 보강)이 필요 없는 용도(중복 확인용 수집, 빠른 위치 점수 등)도 많습니다.
+#
+# 기본 정보(이름/카테고리/주소/전화/좌표/리뷰 수/지하철 거리/주차)는 상세 페이지 첫 화면에서 얻으므로 항상 수집하고,
+# 아래 선택 섹션만 프로필에 따라 건너뜁니다. 건너뛴 섹션은 탭 이동과 대기를 하지 않으며 값은 비어 있습니다(None/[]).
+#  - datalab  : 홈 탭 데이터랩 (theme_*, age-2030, gender_*)
+#  - menu     : 메뉴 탭 (menu_list)
+#  - reviews  : 리뷰 탭 (review_category, review_info, running_well)
+#  - instagram: 인스타그램 링크 확인 및 팔로워/게시글 수 보강 단계
+
+import ast
+import json
+from typing import Dict, FrozenSet, Literal, Tuple
+
+SECTIONS = ("datalab", "menu", "reviews", "instagram")
+
+CRAWL_PROFILES = {
+    "minimal": frozenset(),
+    # 점수 산정(LLM 분류)에 쓰이는 테마/메뉴/리뷰만 수집
+    "scoring": frozenset({"datalab", "menu", "reviews"}),
+    "full": frozenset(SECTIONS),
+}
+
+DEFAULT_PROFILE = "full"
+
+CrawlProfileName = Literal["minimal", "scoring", "full"]
+
+
+def profile_sections(profile: str = None) -> FrozenSet[str]:
+    """프로필 이름의 수집 섹션을 반환합니다. 비어 있으면 기본(full) 프로필을 사용합니다."""
+    name = profile or DEFAULT_PROFILE
+    if name not in CRAWL_PROFILES:
+        raise ValueError(f"알 수 없는 크롤링 프로필입니다: '{name}' (사용 가능: {', '.join(CRAWL_PROFILES)})")
+    return CRAWL_PROFILES[name]
+
+
+# 레코드의 section_status({섹션: 상태})에 기록하는 섹션별 수집 상태 (Crawling/section_retry.py가 failed만 재수집)
+SECTION_OK = "ok"            # 수집 성공
+SECTION_FAILED = "failed"    # 수집 시도 중 오류 (값이 비어 있음)
+SECTION_SKIPPED = "skipped"  # 프로필에서 제외되었거나 해당 백엔드에서 수집하지 않음
+SECTION_ABSENT = "absent"    # 페이지에 해당 섹션/탭이 없음
+
+# section_status를 기록하는 상세 페이지 섹션과 각 섹션이 채우는 필드 (인스타그램은 instagram_enricher에서 별도로 보강)
+SECTION_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "datalab": ("theme_mood", "theme_topic", "theme_purpose", "age-2030", "gender-balance", "gender_male", "gender_female"),
+    "menu": ("menu_list",),
+    "reviews": ("review_category", "review_info", "running_well"),
+}
+STATUS_SECTIONS = tuple(SECTION_FIELDS)
+
+
+def parse_section_status(value) -> Dict[str, str]:
+    """레코드의 section_status 값(딕셔너리 또는 CSV/JSON 저장으로 문자열이 된 값)을 딕셔너리로 변환합니다."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value:
+        for loader in (json.loads, ast.literal_eval):
+            try:
+                parsed = loader(value)
+                if isinstance(parsed, dict):
+                    return parsed
+            except (ValueError, SyntaxError):
+                continue
+    return {}
@@ -0,0 +1,72 @@
+# 크롤링 결과를 매장 단위로 바로 기록하는 append-only 저장소(JSONL)입니다.
+# 기존에는 매장마다 pd.concat([self.data, new_data])로 DataFrame 전체를 복사해 수집 개수가 늘수록 느려졌고,
+# 크롤링 도중 프로세스가 죽으면 그때까지 수집한 결과가 모두 사라졌습니다.
+# 여기서는 수집이 끝난 매장을 한 줄씩 파일에 추가(flush)하고, 같은 run_id로 다시 실행하면
+# 이미 기록된 naver_id를 건너뛰어 이어서 수집할 수 있습니다.
+
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+
+def new_run_id() -> str:
+    """시간 순으로 정렬되는 실행 ID를 만듭니다. (예: 20250620_150000_1a2b3c)"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+class CrawlSink:
+    def __init__(self, sink_dir: str, run_id: str, logger: Optional[logging.Logger] = None):
+        self.run_id = run_id
+        self.logger = logger or logging.getLogger(__name__)
+        os.makedirs(sink_dir, exist_ok=True)
+        self.path = os.path.join(sink_dir, f"{run_id}.jsonl")
+        self._lock = threading.Lock()  # 여러 워커(스레드)가 같은 파일에 기록하므로 줄 단위로 잠금
+        self._close_partial_line()
+
+    def _close_partial_line(self):
+        """이전 실행이 줄 중간에 종료되었으면 줄바꿈을 붙여, 이어서 기록할 줄이 잘린 줄에 섞이지 않게 합니다."""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def append(self, record: Dict[str, Any]):
+        """매장 1건을 한 줄로 추가합니다. 줄마다 flush하므로 중간에 종료되어도 앞선 결과는 남습니다."""
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+
+    def load_records(self) -> List[Dict[str, Any]]:
+        """기록된 전체 매장을 읽습니다. 비정상 종료로 잘린 줄은 건너뜁니다."""
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with self._lock:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        self.logger.warning(f"손상된 줄을 건너뜁니다: {self.path}:{line_no}")
+        return records
+
+    def completed_ids(self) -> Set[int]:
+        """이미 기록된 naver_id 목록 (재실행 시 건너뛸 대상)"""
+        ids = set()
+        for record in self.load_records():
+            try:
+                ids.add(int(record.get("naver_id")))
+            except (TypeError, ValueError):
+                continue
+        return ids
@@ -0,0 +1,82 @@
+# 상세 페이지(entryIframe)에 선택적으로 존재하는 섹션들을 스크립트 한 번으로 확인합니다.
+# 인스타그램 링크, 지하철 정보 등은 매장마다 없을 수 있는데, 없는 섹션을 WebDriverWait로 찾으면
+# 시간 초과(10초)까지 기다리게 됩니다. 인벤토리에서 없다고 확인된 섹션은 기다리지 않고 기본값으로 넘어갑니다.
+
+import logging
+from typing import Any, Dict, List, Optional
+
+# 섹션 이름 → 존재 여부, 그리고 상단 탭 이름 목록을 반환
+SECTION_INVENTORY_JS = """
+const has = (selector, text) => [...document.querySelectorAll(selector)].some(el => !text || el.textContent.includes(text));
+return {
+    sections: {
+        title: !!document.querySelector('#_title'),
+        instagram: !!document.querySelector("a[href*='instagram.com']"),
+        address: has('strong', '주소'),
+        phone: has('strong', '전화번호'),
+        michelin: has('a', '미쉐린 가이드 서울'),
+        subway: has('div.nZapA', '출구'),
+        convenience: has('strong span', '편의'),
+        on_tv: has('strong span', 'TV방송정보'),
+        visitor_review: has('a', '방문자 리뷰'),
+        blog_review: has('a', '블로그 리뷰'),
+    },
+    tabs: [...document.querySelectorAll("a[role='tab']")].map(a => a.textContent.trim()),
+};
+"""
+
+# 섹션이 없을 때 store_dict에 채울 기본값 (기존 DOM 수집 코드의 '요소 없음' 처리와 동일)
+SECTION_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "instagram": {"instagram_link": None, "instagram_post": None, "instagram_follower": None},
+    "address": {"address": None},
+    "phone": {"phone": None},
+    "michelin": {"seoul_michelin": False},
+    "subway": {"distance_from_subway": None, "distance_from_subway_origin": None},
+    "convenience": {"parking_available": False},
+    "on_tv": {"on_tv": False},
+    "visitor_review": {"visitor_review_count": 0},
+    "blog_review": {"blog_review_count": 0},
+}
+
+
+class SectionInventory:
+    def __init__(self, sections: Optional[Dict[str, bool]] = None, tabs: Optional[List[str]] = None):
+        # 인벤토리를 얻지 못한 경우(None)는 모든 섹션이 있다고 보고 기존 방식대로 수집
+        self.sections = sections
+        self.tabs = tabs
+
+    @property
+    def known(self) -> bool:
+        return self.sections is not None
+
+    def has(self, section: str) -> bool:
+        if self.sections is None:
+            return True
+        return bool(self.sections.get(section, True))
+
+    def has_tab(self, tab_name: str) -> bool:
+        if self.tabs is None:
+            return True
+        return any(tab_name in t for t in self.tabs)
+
+    def missing(self) -> List[str]:
+        if self.sections is None:
+            return []
+        return [name for name, present in self.sections.items() if not present]
+
+    def fill_missing(self, store_dict: Dict[str, Any], keep_keys=()):
+        """없는 섹션의 필드를 기본값으로 채웁니다. keep_keys(예: Apollo 상태에서 얻은 필드)는 덮어쓰지 않습니다."""
+        for section in self.missing():
+            for key, value in SECTION_DEFAULTS.get(section, {}).items():
+                if key not in keep_keys:
+                    store_dict[key] = value
+
+
+def take_section_inventory(driver, logger: Optional[logging.Logger] = None) -> SectionInventory:
+    """현재 프레임(entryIframe)의 섹션 인벤토리를 가져옵니다. 실패하면 '모름' 상태의 인벤토리를 반환합니다."""
+    try:
+        result = driver.execute_script(SECTION_INVENTORY_JS) or {}
+        return SectionInventory(result.get("sections"), result.get("tabs"))
+    except Exception as e:
+        (logger or logging.getLogger(__name__)).warning(f"섹션 인벤토리 확인 실패, 모든 섹션을 수집합니다: {e}")
+        return SectionInventory()
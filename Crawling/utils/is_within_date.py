@@ -133,3 +133,14 @@ def is_within_two_weeks(date_val):
     two_weeks_ago = current_date - timedelta(days=14)
     return two_weeks_ago <= date_obj <= current_date
 
+
+def compute_running_well(visit_dates):
+    """
+    방문일 목록으로 운영 상태(running_well)를 계산합니다.
+    - 3: 2주 이내 방문 / 2: 1개월 이내 / 1: 3개월 이내 / 0: 3개월 내 방문 없음(또는 리뷰 없음)
+    """
+    if not visit_dates or not any(is_within_three_months(d) for d in visit_dates):
+        return 0
+    if any(is_within_one_month(d) for d in visit_dates):
+        return 3 if any(is_within_two_weeks(d) for d in visit_dates) else 2
+    return 1
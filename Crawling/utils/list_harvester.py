@@ -0,0 +1,135 @@
+# 검색 결과 목록(searchIframe)을 끝까지 불러오고, 목록 아이템(place ID, 이름, 주소)을 한 번에 수집합니다.
+# 기존 scroll_to_end는 스크롤마다 2초씩 고정 대기(변경 없음 3회 확인) 후 0.3초 간격의 정밀 스캔을 한 번 더 해서
+# 짧은 목록도 페이지마다 10초 이상 걸렸습니다.
+# 여기서는 execute_async_script 안에서 목록 컨테이너를 스크롤하고, MutationObserver로 아이템 추가가
+# stable_ms 동안 멈추면 바로 결과를 반환합니다. (WebDriver 왕복 1회)
+#  - 다음 묶음의 네트워크 응답이 늦으면 로딩 중에도 변경이 잠시 멈추므로, 안정화 시간은 여유 있게(기본 2초) 잡습니다.
+#    config.yaml의 list_harvest 섹션(configure)으로 바꿀 수 있습니다.
+#  - place ID는 DOM 목록 아이템마다 이름이 같은 Apollo 요약 객체에서, 없으면 같은 li의 /place/{id} 링크에서 가져옵니다.
+#    목록과 무관한 요약 객체는 쓰지 않으며, ID를 찾지 못한 아이템은 unresolved(목록 순서 index 포함)로 따로 반환해
+#    호출 측이 클릭 방식으로 수집하게 합니다. (items + unresolved = dom_count)
+
+import logging
+from typing import Any, Dict, Optional
+
+DEFAULT_STABLE_MS = 2000
+DEFAULT_MAX_MS = 20000
+
+# configure()로 바꾸는 프로세스 전체 기본값
+_settings = {"stable_ms": DEFAULT_STABLE_MS, "max_ms": DEFAULT_MAX_MS}
+
+LIST_CONTAINER_SELECTOR = "#_pcmap_list_scroll_container"
+LIST_ITEM_SELECTOR = "li.UEzoS.rTjJo"
+
+# arguments: [컨테이너 선택자, 아이템 선택자, 안정화 시간(ms), 최대 시간(ms), callback]
+LIST_HARVEST_ASYNC_JS = r"""
+const [containerSelector, itemSelector, stableMs, maxMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+
+const collect = (timedOut) => {
+    // 1) DOM 목록의 이름/주소 (주소는 같은 li 안의 span.Pb4bU). index는 목록 li 순서(클릭 대체 수집용)
+    const domItems = [...document.querySelectorAll(containerSelector + ' > ul > li')].map((li, index) => {
+        const link = li.querySelector('a.place_bluelink');
+        const address = li.querySelector('span.Pb4bU');
+        const href = li.querySelector('a[href*="/place/"]');
+        const m = href ? href.getAttribute('href').match(/\/place\/(\d+)/) : null;
+        return {
+            index: index,
+            name: link ? (link.innerText || '').split('\n')[0].trim() : '',
+            address: address ? address.textContent.trim() : '',
+            href_id: m ? m[1] : '',
+        };
+    }).filter(it => it.name);
+
+    // 2) __APOLLO_STATE__의 목록 요약 객체(*Summary)를 이름으로 찾을 수 있게 정리
+    const summaryByName = new Map();
+    const state = window.__APOLLO_STATE__;
+    if (state) {
+        for (const [key, value] of Object.entries(state)) {
+            if (!value || typeof value !== 'object' || !value.name) continue;
+            const typename = value.__typename || key.split(':')[0];
+            if (!/Summary$/.test(typename)) continue;
+            const id = String(value.id || '');
+            if (!/^\d+$/.test(id) || summaryByName.has(value.name)) continue;
+            summaryByName.set(value.name, {id: id, address: value.roadAddress || value.address || ''});
+        }
+    }
+
+    // 3) DOM 아이템마다 요약 객체 ID, 없으면 DOM 링크의 /place/{id}를 사용. 둘 다 없으면 unresolved로 반환
+    const items = [];
+    const unresolved = [];
+    for (const it of domItems) {
+        const summary = summaryByName.get(it.name);
+        const id = summary ? summary.id : it.href_id;
+        const address = it.address || (summary && summary.address) || '';
+        if (id) {
+            items.push({id: id, name: it.name, address: address, index: it.index});
+        } else {
+            unresolved.push({name: it.name, address: address, index: it.index});
+        }
+    }
+    const itemCount = document.querySelectorAll(itemSelector).length;
+    done({items: items, unresolved: unresolved, unresolved_count: unresolved.length, dom_count: domItems.length,
+          item_count: itemCount, elapsed_ms: Math.round(performance.now() - started), timed_out: timedOut});
+};
+
+const container = document.querySelector(containerSelector);
+if (!container) { collect(false); return; }
+
+let lastChange = performance.now();
+const scrollDown = () => container.scrollTo(0, container.scrollHeight);
+const observer = new MutationObserver(() => { lastChange = performance.now(); scrollDown(); });
+observer.observe(container, {childList: true, subtree: true});
+scrollDown();
+
+const timer = setInterval(() => {
+    const now = performance.now();
+    const stable = now - lastChange >= stableMs;
+    const timedOut = now - started >= maxMs;
+    if (stable || timedOut) {
+        clearInterval(timer);
+        observer.disconnect();
+        collect(timedOut && !stable);
+    } else {
+        scrollDown();
+    }
+}, 100);
+"""
+
+
+def configure(stable_ms: Optional[int] = None, max_ms: Optional[int] = None, **_):
+    """config.yaml의 list_harvest 섹션으로 안정화 시간/최대 시간 기본값을 바꿉니다."""
+    if stable_ms is not None:
+        _settings["stable_ms"] = max(100, int(stable_ms))
+    if max_ms is not None:
+        _settings["max_ms"] = max(1000, int(max_ms))
+
+
+def harvest_list(driver, logger: Optional[logging.Logger] = None, stable_ms: Optional[int] = None, max_ms: Optional[int] = None,
+                 container_selector: str = LIST_CONTAINER_SELECTOR, item_selector: str = LIST_ITEM_SELECTOR) -> Dict[str, Any]:
+    """
+    현재 프레임(searchIframe)의 목록을 끝까지 불러온 뒤 아이템을 반환합니다.
+    stable_ms/max_ms를 주지 않으면 configure()로 설정한 값(기본 2000ms/20000ms)을 사용합니다.
+    반환: {"items": [{"id", "name", "address", "index"}], "unresolved": [{"name", "address", "index"}],
+           "unresolved_count", "dom_count", "elapsed_ms", "timed_out"}
+    index는 목록(ul > li)에서의 순서이며, 클릭 방식으로 수집할 때 사용합니다.
+    """
+    logger = logger or logging.getLogger(__name__)
+    stable_ms = stable_ms if stable_ms is not None else _settings["stable_ms"]
+    max_ms = max_ms if max_ms is not None else _settings["max_ms"]
+    try:
+        driver.set_script_timeout(max_ms / 1000 + 5)
+        result = driver.execute_async_script(LIST_HARVEST_ASYNC_JS, container_selector, item_selector, stable_ms, max_ms) or {}
+    except Exception as e:
+        logger.warning(f"목록 수집 스크립트 실행 실패: {e}")
+        return {"items": [], "unresolved": [], "unresolved_count": 0, "dom_count": 0, "elapsed_ms": None, "timed_out": True}
+
+    logger.info(
+        f"목록 로딩 완료: 아이템 {result.get('dom_count', 0)}개, ID {len(result.get('items', []))}개, ID 없음 {result.get('unresolved_count', 0)}개 "
+        f"({result.get('elapsed_ms')}ms{', 최대 시간 도달' if result.get('timed_out') else ''})"
+    )
+    if result.get("unresolved_count"):
+        names = ", ".join(it.get("name", "") for it in result.get("unresolved", [])[:5])
+        logger.warning(f"목록 아이템 {result['unresolved_count']}개에서 place ID를 찾지 못했습니다: {names}")
+    return result
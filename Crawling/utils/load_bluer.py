@@ -1,40 +1,22 @@
-import csv
 import os
 import pandas as pd
 
 # 파일 이름을 기준으로 블루리본서베이 매장 정보를 load해 반환합니다.
 
+BLUER_COLUMNS = ["name", "ribbon_type", "latitude", "longitude", "address", "phone"]
 
-def load_bluer(file_name):
-    bluer_data = pd.DataFrame(
-        columns=["name", "ribbonType", "latitude", "longitude", "address", "phone"])
 
-    # 스크립트 파일이 위치한 디렉토리의 상위 폴더를 기준으로 상대 경로 구하기
-    directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    csv_file_path = os.path.join(directory, 'data/blueribbon', file_name)
+def load_bluer(file_name, directory=None):
+    # 디렉토리를 지정하지 않으면 스크립트 파일이 위치한 디렉토리의 상위 폴더를 기준으로 상대 경로 구하기
+    if directory is None:
+        directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data/blueribbon')
+    csv_file_path = os.path.join(directory, file_name)
 
-    # CSV 파일 읽기
-    with open(csv_file_path, 'r', encoding='utf-8') as file:
-        reader = csv.reader(file)
-        next(reader)
+    # CSV 파일을 한 번에 읽어 컬럼 단위 테이블로 만듭니다. (헤더 이름과 무관하게 앞 6개 컬럼 순서 기준)
+    bluer_data = pd.read_csv(csv_file_path, encoding='utf-8', header=0, usecols=range(6), dtype=str)
+    bluer_data.columns = BLUER_COLUMNS
 
-        for row in reader:
-            name = row[0]
-            ribbon_type = row[1]
-            latitude = row[2]
-            longitude = row[3]
-            address = row[4]
-            phone = row[5]
-
-            new_data = pd.DataFrame([{
-                "name": name,
-                "ribbon_type": ribbon_type,
-                "latitude": latitude,
-                "longitude": longitude,
-                "address": address,
-                "phone": phone
-            }])
-
-            bluer_data = pd.concat([bluer_data, new_data], ignore_index=True)
+    bluer_data["latitude"] = pd.to_numeric(bluer_data["latitude"], errors='coerce')
+    bluer_data["longitude"] = pd.to_numeric(bluer_data["longitude"], errors='coerce')
 
     return bluer_data
@@ -2,62 +2,164 @@ import pandas as pd
 import os
 import boto3
 from io import BytesIO
+from datetime import datetime
 
 def load_ids_from_master_data(storage_mode, config) -> set:
     """
     스토리지 모드에 따라 total/ 폴더에서 가장 최신 마스터 JSON 파일을 찾아
-    naver_id 목록을 set으로 반환합니다.
+    naver_id 목록을 set으로 반환합니다. (파일 조회/읽기는 load_master_data와 같은 경로를 사용)
     """
     print("마스터 데이터에서 naver_id 목록 로딩을 시작합니다.")
-    master_file_to_read = None
+    df = load_master_data(storage_mode, config)
+    if df.empty:
+        print("정보: 불러온 마스터 데이터가 없어 빈 ID 목록으로 시작합니다.")
+        return set()
+    if 'naver_id' not in df.columns:
+        print("오류: 마스터 데이터 로딩 실패. 'naver_id' 컬럼 없음")
+        return set()
+
+    id_set = set(pd.to_numeric(df['naver_id'], errors='coerce').dropna().astype(int))
+    print(f"ID 목록 로딩 완료. 총 {len(id_set)}개의 고유 ID를 불러왔습니다.")
+    return id_set
+
+def _find_latest_master(storage_mode, config, s3_client=None):
+    """가장 최신 마스터 JSON 파일의 경로(로컬) 또는 키(S3)를 반환합니다. 없으면 None."""
+    if storage_mode == 's3':
+        s3_config = config['s3_config']
+        response = s3_client.list_objects_v2(Bucket=s3_config['bucket_name'], Prefix=s3_config['total_results_prefix'])
+        all_master_files = [
+            obj['Key'] for obj in response.get('Contents', [])
+            if obj['Key'].split('/')[-1].startswith(s3_config['master_file_prefix']) and obj['Key'].endswith('.json')
+        ]
+    else:
+        local_config = config['local_config']
+        total_dir = local_config['total_dir']
+        if not os.path.exists(total_dir):
+            return None
+        all_master_files = [
+            os.path.join(total_dir, f) for f in os.listdir(total_dir)
+            if f.startswith(local_config['master_file_prefix']) and f.endswith('.json')
+        ]
+    return max(all_master_files) if all_master_files else None
+
 
+def find_latest_master_key(storage_mode, config):
+    """가장 최신 마스터 파일의 경로(로컬) 또는 키(S3)만 조회합니다. (파일 내용은 읽지 않음)"""
+    try:
+        s3_client = boto3.client('s3') if storage_mode == 's3' else None
+        return _find_latest_master(storage_mode, config, s3_client)
+    except Exception as e:
+        print(f"오류: 마스터 파일 조회 실패. {e}")
+        return None
+
+
+def load_master_data(storage_mode, config) -> pd.DataFrame:
+    """
+    스토리지 모드에 따라 가장 최신 마스터 JSON 파일 전체를 DataFrame으로 반환합니다.
+    마스터 파일이 없거나 읽기에 실패하면 빈 DataFrame을 반환합니다.
+    """
     try:
         if storage_mode == 's3':
-            s3_config = config['s3_config']
             s3_client = boto3.client('s3')
-            response = s3_client.list_objects_v2(Bucket=s3_config['bucket_name'], Prefix=s3_config['total_results_prefix'])
-            if 'Contents' not in response:
-                raise FileNotFoundError
-
-            all_master_files = [
-                obj['Key'] for obj in response['Contents']
-                if obj['Key'].split('/')[-1].startswith(s3_config['master_file_prefix']) and obj['Key'].endswith('.json')
-            ]
-            if not all_master_files:
-                raise FileNotFoundError
-            master_file_to_read = max(all_master_files)
-
-            obj = s3_client.get_object(Bucket=s3_config['bucket_name'], Key=master_file_to_read)
-            json_bytes = obj['Body'].read()
-            df = pd.read_json(BytesIO(json_bytes))
-
-        else:  # local mode
-            local_config = config['local_config']
-            total_dir = local_config['total_dir']
-            if not os.path.exists(total_dir):
-                raise FileNotFoundError
-
-            all_master_files = [
-                f for f in os.listdir(total_dir)
-                if f.startswith(local_config['master_file_prefix']) and f.endswith('.json')
-            ]
-            if not all_master_files:
-                raise FileNotFoundError
-            master_file_to_read = max(all_master_files)
-
-            df = pd.read_json(os.path.join(total_dir, master_file_to_read))
-
-        print(f"마스터 파일 '{master_file_to_read}'에서 ID 목록을 추출합니다.")
-        if 'naver_id' not in df.columns:
-            raise ValueError("'naver_id' 컬럼 없음")
-
-        id_set = set(pd.to_numeric(df['naver_id'], errors='coerce').dropna().astype(int))
-        print(f"ID 목록 로딩 완료. 총 {len(id_set)}개의 고유 ID를 불러왔습니다.")
-        return id_set
-
-    except FileNotFoundError:
-        print("정보: 통합 마스터 파일이 없어 빈 ID 목록으로 시작합니다.")
-        return set()
+            master_key = _find_latest_master(storage_mode, config, s3_client)
+            if master_key is None:
+                print("정보: 통합 마스터 파일이 없습니다.")
+                return pd.DataFrame()
+            obj = s3_client.get_object(Bucket=config['s3_config']['bucket_name'], Key=master_key)
+            df = pd.read_json(BytesIO(obj['Body'].read()))
+        else:
+            master_path = _find_latest_master(storage_mode, config)
+            if master_path is None:
+                print("정보: 통합 마스터 파일이 없습니다.")
+                return pd.DataFrame()
+            master_key = master_path
+            df = pd.read_json(master_path)
+
+        print(f"마스터 파일 '{master_key}' 로딩 완료. ({len(df)}건)")
+        return df
     except Exception as e:
         print(f"오류: 마스터 데이터 로딩 실패. {e}")
-        return set()
\ No newline at end of file
+        return pd.DataFrame()
+
+
+def save_master_data(master_df: pd.DataFrame, storage_mode, config) -> str:
+    """
+    마스터 DataFrame을 새 타임스탬프 파일로 저장하고, 이전 마스터 파일은 삭제합니다.
+    저장된 로컬 경로 또는 S3 키를 반환합니다.
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    if storage_mode == 's3':
+        s3_config = config['s3_config']
+        s3_client = boto3.client('s3')
+        total_prefix = s3_config['total_results_prefix']
+        master_prefix = s3_config['master_file_prefix']
+        new_master_key = f"{total_prefix}{master_prefix}_{timestamp}.json"
+
+        response = s3_client.list_objects_v2(Bucket=s3_config['bucket_name'], Prefix=total_prefix)
+        for obj in response.get('Contents', []):
+            if obj['Key'].split('/')[-1].startswith(master_prefix):
+                s3_client.delete_object(Bucket=s3_config['bucket_name'], Key=obj['Key'])
+
+        json_bytes = master_df.to_json(orient='records', force_ascii=False).encode('utf-8')
+        s3_client.put_object(Bucket=s3_config['bucket_name'], Key=new_master_key, Body=json_bytes)
+        print(f"새 통합 파일 생성: s3://{s3_config['bucket_name']}/{new_master_key}")
+        return new_master_key
+
+    local_config = config['local_config']
+    total_dir = local_config['total_dir']
+    master_prefix = local_config['master_file_prefix']
+    os.makedirs(total_dir, exist_ok=True)
+    new_master_filepath = os.path.join(total_dir, f"{master_prefix}_{timestamp}.json")
+
+    for old_file in os.listdir(total_dir):
+        if old_file.startswith(master_prefix):
+            os.remove(os.path.join(total_dir, old_file))
+
+    master_df.to_json(new_master_filepath, orient='records', force_ascii=False, indent=4)
+    print(f"새 통합 파일 생성: {new_master_filepath}")
+    return new_master_filepath
+
+
+def _save_dated_json(result_df: pd.DataFrame, storage_mode, config, file_name: str, local_dir: str, s3_prefix: str) -> str:
+    """YYYY-MM/YYYY-MM-DD 날짜 폴더 아래에 JSON 파일을 저장하고, 로컬 경로 또는 S3 키를 반환합니다."""
+    now = datetime.now()
+    if storage_mode == 's3':
+        s3_config = config['s3_config']
+        s3_client = boto3.client('s3')
+        date_path = now.strftime('%Y-%m/%Y-%m-%d')
+        final_s3_key = f"{s3_prefix}{date_path}/{file_name}"
+        json_buffer = result_df.to_json(orient='records', force_ascii=False, indent=4)
+        s3_client.put_object(Bucket=s3_config['bucket_name'], Key=final_s3_key, Body=json_buffer, ContentType='application/json')
+        return final_s3_key
+
+    date_path = now.strftime(os.path.join('%Y-%m', '%Y-%m-%d'))
+    output_path = os.path.join(local_dir, date_path)
+    os.makedirs(output_path, exist_ok=True)
+    final_local_path = os.path.join(output_path, file_name)
+    result_df.to_json(final_local_path, orient='records', force_ascii=False, indent=4)
+    return final_local_path
+
+
+def save_results_file(result_df: pd.DataFrame, storage_mode, config, file_name: str) -> str:
+    """
+    개별 결과 파일을 results/ 아래 날짜 폴더에 저장합니다. (통합 배치 작업의 입력이 됩니다)
+    저장된 로컬 경로 또는 S3 키를 반환합니다.
+    """
+    return _save_dated_json(
+        result_df, storage_mode, config, file_name,
+        local_dir=config.get('local_config', {}).get('output_dir', 'results'),
+        s3_prefix=config.get('s3_config', {}).get('output_results_prefix', 'results/'),
+    )
+
+
+def save_filtered_file(filtered_df: pd.DataFrame, storage_mode, config, file_name: str) -> str:
+    """
+    사전 필터에서 제외된 매장 목록을 filtered/ 아래 날짜 폴더에 저장합니다.
+    results/와 분리되어 있어 통합 배치 작업(마스터 데이터)에는 포함되지 않습니다.
+    """
+    return _save_dated_json(
+        filtered_df, storage_mode, config, file_name,
+        local_dir=config.get('local_config', {}).get('filtered_dir', 'filtered'),
+        s3_prefix=config.get('s3_config', {}).get('filtered_results_prefix', 'filtered/'),
+    )
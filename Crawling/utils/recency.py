@@ -0,0 +1,112 @@
+# 저장된 review_info의 방문일로부터 시간이 지나면 값이 변하는 필드(running_well 등)를
+# 마스터 데이터 전체에 대해 한 번에 다시 계산합니다.
+# 크롤링 시점의 datetime.now() 기준으로 한 번만 계산된 값은 시간이 지나면 맞지 않게 되므로,
+# 데이터 통합(batch_consolidate.py) 단계에서 재크롤링 없이 최신 상태로 맞춰 줍니다.
+#
+# running_well 기준 (크롤러와 동일)
+#  - 3: 최근 2주 이내 방문 리뷰 존재
+#  - 2: 최근 1개월 이내 방문 리뷰 존재
+#  - 1: 최근 3개월 이내 방문 리뷰 존재
+#  - 0: 최근 3개월 이내 방문 리뷰 없음 (또는 리뷰 없음)
+#
+# 리뷰 섹션을 수집하지 않은(minimal 프로필, 수집 실패) 레코드도 review_info가 빈 리스트로 저장되므로,
+# 빈 review_info는 리뷰 섹션이 정상 수집된 경우(section_status['reviews'] == 'ok')에만 '리뷰 없음'으로 봅니다.
+
+import ast
+import json
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .crawl_profiles import SECTION_OK, parse_section_status
+from .is_within_date import parse_date
+
+RUNNING_WELL_THRESHOLDS = [(14, 3), (30, 2), (90, 1)]
+
+
+def _as_review_list(value):
+    """review_info 값(리스트 또는 문자열)을 리스트로 변환합니다. 알 수 없는 값은 None."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        for loader in (json.loads, ast.literal_eval):
+            try:
+                parsed = loader(value)
+                if isinstance(parsed, list):
+                    return parsed
+            except (ValueError, SyntaxError):
+                continue
+    return None
+
+
+def _parse_dates(date_values: pd.Series) -> np.ndarray:
+    """크롤러가 저장한 'YYYY-MM-DD' 형식은 벡터 연산으로, 나머지는 parse_date로 변환합니다."""
+    parsed = pd.to_datetime(date_values, format="%Y-%m-%d", errors="coerce")
+    leftover = parsed.isna() & date_values.notna()
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(date_values[leftover].map(parse_date), errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[D]")
+
+
+def recompute_recency_fields(df: pd.DataFrame, today: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    review_info 방문일 기준으로 running_well, latest_review_date를 다시 계산해 반환합니다.
+    방문 리뷰가 있거나 리뷰 섹션이 정상 수집된 레코드만 다시 계산하고,
+    리뷰 섹션을 수집하지 않았거나 실패한 레코드는 기존 값(None 포함)을 유지합니다.
+    """
+    if df is None or df.empty or "review_info" not in df.columns:
+        return df
+
+    df = df.copy()
+    today_d = np.datetime64((today or datetime.now()).strftime("%Y-%m-%d"), "D")
+    reviews = df["review_info"].map(_as_review_list)
+    if "section_status" in df.columns:
+        reviews_ok = df["section_status"].map(lambda v: parse_section_status(v).get("reviews") == SECTION_OK).to_numpy(dtype=bool)
+    else:
+        reviews_ok = np.zeros(len(df), dtype=bool)
+    known = reviews.map(bool).to_numpy(dtype=bool) | (reviews.notna().to_numpy() & reviews_ok)
+
+    # 1. 모든 매장의 방문일을 하나의 배열로 펼치기 (owner: 해당 방문일이 속한 행 위치)
+    owners, raw_dates = [], []
+    for pos, items in enumerate(reviews):
+        if not items:
+            continue
+        for item in items:
+            if isinstance(item, dict) and item.get("date"):
+                owners.append(pos)
+                raw_dates.append(item["date"])
+
+    # 2. 날짜 차이(일 단위)를 한 번에 계산하고, 미래 날짜(잘못 파싱된 값)는 제외
+    n = len(df)
+    min_age = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    latest = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+    if raw_dates:
+        owners_arr = np.asarray(owners, dtype=np.int64)
+        dates = _parse_dates(pd.Series(raw_dates, dtype=object))
+        age = (today_d - dates).astype(np.int64)
+        valid = ~np.isnat(dates) & (age >= 0)
+        np.minimum.at(min_age, owners_arr[valid], age[valid])
+        has_date = min_age != np.iinfo(np.int64).max
+        latest[has_date] = today_d - min_age[has_date].astype("timedelta64[D]")
+
+    # 3. 경과 일수 구간별로 running_well 결정
+    running_well = np.zeros(n, dtype=np.int64)
+    for max_days, score in reversed(RUNNING_WELL_THRESHOLDS):
+        running_well[min_age <= max_days] = score
+
+    old_running_well = pd.to_numeric(df["running_well"], errors="coerce").to_numpy() if "running_well" in df.columns else np.full(n, np.nan)
+    new_running_well = np.where(known, running_well, old_running_well)
+    changed = int((known & (new_running_well != old_running_well)).sum())
+
+    df["running_well"] = pd.array(new_running_well, dtype="Int64") if np.isnan(new_running_well.astype(float)).any() else new_running_well.astype(np.int64)
+    latest_str = pd.Series(latest).dt.strftime("%Y-%m-%d").where(~np.isnat(latest), None)
+    if "latest_review_date" in df.columns:
+        df["latest_review_date"] = np.where(known, latest_str, df["latest_review_date"])
+    else:
+        df["latest_review_date"] = np.where(known, latest_str, None)
+    df.loc[known, "recency_updated_at"] = today_d.astype(str)
+
+    print(f"최신성 필드 재계산 완료: {int(known.sum())}건 계산, running_well 변경 {changed}건.")
+    return df
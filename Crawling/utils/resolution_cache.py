@@ -0,0 +1,151 @@
+# 타겟 크롤링(/pipeline/target-run)에서 (가게명, 주소, 좌표) → naver_id 매칭 결과를 저장하는 캐시입니다.
+# 기존에는 지난주에 찾았던 매장도 매번 네이버 검색 → 후보 목록 매칭을 처음부터 다시 했습니다.
+#
+#  - 키: 정규화한 가게명. 같은 이름 아래에 매장별(naver_id) 주소/좌표/매칭 신뢰도를 저장합니다.
+#  - 조회: 요청 주소 토큰이 모두 포함되고, 좌표가 있으면 max_distance_m 이내이며, 신뢰도가 min_confidence 이상인
+#          매장이 정확히 하나일 때만 적중으로 봅니다. (같은 이름의 다른 지점이 남으면 검색으로 진행)
+#  - 마스터 파일의 매장으로 미리 채워두며(seed), 최신 마스터가 바뀐 경우에만 다시 채웁니다.
+#  - JSON 파일로 저장되어 서버를 재시작해도 유지됩니다.
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .candidate_matcher import normalize_candidate_name
+from .haversine import haversine
+from .master_loader import find_latest_master_key, load_master_data
+
+logger = logging.getLogger(__name__)
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if pd.isna(value) else value
+
+
+class ResolutionCache:
+    """정규화한 가게명 → [{naver_id, address, query_address, latitude, longitude, confidence, source, resolved_at}]"""
+
+    def __init__(self, path: Optional[str], min_confidence: float = 0.9, max_distance_m: float = 3000):
+        self.path = path
+        self.min_confidence = min_confidence
+        self.max_distance_m = max_distance_m
+        self._lock = threading.Lock()
+        self.entries: Dict[str, List[Dict]] = {}
+        self.seeded_from: Optional[str] = None
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+                self.entries = payload.get("entries", {})
+                self.seeded_from = payload.get("seeded_from")
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"매칭 캐시를 읽지 못해 비어 있는 캐시로 시작합니다: {e}")
+
+    def lookup(self, name: str, address: str, latitude: float = None, longitude: float = None) -> Optional[Dict]:
+        """조건을 만족하는 매장이 하나뿐이면 해당 항목을, 아니면 None을 반환합니다."""
+        address_tokens = (address or "").split()
+        lat, lon = _to_float(latitude), _to_float(longitude)
+        matches = {}
+        for entry in self.entries.get(normalize_candidate_name(name), []):
+            if entry.get("confidence", 0) < self.min_confidence:
+                continue
+            known_address = f"{entry.get('address') or ''} {entry.get('query_address') or ''}"
+            if not all(token in known_address for token in address_tokens):
+                continue
+            if lat is not None and lon is not None and entry.get("latitude") is not None and entry.get("longitude") is not None:
+                if haversine(lat, lon, entry["latitude"], entry["longitude"]) > self.max_distance_m:
+                    continue
+            matches[entry["naver_id"]] = entry
+        return next(iter(matches.values())) if len(matches) == 1 else None
+
+    def put(self, name: str, naver_id, address: str = None, latitude=None, longitude=None,
+            confidence: float = 1.0, source: str = "crawl", query_address: str = None):
+        """매칭 결과를 기록합니다. 같은 이름 아래 같은 naver_id가 있으면 새 값으로 교체합니다."""
+        key = normalize_candidate_name(name)
+        if not key or naver_id is None:
+            return
+        entry = {
+            "naver_id": int(naver_id),
+            "address": address or "",
+            "query_address": query_address or "",
+            "latitude": _to_float(latitude),
+            "longitude": _to_float(longitude),
+            "confidence": round(float(confidence), 4),
+            "source": source,
+            "resolved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with self._lock:
+            bucket = [e for e in self.entries.get(key, []) if e.get("naver_id") != entry["naver_id"]]
+            bucket.append(entry)
+            self.entries[key] = bucket
+
+    def invalidate(self, name: str, naver_id):
+        """열리지 않는 매장(폐업 등)을 캐시에서 제거합니다."""
+        key = normalize_candidate_name(name)
+        with self._lock:
+            bucket = [e for e in self.entries.get(key, []) if e.get("naver_id") != int(naver_id)]
+            if bucket:
+                self.entries[key] = bucket
+            else:
+                self.entries.pop(key, None)
+
+    def seed_from_master(self, master_df: pd.DataFrame, master_key: str = None) -> int:
+        """
+        마스터 매장(name, address, gps 좌표)을 신뢰도 1.0으로 채웁니다.
+        크롤링으로 찾은 항목은 덮어쓰지 않으며, 추가된 항목 수를 반환합니다.
+        """
+        added = 0
+        if not master_df.empty and {'naver_id', 'name'}.issubset(master_df.columns):
+            known = {(key, e.get("naver_id")) for key, bucket in self.entries.items() for e in bucket}
+            for row in master_df.to_dict('records'):
+                naver_id = _to_float(row.get('naver_id'))
+                key = normalize_candidate_name(row.get('name'))
+                if naver_id is None or not key or (key, int(naver_id)) in known:
+                    continue
+                self.put(row.get('name'), int(naver_id), address=row.get('address'),
+                         latitude=row.get('gps_latitude'), longitude=row.get('gps_longitude'), source="master")
+                added += 1
+        self.seeded_from = master_key
+        return added
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"seeded_from": self.seeded_from, "entries": self.entries}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def load_resolution_cache(storage_mode, config) -> Optional[ResolutionCache]:
+    """
+    config.yaml의 resolution_cache 설정으로 캐시를 열고, 최신 마스터가 바뀌었으면 마스터 매장으로 다시 채웁니다.
+    비활성화되어 있으면 None을 반환합니다.
+    """
+    cfg = config.get('resolution_cache') or {}
+    if not cfg.get('enabled', True):
+        return None
+    cache_file = cfg.get('cache_file', 'resolution_cache.json')
+    cache = ResolutionCache(
+        os.path.join(config.get('data_dir', 'data'), cache_file) if cache_file else None,
+        min_confidence=cfg.get('min_confidence', 0.9),
+        max_distance_m=cfg.get('max_distance_m', 3000),
+    )
+
+    master_key = find_latest_master_key(storage_mode, config)
+    if master_key and master_key != cache.seeded_from:
+        added = cache.seed_from_master(load_master_data(storage_mode, config), master_key)
+        print(f"매칭 캐시를 마스터 '{master_key}'로 채웠습니다. (신규 {added}건)")
+        cache.save()
+    return cache
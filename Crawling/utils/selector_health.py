@@ -0,0 +1,141 @@
+# 크롤러가 기다리는 선택자(난독화된 클래스명 포함: nZapA, E2jtL, mlywZ, FYvSc 등)의 성공/시간 초과 통계를 모으는 레지스트리입니다.
+# 네이버가 새 빌드를 배포해 클래스명이 바뀌면, 기존에는 모든 매장이 깨진 선택자마다 timeout을 끝까지 기다렸습니다.
+#
+#  - WaitStrategy.for_selector/for_xpath가 대기 결과를 선택자 단위로 기록합니다. (프로세스 전체에서 공유, 스레드 안전)
+#  - 같은 선택자가 degrade_after번 연속으로 시간 초과되면 '저하(degraded)' 상태가 되어,
+#    이후 대기 시간은 degraded_timeout(기본 0.3초)으로 줄어듭니다. 섹션도 저하로 표시됩니다.
+#  - 저하 상태에서도 짧게 확인은 계속하므로, 요소가 다시 잡히면 바로 정상 상태로 돌아옵니다.
+#  - 요소가 짧은 대기 안에 잡히지 않는 느린 페이지도 있으므로, 저하 상태가 된 뒤 probe_after_s(기본 60초)가 지날 때마다
+#    대기 한 번은 원래 대기 시간을 모두 씁니다(probe). 성공하면 정상 상태로 돌아오고, 실패하면 다음 probe까지 저하 상태를 유지합니다.
+#  - 통계는 실행(run) 단위입니다. begin_run()이 진행 중인 다른 실행이 없을 때 통계를 비우므로,
+#    이전 실행의 저하 상태가 다음 실행으로 넘어가지 않습니다. (마지막 실행의 통계는 끝난 뒤에도 조회 가능)
+#  - 실행 종료 시 로그와 API(/admin/selector-health)로 선택자별 상태를 확인할 수 있습니다.
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+DEFAULT_DEGRADE_AFTER = 5
+DEFAULT_DEGRADED_TIMEOUT = 0.3
+DEFAULT_PROBE_AFTER_S = 60.0
+
+
+class SelectorHealthRegistry:
+    def __init__(self, degrade_after: int = DEFAULT_DEGRADE_AFTER, degraded_timeout: float = DEFAULT_DEGRADED_TIMEOUT,
+                 probe_after_s: float = DEFAULT_PROBE_AFTER_S):
+        self.degrade_after = degrade_after
+        self.degraded_timeout = degraded_timeout
+        self.probe_after_s = probe_after_s
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._next_probe: Dict[str, float] = {}  # {선택자: 다음 probe를 허용할 time.monotonic() 값}
+        self._active_runs = 0
+
+    def configure(self, degrade_after: Optional[int] = None, degraded_timeout: Optional[float] = None,
+                  probe_after_s: Optional[float] = None, **_):
+        """config.yaml의 selector_health 섹션으로 기준값을 바꿉니다."""
+        if degrade_after is not None:
+            self.degrade_after = max(1, int(degrade_after))
+        if degraded_timeout is not None:
+            self.degraded_timeout = max(0.0, float(degraded_timeout))
+        if probe_after_s is not None:
+            self.probe_after_s = max(0.0, float(probe_after_s))
+
+    def begin_run(self):
+        """실행(파이프라인 작업, 갱신 등) 시작 시 호출합니다. 진행 중인 다른 실행이 없으면 이전 통계를 비웁니다."""
+        with self._lock:
+            if self._active_runs == 0:
+                self._stats = {}
+                self._next_probe = {}
+            self._active_runs += 1
+
+    def end_run(self):
+        with self._lock:
+            self._active_runs = max(0, self._active_runs - 1)
+
+    def timeout_for(self, selector: str, timeout: float) -> float:
+        """
+        선택자가 저하 상태면 줄인 대기 시간을, 아니면 원래 대기 시간을 반환합니다.
+        저하 상태라도 probe_after_s가 지났으면 이 대기 한 번(probe)은 원래 대기 시간을 씁니다. (동시에 한 번만)
+        """
+        with self._lock:
+            stats = self._stats.get(selector)
+            if not (stats and stats["degraded"]):
+                return timeout
+            now = time.monotonic()
+            if now >= self._next_probe.get(selector, 0.0):
+                self._next_probe[selector] = now + self.probe_after_s
+                stats["probes"] += 1
+                return timeout
+        return min(timeout, self.degraded_timeout)
+
+    def record(self, selector: str, ok: bool, elapsed: float, label: str = "", section: Optional[str] = None):
+        """대기 결과를 기록하고, 연속 실패 횟수에 따라 저하 상태를 갱신합니다."""
+        with self._lock:
+            stats = self._stats.setdefault(selector, {
+                "selector": selector, "label": label, "section": section,
+                "successes": 0, "timeouts": 0, "consecutive_timeouts": 0,
+                "degraded": False, "probes": 0, "waited_s": 0.0, "last_success": None, "last_timeout": None,
+            })
+            stats["waited_s"] += elapsed
+            now = time.strftime("%Y-%m-%d %H:%M:%S")
+            if ok:
+                stats["successes"] += 1
+                stats["consecutive_timeouts"] = 0
+                stats["degraded"] = False
+                stats["last_success"] = now
+                self._next_probe.pop(selector, None)
+            else:
+                stats["timeouts"] += 1
+                stats["consecutive_timeouts"] += 1
+                stats["last_timeout"] = now
+                if not stats["degraded"] and stats["consecutive_timeouts"] >= self.degrade_after:
+                    stats["degraded"] = True
+                    # 저하 직후에는 probe_after_s 동안 짧은 대기만 사용
+                    self._next_probe[selector] = time.monotonic() + self.probe_after_s
+
+    def is_degraded(self, selector: str) -> bool:
+        stats = self._stats.get(selector)
+        return bool(stats and stats["degraded"])
+
+    def degraded_sections(self) -> List[str]:
+        with self._lock:
+            return sorted({s["section"] or s["label"] for s in self._stats.values() if s["degraded"]})
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """선택자별 통계 (저하 상태가 먼저, 그다음 시간 초과가 많은 순)"""
+        with self._lock:
+            rows = [dict(s, waited_s=round(s["waited_s"], 2)) for s in self._stats.values()]
+        return sorted(rows, key=lambda s: (not s["degraded"], -s["timeouts"]))
+
+    def summary(self) -> Dict[str, Any]:
+        rows = self.snapshot()
+        return {
+            "tracked": len(rows),
+            "degraded": [{"label": s["label"], "selector": s["selector"], "section": s["section"]} for s in rows if s["degraded"]],
+            "degraded_sections": self.degraded_sections(),
+            "timeouts": sum(s["timeouts"] for s in rows),
+        }
+
+    def log_report(self, printer=print):
+        """실행 종료 시 선택자 상태를 출력합니다. 저하된 선택자가 있으면 마크업 변경을 의심할 수 있습니다."""
+        rows = self.snapshot()
+        if not rows:
+            return
+        degraded = [s for s in rows if s["degraded"]]
+        printer(f"🩺 선택자 상태: 추적 {len(rows)}개, 저하 {len(degraded)}개")
+        for s in rows:
+            if s["degraded"] or s["timeouts"]:
+                state = "저하" if s["degraded"] else "정상"
+                printer(f"  - [{state}] {s['label']} ({s['section'] or '-'}) '{s['selector']}': "
+                        f"성공 {s['successes']}회 / 시간 초과 {s['timeouts']}회 (연속 {s['consecutive_timeouts']}회), "
+                        f"probe {s['probes']}회, 대기 {s['waited_s']}s")
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._next_probe = {}
+
+
+# 프로세스 전체에서 공유하는 레지스트리 (크롤러 인스턴스/스레드가 달라도 같은 통계를 사용)
+selector_health = SelectorHealthRegistry()
@@ -0,0 +1,184 @@
+# 상세 페이지의 메뉴/리뷰/데이터랩(홈 탭) 영역을 스크립트 한 번으로 추출하는 모듈입니다.
+# 기존에는 li마다, 그리고 li 안의 이름/설명/가격마다 find_element를 호출해 매장 하나에 수백 번의
+# WebDriver 왕복이 발생했습니다. 여기서는 탭별로 JS가 전체 구조를 JSON으로 만들어 한 번에 반환하고,
+# 파이썬에서는 store_dict 필드로 변환만 합니다. (선택자는 기존 DOM 수집 코드와 동일)
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from .is_within_date import compute_running_well, parse_date
+
+# 메뉴 탭: 스마트주문 구조와 기본 구조를 모두 처리
+MENU_EXTRACT_JS = r"""
+const text = (el) => el ? el.textContent.trim() : null;
+const items = [];
+if (document.querySelector('div.order_list_wrap.order_list_category.store_delivery')) {
+    document.querySelectorAll('div.info_detail').forEach(block => {
+        const name = text(block.querySelector('div.tit'));
+        if (!name) return;
+        items.push({
+            name: name,
+            intro: (text(block.querySelector('span.detail_txt')) || '').replace(/\\\//g, '/'),
+            price: text(block.querySelector('div.price')),
+            is_representative: !!block.querySelector('span.menu_tag.default'),
+        });
+    });
+    return {layout: 'smart_order', items: items};
+}
+document.querySelectorAll('div.place_section_content > ul > li.E2jtL').forEach(li => {
+    const name = text(li.querySelector('span.lPzHi'));
+    if (!name) return;
+    items.push({
+        name: name,
+        intro: text(li.querySelector('div.kPogF')),
+        price: text(li.querySelector('div.GXS1X')),
+        is_representative: text(li.querySelector('span.QM_zp > span.place_blind')) === '대표',
+    });
+});
+return {layout: 'default', items: items};
+"""
+
+# 리뷰 탭: 리뷰 키워드(선택 인원 수)와 방문자 리뷰(방문일 텍스트, 댓글)
+REVIEW_EXTRACT_JS = r"""
+const keywords = {};
+document.querySelectorAll('li.MHaAm').forEach(item => {
+    const category = item.querySelector('span.t3JSf');
+    const score = item.querySelector('span.CUoLy');
+    if (!category) return;
+    const scoreText = score ? score.textContent.replace('이 키워드를 선택한 인원', '').trim() : '';
+    keywords[category.textContent.trim().replace(/"/g, '')] = /^\d+$/.test(scoreText) ? parseInt(scoreText, 10) : 0;
+});
+
+// XPath './/span[contains(text(), "방문일")]/following-sibling::span'과 동일하게 span의 직접 텍스트만 비교
+const ownText = (el) => [...el.childNodes].filter(n => n.nodeType === 3).map(n => n.textContent).join('');
+const reviews = [];
+document.querySelectorAll('li.place_apply_pui').forEach(li => {
+    const label = [...li.querySelectorAll('span')].find(s => ownText(s).includes('방문일'));
+    if (!label) return;
+    let dateSpan = label.nextElementSibling;
+    while (dateSpan && dateSpan.tagName !== 'SPAN') dateSpan = dateSpan.nextElementSibling;
+    if (!dateSpan) return;
+    const comment = [...li.querySelectorAll('div.pui__vn15t2 a')]
+        .map(a => a.textContent.trim()).filter(t => t).join(' ')
+        .replace(/\n/g, ' ').replace(/더보기/g, '').trim();
+    reviews.push({date_text: dateSpan.textContent.trim(), comment: comment});
+});
+return {keywords: keywords, reviews: reviews};
+"""
+
+# 홈 탭 데이터랩: 테마키워드, 연령별 점수, 성별 비율
+DATALAB_EXTRACT_JS = r"""
+const section = document.querySelector('div.place_section.I_y6k');
+if (!section) return {has_datalab: false};
+
+const themes = {'분위기': [], '인기토픽': [], '찾는목적': []};
+const themeItems = document.querySelectorAll('div.WXrhH ul.v4tIa > li');
+themeItems.forEach(li => {
+    const main = li.querySelector('.pNnVF');
+    const category = main ? main.textContent.trim() : '';
+    if (!(category in themes)) return;
+    li.querySelectorAll('span.sJgQj > span').forEach(s => {
+        const keyword = s.textContent.replace(/,/g, '').trim();
+        if (keyword) themes[category].push(keyword);
+    });
+});
+
+const ages = [...document.querySelectorAll('#bar_chart_container > ul.Pu5eW > li.JkrLe')]
+    .map(li => { const v = li.querySelector('span.NwNob'); return v ? v.textContent.trim() : ''; });
+
+const donut = document.querySelector('#_datalab_chart_donut1_0');
+const genderText = (target) => {
+    const el = donut ? donut.querySelector(`g.c3-target-${target} text`) : null;
+    return el ? el.textContent.trim() : null;
+};
+
+return {
+    has_datalab: true,
+    has_themes: !!document.querySelector('div.WXrhH'),
+    themes: themes,
+    has_age: !!document.querySelector('div.gZ4G4'),
+    ages: ages,
+    male: genderText('male'),
+    female: genderText('female'),
+};
+"""
+
+# 연령별 차트가 그려졌는지 확인 (li 6개 = 10대~60대)
+AGE_CHART_READY_JS = "return document.querySelectorAll('#bar_chart_container > ul.Pu5eW > li.JkrLe span.NwNob').length >= 6;"
+
+
+def menu_items_from_payload(payload: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return list((payload or {}).get("items") or [])
+
+
+def review_fields_from_payload(payload: Optional[Dict[str, Any]], max_reviews: int = 5) -> Dict[str, Any]:
+    """REVIEW_EXTRACT_JS 결과를 review_category, review_info, running_well로 변환합니다."""
+    payload = payload or {}
+    review_info = []
+    for review in payload.get("reviews") or []:
+        parsed_date = parse_date(review.get("date_text") or "")
+        if parsed_date:
+            date_str = parsed_date.strftime("%Y-%m-%d") if isinstance(parsed_date, (datetime, date)) else str(parsed_date)
+            review_info.append({"date": date_str, "comment": review.get("comment") or ""})
+    review_info = sorted(review_info, key=lambda x: x["date"], reverse=True)[:max_reviews]
+
+    visit_dates = []
+    for item in review_info:
+        try:
+            visit_dates.append(datetime.strptime(item["date"], "%Y-%m-%d").date())
+        except ValueError:
+            continue
+
+    return {
+        "review_category": payload.get("keywords") or {},
+        "review_info": review_info,
+        "running_well": compute_running_well(visit_dates),
+    }
+
+
+def _age_2030_score(ages: List[str]) -> Optional[int]:
+    """20대, 30대 점수가 둘 다 1 또는 2면 2, 하나만 해당하면 1, 아니면 0. (li 6개 미만이면 데이터 부족으로 0)"""
+    if len(ages) < 6:
+        return 0
+    scores = [int(a) if str(a).isdigit() else 0 for a in ages[:6]]
+    score_20, score_30 = scores[1], scores[2]
+    if score_20 in (1, 2) and score_30 in (1, 2):
+        return 2
+    if score_20 in (1, 2) or score_30 in (1, 2):
+        return 1
+    return 0
+
+
+def _percent(text) -> int:
+    try:
+        return round(float(text), 0) if str(text).replace(".", "").isdigit() else 0
+    except ValueError:
+        return 0
+
+
+def datalab_fields_from_payload(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """DATALAB_EXTRACT_JS 결과를 테마키워드/연령/성별 필드로 변환합니다. 해당 영역이 없으면 None."""
+    fields: Dict[str, Any] = {
+        "theme_mood": None, "theme_topic": None, "theme_purpose": None,
+        "age-2030": None, "gender-balance": None, "gender_male": None, "gender_female": None,
+    }
+    payload = payload or {}
+    if not payload.get("has_datalab"):
+        return fields
+
+    if payload.get("has_themes"):
+        themes = payload.get("themes") or {}
+        fields["theme_mood"] = themes.get("분위기", [])
+        fields["theme_topic"] = themes.get("인기토픽", [])
+        fields["theme_purpose"] = themes.get("찾는목적", [])
+
+    if payload.get("has_age"):
+        fields["age-2030"] = _age_2030_score(payload.get("ages") or [])
+
+    male_text, female_text = payload.get("male"), payload.get("female")
+    if male_text is not None and female_text is not None:
+        male, female = _percent(male_text), _percent(female_text)
+        fields["gender_male"] = male
+        fields["gender_female"] = female
+        fields["gender-balance"] = (male < 55)
+    return fields
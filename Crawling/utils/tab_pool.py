@@ -0,0 +1,112 @@
+# 하나의 Firefox 인스턴스에서 여러 탭을 열어 페이지 로딩을 동시에 진행시키는 탭 풀입니다.
+# driver.get()은 로딩이 끝날 때까지 블로킹되므로, window.location으로 로딩만 걸어두고
+# 먼저 준비된 탭부터 순서대로 수집합니다. (브라우저 프로세스를 늘리는 것보다 메모리 효율이 좋음)
+
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+# 모든 탭 공통 준비 조건
+# 로딩 시작 직전 이전 문서에 표시(__tabPoolStale)를 남겨, 아직 이전 문서가 보이는 상태를 준비 완료로 오인하지 않게 합니다.
+DEFAULT_READY_JS = "return document.readyState === 'complete' && !window.__tabPoolStale;"
+
+
+class TabPool:
+    def __init__(self, driver, size: int = 3, logger: Optional[logging.Logger] = None,
+                 page_timeout: float = 20.0, poll_interval: float = 0.2):
+        self.driver = driver
+        self.size = max(1, int(size))
+        self.logger = logger or logging.getLogger(__name__)
+        self.page_timeout = page_timeout
+        self.poll_interval = poll_interval
+
+        # 현재 탭을 첫 번째 탭으로 사용하고, 나머지 탭은 새로 엽니다.
+        self.main_handle = driver.current_window_handle
+        self.handles = [self.main_handle]
+        for _ in range(self.size - 1):
+            driver.switch_to.new_window('tab')
+            self.handles.append(driver.current_window_handle)
+        driver.switch_to.window(self.main_handle)
+
+    def _start_load(self, handle: str, url: str):
+        """탭으로 전환 후 로딩을 시작만 하고 바로 반환합니다. (블로킹 없음)"""
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script("window.__tabPoolStale = true; window.location.href = arguments[0];", url)
+
+    def _is_ready(self, handle: str, ready_js: str) -> bool:
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.switch_to.default_content()
+            return bool(self.driver.execute_script(DEFAULT_READY_JS)) and bool(self.driver.execute_script(ready_js))
+        except Exception:
+            return False
+
+    def run(self, items: Iterable[Any], url_fn: Callable[[Any], str], process_fn: Callable[[Any], Any],
+            ready_js: str = DEFAULT_READY_JS) -> Iterator[Tuple[Any, Any]]:
+        """
+        items마다 url_fn(item)을 여러 탭에서 동시에 로딩하고, 준비된 탭부터 process_fn(item)을 실행합니다.
+        process_fn은 해당 탭으로 전환된 상태에서 호출됩니다. 로딩 시간이 초과된 항목은 결과 None으로 반환됩니다.
+        반환: (item, process_fn 결과)를 준비된 순서대로 yield
+        """
+        pending = iter(items)
+        in_flight: Dict[str, Tuple[Any, float]] = {}
+        free_handles = list(self.handles)
+        exhausted = False
+
+        while True:
+            # 1. 빈 탭에 다음 항목 로딩 시작
+            while free_handles and not exhausted:
+                try:
+                    item = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+                handle = free_handles.pop(0)
+                try:
+                    self._start_load(handle, url_fn(item))
+                    in_flight[handle] = (item, time.monotonic())
+                except Exception as e:
+                    self.logger.warning(f"탭 로딩 시작 실패: {e}")
+                    free_handles.append(handle)
+                    yield item, None
+
+            if not in_flight:
+                break
+
+            # 2. 준비된 탭부터 처리
+            progressed = False
+            for handle in list(in_flight.keys()):
+                item, started_at = in_flight[handle]
+                if self._is_ready(handle, ready_js):
+                    try:
+                        result = process_fn(item)
+                    except Exception as e:
+                        self.logger.warning(f"탭 처리 중 오류: {e}")
+                        result = None
+                    del in_flight[handle]
+                    free_handles.append(handle)
+                    progressed = True
+                    yield item, result
+                elif time.monotonic() - started_at > self.page_timeout:
+                    self.logger.warning(f"탭 로딩 시간 초과({self.page_timeout}s): {item}")
+                    del in_flight[handle]
+                    free_handles.append(handle)
+                    progressed = True
+                    yield item, None
+
+            if not progressed:
+                time.sleep(self.poll_interval)
+
+    def close(self):
+        """추가로 연 탭을 닫고 첫 번째 탭으로 돌아갑니다."""
+        for handle in self.handles[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                continue
+        try:
+            self.driver.switch_to.window(self.main_handle)
+        except Exception:
+            pass
+        self.handles = [self.main_handle]
@@ -0,0 +1,149 @@
+# 크롤러의 고정 대기(time.sleep)를 "준비 완료 신호" 기반 대기로 바꾸기 위한 공통 모듈입니다.
+# 조건이 만족되는 즉시 반환하므로 빠른 페이지는 바로 넘어가고, 느린 페이지만 timeout까지 기다립니다.
+#
+# 지원하는 준비 신호
+#  - for_selector     : 특정 요소가 나타날 때까지
+#  - for_apollo_state : window.__APOLLO_STATE__가 채워질 때까지
+#  - for_dom_quiet    : DOM 변경(MutationObserver)이 quiet_ms 동안 없을 때까지
+#  - for_network_idle : 새 네트워크 요청(Resource Timing)이 idle_ms 동안 없을 때까지
+#
+# 각 대기는 실제 소요 시간과 대체한 고정 sleep 시간(baseline)을 함께 기록하며,
+# report()/log_report()로 매장 단위 절약 시간을 확인할 수 있습니다.
+#
+# for_selector/for_xpath에 section을 주면 결과가 선택자 상태 레지스트리(utils/selector_health.py)에 기록되고,
+# 연속으로 시간 초과된(마크업이 바뀐) 선택자는 이후 대기 시간이 짧게 줄어듭니다.
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+from Crawling.utils.selector_health import selector_health
+
+# DOM 변경 시각을 기록하는 MutationObserver를 (한 번만) 설치하고, 마지막 변경 이후 경과 시간(ms)을 반환
+DOM_QUIET_JS = """
+if (!window.__waitObserver) {
+    window.__waitLastMutation = performance.now();
+    window.__waitObserver = new MutationObserver(() => { window.__waitLastMutation = performance.now(); });
+    window.__waitObserver.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__waitLastMutation;
+"""
+
+# 리소스 요청 수와 마지막 응답 완료 이후 경과 시간(ms)을 반환 (요청이 진행 중이면 responseEnd가 0)
+NETWORK_IDLE_JS = """
+const entries = performance.getEntriesByType('resource');
+if (entries.some(e => e.responseEnd === 0)) return [entries.length, 0];
+const last = entries.reduce((m, e) => Math.max(m, e.responseEnd), 0);
+return [entries.length, performance.now() - last];
+"""
+
+APOLLO_READY_JS = "const s = window.__APOLLO_STATE__; return !!s && Object.keys(s).length > 0;"
+
+
+class WaitStrategy:
+    def __init__(self, driver, logger: Optional[logging.Logger] = None, poll_interval: float = 0.1):
+        self.driver = driver
+        self.logger = logger or logging.getLogger(__name__)
+        self.poll_interval = poll_interval
+        self.timings: List[Tuple[str, float, float, bool]] = []  # (label, 실제 대기, 기존 고정 대기, 성공 여부)
+
+    # --- 공통 대기 ---
+    def until(self, label: str, condition: Callable[[], bool], timeout: float, baseline: float = 0.0) -> bool:
+        """condition()이 참이 될 때까지 기다립니다. timeout을 넘기면 False를 반환합니다. (예외를 던지지 않음)"""
+        started = time.monotonic()
+        ok = False
+        while True:
+            try:
+                if condition():
+                    ok = True
+                    break
+            except Exception:
+                pass  # 프레임 전환/페이지 이동 중의 일시적인 스크립트 오류는 무시하고 재시도
+            if time.monotonic() - started >= timeout:
+                break
+            time.sleep(self.poll_interval)
+
+        elapsed = time.monotonic() - started
+        self.timings.append((label, elapsed, baseline, ok))
+        if not ok:
+            self.logger.info(f"⏱️ 대기 시간 초과({timeout}s): {label}")
+        return ok
+
+    def skip(self, label: str, baseline: float):
+        """기다릴 필요가 없어 제거한 고정 대기를 기록합니다."""
+        self.timings.append((label, 0.0, baseline, True))
+
+    # --- 준비 신호별 대기 ---
+    def for_selector(self, label: str, css_selector: str, timeout: float = 10.0, baseline: float = 0.0,
+                     section: Optional[str] = None) -> bool:
+        return self._for_element(label, By.CSS_SELECTOR, css_selector, timeout, baseline, section)
+
+    def for_xpath(self, label: str, xpath: str, timeout: float = 10.0, baseline: float = 0.0,
+                  section: Optional[str] = None) -> bool:
+        return self._for_element(label, By.XPATH, xpath, timeout, baseline, section)
+
+    def _for_element(self, label: str, by: str, selector: str, timeout: float, baseline: float, section: Optional[str]) -> bool:
+        # section이 없는 대기(검색 결과 없음처럼 '없는 것이 정상'인 확인)는 선택자 상태를 추적하지 않음
+        if section is None:
+            return self.until(label, lambda: bool(self.driver.find_elements(by, selector)), timeout, baseline)
+
+        was_degraded = selector_health.is_degraded(selector)
+        effective = selector_health.timeout_for(selector, timeout)
+        if effective < timeout:
+            self.logger.debug(f"🩺 저하된 선택자 대기 단축({timeout}s → {effective}s): {label}")
+        elif was_degraded:
+            self.logger.info(f"🩺 저하된 선택자를 원래 대기 시간({timeout}s)으로 다시 확인합니다(probe): {label}")
+        ok = self.until(label, lambda: bool(self.driver.find_elements(by, selector)), effective, baseline)
+        selector_health.record(selector, ok, self.timings[-1][1], label=label, section=section)
+        if not was_degraded and selector_health.is_degraded(selector):
+            self.logger.warning(f"🩺 선택자 '{selector}'({label}, {section})가 연속 {selector_health.degrade_after}회 시간 초과되어 "
+                                f"저하 상태로 전환합니다. 마크업 변경을 확인하세요.")
+        elif was_degraded and ok:
+            self.logger.info(f"🩺 선택자 '{selector}'({label}, {section})가 다시 잡혀 정상 상태로 돌아옵니다.")
+        return ok
+
+    def for_script(self, label: str, script: str, timeout: float = 10.0, baseline: float = 0.0) -> bool:
+        return self.until(label, lambda: bool(self.driver.execute_script(script)), timeout, baseline)
+
+    def for_apollo_state(self, label: str = "apollo_state", timeout: float = 10.0, baseline: float = 0.0) -> bool:
+        return self.for_script(label, APOLLO_READY_JS, timeout, baseline)
+
+    def for_dom_quiet(self, label: str, quiet_ms: int = 300, timeout: float = 5.0, baseline: float = 0.0) -> bool:
+        return self.until(label, lambda: self.driver.execute_script(DOM_QUIET_JS) >= quiet_ms, timeout, baseline)
+
+    def for_network_idle(self, label: str, idle_ms: int = 500, timeout: float = 10.0, baseline: float = 0.0) -> bool:
+        state = {"count": -1}
+
+        def idle() -> bool:
+            count, since_last = self.driver.execute_script(NETWORK_IDLE_JS)
+            stable = count == state["count"] and since_last >= idle_ms
+            state["count"] = count
+            return stable
+
+        return self.until(label, idle, timeout, baseline)
+
+    # --- 시간 리포트 ---
+    def reset(self):
+        self.timings = []
+
+    def report(self) -> Dict[str, float]:
+        waited = sum(t[1] for t in self.timings)
+        baseline = sum(t[2] for t in self.timings)
+        return {
+            "waits": len(self.timings),
+            "timeouts": sum(1 for t in self.timings if not t[3]),
+            "waited_s": round(waited, 2),
+            "baseline_s": round(baseline, 2),
+            "saved_s": round(baseline - waited, 2),
+        }
+
+    def log_report(self, subject: str = ""):
+        r = self.report()
+        self.logger.info(
+            f"⏱️ 대기 리포트 {subject}: 대기 {r['waits']}회(시간 초과 {r['timeouts']}회), "
+            f"실제 {r['waited_s']}s / 기존 고정 대기 {r['baseline_s']}s → {r['saved_s']}s 절약"
+        )
+        for label, elapsed, baseline, ok in self.timings:
+            self.logger.debug(f"  - {label}: {elapsed:.2f}s (기존 {baseline}s){'' if ok else ' [timeout]'}")
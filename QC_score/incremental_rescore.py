@@ -0,0 +1,232 @@
+# incremental_rescore.py
+# 점수 매핑(score_mapping_54321.json), 핫플레이스/대학가 폴리곤, 신규 핫플레이스 키워드가 바뀌었을 때
+# 전체를 다시 돌리지 않고, 영향을 받는 매장만 찾아 점수를 재계산한 뒤 마스터 데이터에 반영합니다.
+#
+# 영향 매장 판별 기준
+#  - 폴리곤 변경: 변경된(추가/삭제/수정) 폴리곤의 이전/현재 영역 안에 있는 매장 (매장 좌표 STRtree 역색인으로 조회)
+#  - 점수 매핑 변경: 점수가 바뀌었거나 삭제된 라벨을 가진 매장
+#  - 키워드 변경: 추가/삭제된 키워드를 주소에 포함하는 매장
+# 재계산은 LLM 호출 없이 (라벨 점수 갱신 + 위치/Total 점수 재계산) 으로만 수행됩니다.
+
+import ast
+import json
+import sys
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+import pandas as pd
+import yaml
+from shapely import STRtree, wkt
+from shapely.geometry import Point
+
+from Crawling.utils.master_loader import load_master_data, save_master_data, save_results_file
+from QC_score.reference_versions import build_reference_snapshot, load_snapshot_entry, record_reference_snapshot
+from QC_score.score_pipline import apply_location_and_total_score, load_scoring_references
+
+# 재산정이 위치/라벨 점수에 영향을 주는 참조 데이터 종류
+RESCORE_KINDS = ["score_mapping", "hotspot_polygons", "campus_polygons", "new_hot_keywords"]
+
+
+def _parse_ref_versions(value) -> Dict[str, str]:
+    """레코드의 ref_versions 값(딕셔너리 또는 문자열)을 딕셔너리로 변환합니다."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value:
+        for loader in (json.loads, ast.literal_eval):
+            try:
+                parsed = loader(value)
+                if isinstance(parsed, dict):
+                    return parsed
+            except (ValueError, SyntaxError):
+                continue
+    return {}
+
+
+def _changed_polygon_geoms(old_items: Dict, new_items: Dict) -> List:
+    """이전/현재 스냅샷에서 달라진 폴리곤들의 (이전 + 현재) geometry 목록을 반환합니다."""
+    geoms = []
+    for name in set(old_items) | set(new_items):
+        old_item, new_item = old_items.get(name), new_items.get(name)
+        if old_item == new_item:
+            continue
+        for item in (old_item, new_item):
+            if item is None:
+                continue
+            wkt_strs = [v for v in item.values() if v] if isinstance(item, dict) else [item]
+            for wkt_str in wkt_strs:
+                try:
+                    geoms.append(wkt.loads(wkt_str))
+                except Exception:
+                    continue
+    return geoms
+
+
+def _stores_in_geoms(master_df: pd.DataFrame, row_positions: List[int], geoms: List) -> Set[int]:
+    """매장 좌표로 STRtree를 만들고(역색인), 변경 폴리곤 안에 있는 매장의 행 위치를 반환합니다."""
+    if not geoms or not row_positions:
+        return set()
+
+    lats = pd.to_numeric(master_df['gps_latitude'].iloc[row_positions], errors='coerce') if 'gps_latitude' in master_df.columns else None
+    lngs = pd.to_numeric(master_df['gps_longitude'].iloc[row_positions], errors='coerce') if 'gps_longitude' in master_df.columns else None
+    if lats is None or lngs is None:
+        return set()
+
+    points, owners = [], []
+    for pos, lat, lng in zip(row_positions, lats, lngs):
+        if pd.isna(lat) or pd.isna(lng):
+            continue
+        points.append(Point(lng, lat))
+        owners.append(pos)
+    if not points:
+        return set()
+
+    tree = STRtree(points)
+    hit = set()
+    for geom in geoms:
+        for idx in tree.query(geom, predicate='intersects'):
+            hit.add(owners[int(idx)])
+    return hit
+
+
+def _scored_positions(master_df: pd.DataFrame) -> List[int]:
+    if 'Total_점수' not in master_df.columns:
+        return []
+    return [pos for pos, value in enumerate(master_df['Total_점수']) if not pd.isna(value)]
+
+
+def find_affected_stores(master_df: pd.DataFrame, current_snapshot: Dict[str, Dict], data_dir: str) -> Dict[int, Set[str]]:
+    """
+    마스터 데이터에서 참조 데이터 변경의 영향을 받는 매장을 찾습니다.
+    반환값: {행 위치: {영향 사유, ...}}
+    """
+    affected: Dict[int, Set[str]] = {}
+    versions = [_parse_ref_versions(v) for v in master_df.get('ref_versions', pd.Series([None] * len(master_df)))]
+    addresses = master_df['address'].fillna('').astype(str).tolist() if 'address' in master_df.columns else [''] * len(master_df)
+    labels = master_df['메뉴_라벨'].fillna('').astype(str).tolist() if '메뉴_라벨' in master_df.columns else [''] * len(master_df)
+
+    # 점수 산정을 거치지 않은 레코드(네이버/카카오 단계만 실행된 경우 등)는 재산정 대상이 아님
+    scored = set(_scored_positions(master_df))
+
+    def mark(positions, reason):
+        for pos in positions:
+            if pos in scored:
+                affected.setdefault(pos, set()).add(reason)
+
+    for kind in RESCORE_KINDS:
+        current = current_snapshot[kind]
+        # 같은 이전 버전을 가진 매장끼리 묶어서 한 번만 비교
+        groups: Dict[Optional[str], List[int]] = {}
+        for pos, ver in enumerate(versions):
+            old_version = ver.get(kind)
+            if old_version == current["version"]:
+                continue
+            groups.setdefault(old_version, []).append(pos)
+
+        for old_version, positions in groups.items():
+            old_entry = load_snapshot_entry(data_dir, kind, old_version) if old_version else None
+            if old_entry is None:
+                # 버전 기록이 없거나 스냅샷이 없으면 변경분을 알 수 없으므로 보수적으로 재계산
+                mark(positions, f"{kind}:unknown_version")
+                continue
+
+            if kind in ("hotspot_polygons", "campus_polygons"):
+                geoms = _changed_polygon_geoms(old_entry["items"], current["items"])
+                mark(_stores_in_geoms(master_df, positions, geoms), f"{kind}:polygon_changed")
+
+            elif kind == "score_mapping":
+                old_labels, new_labels = old_entry["items"], current["items"]
+                changed_labels = {l for l in set(old_labels) | set(new_labels) if old_labels.get(l) != new_labels.get(l)}
+                mark([pos for pos in positions if labels[pos] in changed_labels], "score_mapping:label_score_changed")
+
+            elif kind == "new_hot_keywords":
+                changed_keywords = set(old_entry["items"]) ^ set(current["items"])
+                mark([pos for pos in positions if any(k in addresses[pos] for k in changed_keywords)], "new_hot_keywords:keyword_changed")
+
+    return affected
+
+
+def rescore_store(store: Dict, refs: Dict, label_scores: Dict[str, float]) -> Dict:
+    """LLM 호출 없이 라벨 점수와 위치/Total 점수를 현재 참조 데이터 기준으로 재계산합니다."""
+    current_store = dict(store)
+    label = current_store.get("메뉴_라벨") or ""
+    if label:
+        if label in label_scores:
+            current_store["메뉴_점수"] = float(label_scores[label])
+        else:
+            # 매핑에서 삭제된 라벨은 '라벨 없음' 규칙(SYSTEM_PROMPT)과 동일하게 처리
+            current_store["메뉴_라벨"] = ""
+            current_store["메뉴_점수"] = 0.0
+            current_store["메뉴_추론근거"] = f"{current_store.get('메뉴_추론근거', '')} [재산정] 라벨 '{label}'이(가) 점수 매핑에서 삭제됨".strip()
+    current_store["메뉴_점수"] = pd.to_numeric(current_store.get("메뉴_점수"), errors='coerce')
+    if pd.isna(current_store["메뉴_점수"]):
+        current_store["메뉴_점수"] = 0.0
+
+    apply_location_and_total_score(current_store, refs)
+    return current_store
+
+
+def run_incremental_rescoring(config: Dict, storage_mode: Optional[str] = None) -> Dict:
+    """
+    마스터 데이터에서 참조 데이터 변경의 영향을 받는 매장만 재계산하고 마스터에 반영합니다.
+    재계산된 레코드는 개별 결과 파일로도 저장되어, 이후 통합 배치 작업에서 덮어써지지 않습니다.
+    반환값: 작업 요약 딕셔너리
+    """
+    storage_mode = storage_mode or config.get('storage_mode', 'local')
+    data_dir = config.get('data_dir', 'data')
+    print(f"증분 재산정 작업을 시작합니다. (스토리지 모드: {storage_mode.upper()})")
+
+    refs = load_scoring_references(data_dir)
+    if refs is None:
+        raise ValueError("점수 산정용 참조 데이터 로딩에 실패했습니다.")
+    current_snapshot = build_reference_snapshot(refs)
+    current_versions = record_reference_snapshot(refs, data_dir)
+
+    master_df = load_master_data(storage_mode, config)
+    if master_df.empty or 'naver_id' not in master_df.columns:
+        print("재산정할 마스터 데이터가 없습니다.")
+        return {"total": 0, "rescored": 0}
+
+    master_df = master_df.reset_index(drop=True)
+    affected = find_affected_stores(master_df, current_snapshot, data_dir)
+    print(f"총 {len(master_df)}건 중 {len(affected)}건이 참조 데이터 변경의 영향을 받습니다.")
+
+    label_scores = current_snapshot["score_mapping"]["items"]
+    records = master_df.to_dict('records')
+    rescored_records = []
+    for pos, reasons in affected.items():
+        updated = rescore_store(records[pos], refs, label_scores)
+        updated["rescore_reasons"] = sorted(reasons)
+        records[pos] = updated
+        rescored_records.append(updated)
+
+    # 비교가 끝난 매장은 변경분이 없더라도 현재 버전으로 검증된 것이므로 버전을 갱신
+    for pos in _scored_positions(master_df):
+        record = records[pos]
+        versions = dict(_parse_ref_versions(record.get("ref_versions")))
+        for kind in RESCORE_KINDS:
+            versions[kind] = current_versions[kind]
+        record["ref_versions"] = versions
+
+    updated_master = pd.DataFrame(records)
+    save_master_data(updated_master, storage_mode, config)
+
+    if rescored_records:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        patch_df = pd.DataFrame(rescored_records)
+        file_name = f"rescore_{timestamp}_{uuid.uuid4().hex[:8]}_{len(patch_df)}.json"
+        saved_path = save_results_file(patch_df, storage_mode, config, file_name)
+        print(f"재산정 결과 파일 저장 완료: {saved_path}")
+
+    print("증분 재산정 작업을 성공적으로 마쳤습니다.")
+    return {"total": len(records), "rescored": len(rescored_records)}
+
+
+if __name__ == '__main__':
+    try:
+        config = yaml.safe_load(open("config.yaml", 'r', encoding='utf-8'))
+        summary = run_incremental_rescoring(config)
+        print(f"재산정 요약: {summary}")
+    except Exception as e:
+        print(f"증분 재산정 중 오류 발생: {e}", file=sys.stderr)
+        raise
@@ -0,0 +1,129 @@
+# reference_versions.py
+# 점수 산정에 사용된 참조 데이터(점수 매핑, 핫플레이스/대학가 폴리곤, 신규 핫플레이스 키워드)의
+# 버전을 계산하고, 버전별 스냅샷을 data_dir/reference_snapshots/ 아래에 저장합니다.
+# 각 점수 레코드는 'ref_versions' 필드에 이 버전들을 기록하며,
+# 증분 재산정(incremental_rescore.py)은 스냅샷끼리 비교해 변경분만 찾아냅니다.
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+SNAPSHOT_DIR_NAME = "reference_snapshots"
+
+# 재산정 대상 판별에 사용되는 참조 데이터 종류
+TRACKED_KINDS = ["category_mapping", "score_mapping", "hotspot_polygons", "campus_polygons", "new_hot_keywords"]
+
+LABEL_KEYS = ("라벨", "메뉴_라벨", "label")
+SCORE_KEYS = ("점수", "메뉴_점수", "score")
+
+
+def _to_score(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_label_scores(score_mapping) -> Dict[str, float]:
+    """
+    score_mapping_54321.json 구조에서 {라벨: 점수} 딕셔너리를 추출합니다.
+    - {"라벨": ..., "점수": ...} 형태의 항목 (리스트/중첩 딕셔너리 어디에 있든 탐색)
+    - {"라벨명": {"점수": ...}} 형태
+    - {"라벨명": 점수} 형태
+    """
+    label_scores: Dict[str, float] = {}
+
+    def walk(node, parent_key=None):
+        if isinstance(node, dict):
+            label = next((node[k] for k in LABEL_KEYS if k in node), None)
+            score = next((node[k] for k in SCORE_KEYS if k in node), None)
+            if score is not None and _to_score(score) is not None:
+                if isinstance(label, str) and label:
+                    label_scores[label.strip()] = _to_score(score)
+                elif isinstance(parent_key, str) and parent_key not in LABEL_KEYS + SCORE_KEYS:
+                    label_scores[parent_key.strip()] = _to_score(score)
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    walk(value, key)
+                elif label is None and score is None and isinstance(key, str) and not isinstance(value, bool) and _to_score(value) is not None:
+                    label_scores[key.strip()] = _to_score(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, parent_key)
+
+    walk(score_mapping)
+    return label_scores
+
+
+def _canonical_hash(payload) -> str:
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def build_reference_snapshot(refs: Dict) -> Dict[str, Dict]:
+    """
+    load_scoring_references()가 반환한 참조 데이터로부터 종류별 스냅샷을 만듭니다.
+    반환값: {kind: {"version": str, "items": ...}}
+    """
+    hotspot_items = {
+        name: {
+            "polygon": poly.wkt,
+            "donut": refs["donut_polys"][name].wkt if name in refs["donut_polys"] else None,
+        }
+        for name, poly in refs["hotspot_polys"].items()
+    }
+    items_by_kind = {
+        "category_mapping": refs["category_mapping"],
+        "score_mapping": extract_label_scores(refs["score_mapping"]),
+        "hotspot_polygons": hotspot_items,
+        "campus_polygons": {name: poly.wkt for name, poly in refs["campus_polys"].items()},
+        "new_hot_keywords": sorted(set(refs["new_hot_keywords"])),
+    }
+
+    snapshot = {}
+    for kind, items in items_by_kind.items():
+        # 점수 매핑은 라벨-점수 외의 내용(키워드 등)이 바뀌어도 버전이 바뀌도록 원본 전체를 해시
+        version_source = refs["score_mapping"] if kind == "score_mapping" else items
+        snapshot[kind] = {"version": _canonical_hash(version_source), "items": items}
+    return snapshot
+
+
+def _snapshot_path(data_dir: str, kind: str, version: str) -> str:
+    return os.path.join(data_dir, SNAPSHOT_DIR_NAME, f"{kind}_{version}.json")
+
+
+def save_snapshot(data_dir: str, snapshot: Dict[str, Dict]) -> None:
+    """아직 저장되지 않은 버전의 스냅샷만 파일로 저장합니다."""
+    os.makedirs(os.path.join(data_dir, SNAPSHOT_DIR_NAME), exist_ok=True)
+    for kind, entry in snapshot.items():
+        path = _snapshot_path(data_dir, kind, entry["version"])
+        if os.path.exists(path):
+            continue
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, indent=2)
+
+
+def load_snapshot_entry(data_dir: str, kind: str, version: str) -> Optional[Dict]:
+    """저장된 특정 버전의 스냅샷을 불러옵니다. 없으면 None."""
+    path = _snapshot_path(data_dir, kind, version)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def record_reference_snapshot(refs: Dict, data_dir: str) -> Dict[str, str]:
+    """
+    현재 참조 데이터의 스냅샷을 저장하고, 레코드에 기록할 {kind: version} 딕셔너리를 반환합니다.
+    스냅샷 저장에 실패해도 점수 산정은 계속 진행됩니다.
+    """
+    snapshot = build_reference_snapshot(refs)
+    try:
+        save_snapshot(data_dir, snapshot)
+    except OSError as e:
+        print(f"경고: 참조 데이터 스냅샷 저장 실패 - {e}")
+    return {kind: entry["version"] for kind, entry in snapshot.items()}
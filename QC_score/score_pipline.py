@@ -10,6 +10,9 @@ import pandas as pd
 from shapely.geometry import Point, Polygon
 from shapely import wkt
 from tqdm import tqdm
+
+from QC_score.reference_versions import record_reference_snapshot
+from Crawling.utils.blue_ribbon import tag_blue_ribbon
 # ----------------------------------------------------------------------
 
 # 1. 매핑 및 예시 JSON 파일 로드 함수
@@ -424,6 +427,153 @@ def calculate_location_score(
     }
 
 
+NEW_HOT_KEYWORDS = ["삼성역", "코엑스", "익선동", "샤로수길", "송리단길", "해방촌", "후암동", "서촌"]
+
+
+def load_scoring_references(data_dir: str) -> Dict:
+    """
+    점수 산정에 필요한 매핑/폴리곤/키워드 참조 데이터를 한 번에 로드합니다.
+    필수 데이터 로딩에 실패하면 None을 반환합니다.
+    """
+    print("점수 산정용 데이터 로딩 시작...")
+    category_mapping = load_json_data(os.path.join(data_dir, 'category_mapping.json'))
+    score_mapping = load_json_data(os.path.join(data_dir, 'score_mapping_54321.json'))
+    hotspot_polys = load_polygons_from_df(os.path.join(data_dir, "seoul_hotspots_polygons.csv"), "location", "polygon_str")
+    campus_polys = load_polygons_from_df(os.path.join(data_dir, "campus_polygons.csv"), "campus_name", "polygon_str")
+
+    # 핫플레이스 인접 영역(Donut) Polygon은 핫플레이스 이름별로 보관 (참조 데이터 버전 추적용)
+    donut_polys = load_polygons_from_df(os.path.join(data_dir, "seoul_hotspots_polygons.csv"), "location", "WKT_Polygon_100m_Donut")
+    if not donut_polys:
+        print("경고: 핫플레이스 인접 영역(Donut) Polygon 로딩 실패", file=sys.stderr)
+
+    if not all([category_mapping, score_mapping, hotspot_polys, campus_polys]):
+        print("오류: 점수 산정에 필요한 데이터 파일 로딩에 실패했습니다.", file=sys.stderr)
+        return None
+
+    return {
+        "category_mapping": category_mapping,
+        "score_mapping": score_mapping,
+        "hotspot_polys": hotspot_polys,
+        "campus_polys": campus_polys,
+        "donut_polys": donut_polys,
+        "new_hot_keywords": list(NEW_HOT_KEYWORDS),
+    }
+
+
+def apply_llm_result(current_store: Dict, llm_result: Optional[Dict]) -> None:
+    """LLM 추론 결과(메뉴 관련 필드)를 current_store에 반영합니다."""
+    if llm_result:
+        current_store["대분류"] = llm_result.get("대분류", "")
+        current_store["중분류"] = llm_result.get("중분류", "")
+        current_store["소분류"] = llm_result.get("소분류", "")
+        current_store["메뉴_라벨"] = llm_result.get("메뉴_라벨", "")
+        try:
+            menu_score_from_llm = float(llm_result.get("메뉴_점수", 0))
+        except (ValueError, TypeError):
+            menu_score_from_llm = 0.0
+        current_store["메뉴_점수"] = menu_score_from_llm
+        current_store["메뉴_추론근거"] = llm_result.get("메뉴_추론근거", "")
+    else:
+        current_store["대분류"] = ""
+        current_store["중분류"] = ""
+        current_store["소분류"] = ""
+        current_store["메뉴_라벨"] = ""
+        current_store["메뉴_점수"] = 0.0
+        current_store["메뉴_추론근거"] = "LLM 분류 중 오류 발생 또는 응답 파싱 실패"
+
+
+def apply_location_and_total_score(current_store: Dict, refs: Dict) -> None:
+    """
+    위치 점수를 계산하고, 메뉴 점수와 추가 조건 점수를 합산한 Total 점수를 current_store에 반영합니다.
+    LLM 호출 없이 동작하므로, 참조 데이터 변경 시 재계산에도 그대로 사용됩니다.
+    """
+    location_result = calculate_location_score(current_store, refs["hotspot_polys"], refs["campus_polys"], refs["new_hot_keywords"])
+
+    # 위치 관련 필드 추가
+    current_store["위치_점수"] = location_result.get("위치_점수", 0.0)
+    current_store["위치_산출근거"] = location_result.get("위치_산출근거", "")
+    current_store["위치_실패사유"] = location_result.get("위치_실패사유", "")
+
+    # Total 점수 합산 (메뉴 점수, 위치 점수, 추가 조건 점수)
+    base_total_score = (current_store["메뉴_점수"] + current_store.get("위치_점수", 0.0)) / 2
+    additional_score = 0.0
+    total_score_breakdown = []
+    detailed_additional_items = []
+
+    if current_store.get("on_tv") == True:
+        additional_score += 0.3
+        total_score_breakdown.append("방송 출연")
+
+    if current_store.get("seoul_michelin") == True:
+        additional_score += 0.5
+        total_score_breakdown.append("서울 미쉐린 선정")
+
+    blog_review_count = current_store.get("blog_review_count")
+    if isinstance(blog_review_count, (int, float)) and blog_review_count >= 300:
+        additional_score += 0.3
+        total_score_breakdown.append(f"블로그 리뷰 300개 이상 ({int(blog_review_count)}개)")
+
+    if current_store.get("parking_available") == True:
+        additional_score += 0.2
+        total_score_breakdown.append("주차 가능")
+
+    if current_store.get("blue_ribbon") == True:
+        additional_score += 0.3
+        total_score_breakdown.append("블루리본 선정")
+
+    # 핫플레이스 인접(100m) 영역 판별 (Total 점수 가산용)
+    lat = current_store.get("gps_latitude")
+    lng = current_store.get("gps_longitude")
+    if lat and lng:
+        try:
+            point = Point(lng, lat)
+            for poly in refs["donut_polys"].values():
+                if point.within(poly):
+                    additional_score += 0.5
+                    total_score_breakdown.append("핫플레이스 인접(100m) 포함")
+                    break
+        except Exception:
+            pass
+
+    final_total_score = base_total_score + additional_score
+    current_store["Total_점수"] = round(final_total_score, 1) # 소수점 첫째자리까지 반올림
+
+    # 추가 점수 항목 세부 내용 구성 (방송출 연, 미쉐린 선정, 블로그 리뷰, 주차 가능, 핫스팟 인접 매장)
+    if "방송 출연" in total_score_breakdown:
+        detailed_additional_items.append("방송 출연(0.3점)")
+    if "서울 미쉐린 선정" in total_score_breakdown:
+        detailed_additional_items.append("서울 미쉐린 선정(0.5점)")
+    if any("블로그 리뷰" in item for item in total_score_breakdown):
+         for item in total_score_breakdown:
+             if "블로그 리뷰" in item:
+                 detailed_additional_items.append(f"{item.replace(' (+0.3점)', '(0.3점)')}") # "블로그 리뷰 300개 이상 (N개)(0.3점)" 형태로
+    if "주차 가능" in total_score_breakdown:
+        detailed_additional_items.append("주차 가능(0.2점)")
+    if "블루리본 선정" in total_score_breakdown:
+        detailed_additional_items.append(f"블루리본 선정({current_store.get('blue_ribbon_type') or '리본'})(0.3점)")
+    if "핫플레이스 인접(100m) 포함" in total_score_breakdown:
+        detailed_additional_items.append("핫플레이스 인접(100m) 포함(0.5점)")
+
+    if "핫스팟 인접 매장" in current_store.get("위치_산출근거", ""):
+        additional_score += 0.5
+        total_score_breakdown.append("핫스팟 인접 매장")
+        detailed_additional_items.append("핫스팟 인접 매장(0.5점)")
+
+    if detailed_additional_items:
+        current_store["Total_산출근거"] = (
+            f"메뉴 점수({current_store['메뉴_점수']:.1f}점) + "
+            f"위치 점수({current_store['위치_점수']:.1f}점) / 2 = {base_total_score:.1f}점; "
+            f"추가 점수 항목: {', '.join(detailed_additional_items)}; "
+            f"총 추가 점수: {additional_score:.1f}점"
+        )
+    else:
+        current_store["Total_산출근거"] = (
+            f"메뉴 점수({current_store['메뉴_점수']:.1f}점) + "
+            f"위치 점수({current_store['위치_점수']:.1f}점) / 2 = {base_total_score:.1f}점; "
+            f"추가 점수 항목 없음"
+        )
+
+
 def run_scoring_pipeline(input_data: List[Dict], data_dir: str) -> List[Dict]:
     """
     크롤링된 원본 매장 데이터를 받아 LLM 스코어링 및 위치 점수 계산을 수행하고,
@@ -447,146 +597,36 @@ def run_scoring_pipeline(input_data: List[Dict], data_dir: str) -> List[Dict]:
         return []
 
     # --- [수정] 함수 내부에서 필요한 데이터를 인자로 받은 data_dir을 사용해 로드 ---
-    print("점수 산정용 데이터 로딩 시작...")
-    category_mapping = load_json_data(os.path.join(data_dir, 'category_mapping.json'))
-    score_mapping = load_json_data(os.path.join(data_dir, 'score_mapping_54321.json'))
-    hotspot_polys = load_polygons_from_df(os.path.join(data_dir, "seoul_hotspots_polygons.csv"), "location", "polygon_str")
-    campus_polys = load_polygons_from_df(os.path.join(data_dir, "campus_polygons.csv"), "campus_name", "polygon_str")
-    
-    donut_polys = []
-    try:
-        donut_df = pd.read_csv(os.path.join(data_dir, "seoul_hotspots_polygons.csv"))
-        donut_polys = [wkt.loads(row["WKT_Polygon_100m_Donut"]) for _, row in donut_df.iterrows()]
-    except Exception as e:
-        print(f"경고: 핫플레이스 인접 영역(Donut) Polygon 로딩 실패 - {e}", file=sys.stderr)
-
-    if not all([category_mapping, score_mapping, hotspot_polys, campus_polys]):
+    refs = load_scoring_references(data_dir)
+    if refs is None:
         print("오류: 점수 산정에 필요한 데이터 파일 로딩에 실패했습니다. 파이프라인을 중단합니다.", file=sys.stderr)
         return input_data
 
-    category_map_str = json.dumps(category_mapping, ensure_ascii=False)
-    score_map_str = json.dumps(score_mapping, ensure_ascii=False)
-    new_hot_keywords = ["삼성역", "코엑스", "익선동", "샤로수길", "송리단길", "해방촌", "후암동", "서촌"]
+    # 각 레코드가 어떤 버전의 참조 데이터로 점수가 산정되었는지 기록 (증분 재산정용)
+    ref_versions = record_reference_snapshot(refs, data_dir)
+
+    category_map_str = json.dumps(refs["category_mapping"], ensure_ascii=False)
+    score_map_str = json.dumps(refs["score_mapping"], ensure_ascii=False)
 
     # Few-shot 예시를 위한 데이터 포맷팅
     test_examples_for_prompt_str = format_test_data_as_examples(input_data)
 
+    # 블루리본 매칭은 매장별로 하지 않고 전체 배치를 한 번에 처리 (좌표 격자 + 이름 유사도)
+    store_entries = [store_entry.copy() for store_entry in input_data]
+    tag_blue_ribbon(store_entries, os.path.join(data_dir, "blueribbon"))
+
     processed_data = []
     print(f"\n{len(input_data)}개의 매장 정보에 대한 점수 산정을 시작합니다.")
 
-    for store_entry in tqdm(input_data, desc="Scoring Progress"):
-        current_store = store_entry.copy()
+    for current_store in tqdm(store_entries, desc="Scoring Progress"):
 
         # 1. LLM 추론 결과 받기 (메뉴 관련 점수)
         llm_result = get_categorized_store_info(current_store, test_examples_for_prompt_str, category_map_str, score_map_str)
+        apply_llm_result(current_store, llm_result)
 
-        # 2. 위치 점수 계산 (로드된 Polygon 데이터와 키워드를 전달)
-        location_result = calculate_location_score(current_store, hotspot_polys, campus_polys, new_hot_keywords)
-
-        # current_store에 LLM 추론 결과와 위치 점수 결과 추가
-        # 메뉴 관련 필드 추가
-        if llm_result:
-            current_store["대분류"] = llm_result.get("대분류", "")
-            current_store["중분류"] = llm_result.get("중분류", "")
-            current_store["소분류"] = llm_result.get("소분류", "")
-            current_store["메뉴_라벨"] = llm_result.get("메뉴_라벨", "")
-            try:
-                menu_score_from_llm = float(llm_result.get("메뉴_점수", 0))
-            except (ValueError, TypeError):
-                menu_score_from_llm = 0.0
-            current_store["메뉴_점수"] = menu_score_from_llm
-            current_store["메뉴_추론근거"] = llm_result.get("메뉴_추론근거", "")
-        else:
-            current_store["대분류"] = ""
-            current_store["중분류"] = ""
-            current_store["소분류"] = ""
-            current_store["메뉴_라벨"] = ""
-            current_store["메뉴_점수"] = 0.0
-            current_store["메뉴_추론근거"] = "LLM 분류 중 오류 발생 또는 응답 파싱 실패"
-        
-        # 위치 관련 필드 추가
-        current_store["위치_점수"] = location_result.get("위치_점수", 0.0)
-        current_store["위치_산출근거"] = location_result.get("위치_산출근거", "")
-        current_store["위치_실패사유"] = location_result.get("위치_실패사유", "")
-
-        # 3. Total 점수 합산 (메뉴 점수, 위치 점수, 추가 조건 점수)
-        base_total_score = (current_store["메뉴_점수"] + current_store.get("위치_점수", 0.0)) / 2
-        additional_score = 0.0
-        total_score_breakdown = []
-
-        if current_store.get("on_tv") == True:
-            additional_score += 0.3
-            total_score_breakdown.append("방송 출연")
-
-        if current_store.get("seoul_michelin") == True:
-            additional_score += 0.5
-            total_score_breakdown.append("서울 미쉐린 선정")
-
-        blog_review_count = current_store.get("blog_review_count")
-        if isinstance(blog_review_count, (int, float)) and blog_review_count >= 300:
-            additional_score += 0.3
-            total_score_breakdown.append(f"블로그 리뷰 300개 이상 ({int(blog_review_count)}개)")
-
-        if current_store.get("parking_available") == True:
-            additional_score += 0.2
-            total_score_breakdown.append("주차 가능")
-
-        # 핫플레이스 인접(100m) 영역 판별 (Total 점수 가산용)
-        lat = current_store.get("gps_latitude")
-        lng = current_store.get("gps_longitude")
-        if lat and lng:
-            try:
-                point = Point(lng, lat)
-                for poly in donut_polys:
-                    if point.within(poly):
-                        additional_score += 0.5
-                        total_score_breakdown.append("핫플레이스 인접(100m) 포함")
-                        detailed_additional_items.append("핫플레이스 인접(100m) 포함(0.5점)")
-                        break
-            except Exception:
-                pass
-
-        final_total_score = base_total_score + additional_score
-        current_store["Total_점수"] = round(final_total_score, 1) # 소수점 첫째자리까지 반올림
-
-        # Total_산출근거 구성
-        reason_parts = [
-            f"메뉴 점수({current_store['메뉴_점수']:.1f}점)",
-            f"위치 점수({current_store['위치_점수']:.1f}점)"
-        ]
-        
-        # 추가 점수 항목 세부 내용 구성 (방송출 연, 미쉐린 선정, 블로그 리뷰, 주차 가능, 핫스팟 인접 매장)
-        detailed_additional_items = []
-        if "방송 출연" in total_score_breakdown:
-            detailed_additional_items.append("방송 출연(0.3점)")
-        if "서울 미쉐린 선정" in total_score_breakdown:
-            detailed_additional_items.append("서울 미쉐린 선정(0.5점)")
-        if any("블로그 리뷰" in item for item in total_score_breakdown):
-             for item in total_score_breakdown:
-                 if "블로그 리뷰" in item:
-                     detailed_additional_items.append(f"{item.replace(' (+0.3점)', '(0.3점)')}") # "블로그 리뷰 300개 이상 (N개)(0.3점)" 형태로
-        if "주차 가능" in total_score_breakdown:
-            detailed_additional_items.append("주차 가능(0.2점)")
-
-        if "핫스팟 인접 매장" in current_store.get("위치_산출근거", ""):
-            additional_score += 0.5
-            total_score_breakdown.append("핫스팟 인접 매장")
-            detailed_additional_items.append("핫스팟 인접 매장(0.5점)")
-
-        if detailed_additional_items:
-            current_store["Total_산출근거"] = (
-                f"메뉴 점수({current_store['메뉴_점수']:.1f}점) + "
-                f"위치 점수({current_store['위치_점수']:.1f}점) / 2 = {base_total_score:.1f}점; "
-                f"추가 점수 항목: {', '.join(detailed_additional_items)}; "
-                f"총 추가 점수: {additional_score:.1f}점"
-            )
-        else:
-            current_store["Total_산출근거"] = (
-                f"메뉴 점수({current_store['메뉴_점수']:.1f}점) + "
-                f"위치 점수({current_store['위치_점수']:.1f}점) / 2 = {base_total_score:.1f}점; "
-                f"추가 점수 항목 없음"
-            )
-
+        # 2. 위치 점수 계산 및 Total 점수 합산
+        apply_location_and_total_score(current_store, refs)
+        current_store["ref_versions"] = dict(ref_versions)
 
         processed_data.append(current_store)
         print("분류 및 점수 계산 완료.")
@@ -594,4 +634,4 @@ def run_scoring_pipeline(input_data: List[Dict], data_dir: str) -> List[Dict]:
 
     # ▼▼▼ [수정] 파일 저장 로직 제거, 처리된 데이터를 return ▼▼▼
     print("모든 매장의 점수 산정이 완료되었습니다.")
-    return processed_data
\ No newline at end of file
+    return processed_data
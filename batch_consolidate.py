@@ -8,6 +8,7 @@ from io import BytesIO
 import traceback
 from typing import List, Dict, Any
 from Crawling.utils.master_loader import load_ids_from_master_data
+from Crawling.utils.recency import recompute_recency_fields
 
 def run_consolidation_job():
     """
@@ -26,7 +27,9 @@ def run_consolidation_job():
             s3_client = boto3.client('s3')
             paginator = s3_client.get_paginator('list_objects_v2')
             pages = paginator.paginate(Bucket=s3_config['bucket_name'], Prefix=s3_config['output_results_prefix'])
-            all_files = [obj['Key'] for page in pages if "Contents" in page for obj in page['Contents'] if obj['Key'].endswith('.json')]
+            # 수정 시각 순으로 정렬해야 중복 제거(keep='last') 시 가장 최근 결과(재산정 결과 포함)가 남습니다.
+            all_objects = [obj for page in pages if "Contents" in page for obj in page['Contents'] if obj['Key'].endswith('.json')]
+            all_files = [obj['Key'] for obj in sorted(all_objects, key=lambda o: o['LastModified'])]
             for file_key in all_files:
                 response = s3_client.get_object(Bucket=s3_config['bucket_name'], Key=file_key)
                 json_content = response['Body'].read().decode('utf-8')
@@ -35,7 +38,7 @@ def run_consolidation_job():
         else:  # local mode
             local_config = config['local_config']
             search_path = os.path.join(local_config['output_dir'], "**", "*.json")
-            all_files = glob.glob(search_path, recursive=True)
+            all_files = sorted(glob.glob(search_path, recursive=True), key=os.path.getmtime)
             for file_path in all_files:
                 df_list.append(pd.read_json(file_path))
 
@@ -48,6 +51,9 @@ def run_consolidation_job():
         master_df.drop_duplicates(subset=['naver_id'], keep='last', inplace=True)
         print(f"총 {len(all_files)}개 파일 통합, 중복 제거 후 {len(master_df)}건 데이터 생성.")
 
+        # 2-1. 시간이 지나면 변하는 최신성 필드(running_well 등)를 저장된 리뷰 방문일 기준으로 재계산
+        master_df = recompute_recency_fields(master_df)
+
         # 3. 새 통합 파일 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
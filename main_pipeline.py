@@ -17,9 +17,17 @@ import google.generativeai as genai
 
 # 각 단계별로 리팩토링된 모듈의 메인 함수를 import
 from Crawling.naver_crawler import run_naver_crawling
+from Crawling.area_sweep import discovery_sweep_config, run_area_sweep
+from Crawling.instagram_enricher import run_instagram_enrichment
+from Crawling.utils import list_harvester
+from Crawling.utils.selector_health import selector_health
+from Crawling.utils.budget import budget_from_config
+from Crawling.utils.crawl_profiles import CRAWL_PROFILES, DEFAULT_PROFILE, profile_sections
 from Crawling.kakao_crawler import run_kakao_crawling
+from Crawling.pre_filter import run_pre_filter
 from QC_score.score_pipline import run_scoring_pipeline
-from Crawling.utils.master_loader import load_ids_from_master_data
+from Crawling.utils.master_loader import load_ids_from_master_data, load_master_data
+from Crawling.utils.crawl_sink import new_run_id
 
 CONFIG_ENV_PATH = ".config.env"
 # .env 파일에서 환경 변수를 로드합니다.
@@ -100,16 +108,31 @@ def main():
     parser.add_argument('-q', '--query', type=str, required=True, help='크롤링할 검색어 (필수)')
     parser.add_argument('--lat', type=float, help='검색 기준점 위도 (선택)')
     parser.add_argument('--lon', type=float, help='검색 기준점 경도 (선택)')
+    parser.add_argument('--bbox', type=float, nargs=4, metavar=('SOUTH', 'WEST', 'NORTH', 'EAST'), help='영역 스윕: 경계 상자를 타일로 나눠 수집 (선택)')
+    parser.add_argument('--polygon', type=str, help='영역 스윕: 행정구역 등 Polygon WKT 문자열 (선택)')
+    parser.add_argument('--new-only', action='store_true', help="신규 오픈 탐색: 영역 스윕 목록에 '새로오픈' 필터를 적용하고 처음 보는 매장만 수집 (--bbox/--polygon 필요)")
 
     # [유지] 기타 실행 옵션들
     parser.add_argument('--config', default='config.yaml', help='사용할 설정 파일의 경로')
     parser.add_argument('--stage', type=str, help="실행할 파이프라인 단계 ('naver', 'kakao', 'full')")
     parser.add_argument('--threads', type=int, help='카카오 크롤링에 사용할 스레드 개수')
+    parser.add_argument('--naver-workers', type=int, help='네이버 상세 정보 수집 워커(브라우저) 개수')
+    parser.add_argument('--naver-backend', type=str, choices=['browser', 'http'], help="네이버 상세 정보 수집 방식 ('browser', 'http')")
+    parser.add_argument('--profile', type=str, choices=list(CRAWL_PROFILES), help="크롤링 프로필: 수집할 상세 섹션 범위 ('minimal', 'scoring', 'full')")
+    parser.add_argument('--max-stores', type=int, help='네이버 상세 수집 매장 수 상한. 도달하면 수집을 멈추고 모은 매장만 다음 단계로 처리합니다.')
+    parser.add_argument('--max-duration', type=int, help='실행 전체 시간 목표(초). 네이버 수집은 budget.naver_share 비율까지만 새 매장을 시작하고, 모은 매장은 끝까지 처리합니다.')
+    parser.add_argument('--run-id', type=str, help='실행 ID. 중단된 실행과 같은 ID를 주면 이미 수집된 매장을 건너뛰고 이어서 수집합니다.')
+    parser.add_argument('--tabs', type=int, help='브라우저 1개당 동시에 로딩할 탭 개수 (네이버/카카오 공통)')
     parser.add_argument('--show-browser', action='store_true', help='이 플래그 설정 시 크롤링 브라우저 창을 표시합니다.')
     parser.add_argument('--format', type=str, choices=['csv', 'json', 'both'], help="최종 결과 파일 저장 형식")
     
     args = parser.parse_args()
+    if args.new_only and not (args.bbox or args.polygon):
+        parser.error("--new-only는 --bbox 또는 --polygon과 함께 사용해야 합니다.")
     config = load_config(args.config)
+    selector_health.configure(**(config.get('selector_health') or {}))
+    selector_health.begin_run()
+    list_harvester.configure(**(config.get('list_harvest') or {}))
 
     # 설정값 결정 (우선순위: CLI > config.yaml > 기본값)
     PIPELINE_STAGE = args.stage or config.get('pipeline_stage', 'full')
@@ -117,6 +140,11 @@ def main():
     OUTPUT_FORMAT = args.format or config.get('output_format', 'both')
     DATA_DIR = config.get('data_dir', 'data')
     KAKAO_MAX_THREADS = args.threads or config.get('num_threads', 3)
+    NAVER_DETAIL_WORKERS = args.naver_workers or config.get('naver_detail_workers', 1)
+    TABS_PER_BROWSER = args.tabs or config.get('tabs_per_browser', 1)
+    NAVER_DETAIL_BACKEND = args.naver_backend or config.get('naver_detail_backend', 'browser')
+    RUN_ID = args.run_id or new_run_id()
+    CRAWL_PROFILE = args.profile or config.get('crawl_profile', DEFAULT_PROFILE)
     
     # 결과 저장을 위한 디렉토리 설정
     run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -132,6 +160,12 @@ def main():
 
     # --- 3. 파이프라인 단계별 실행 ---
     print(f"\n===== 파이프라인 시작 (단계: {PIPELINE_STAGE.upper()}, 검색어: '{args.query}') =====")
+    print(f"크롤링 프로필: {CRAWL_PROFILE} (수집 섹션: {', '.join(sorted(profile_sections(CRAWL_PROFILE))) or '기본 정보만'})")
+    print(f"실행 ID: {RUN_ID} (중단 시 --run-id {RUN_ID} 로 이어서 수집할 수 있습니다)")
+    # 매장 수/시간 예산 (CLI > config.yaml의 budget 기본값, 둘 다 없으면 제한 없음)
+    BUDGET = budget_from_config(args.max_stores, args.max_duration, config.get('budget'))
+    if BUDGET is not None:
+        print(f"예산: 매장 {BUDGET.max_stores or '제한 없음'}건, 시간 {BUDGET.max_duration or '제한 없음'}초")
     
     # ★★★ 수정된 부분: S3 로직을 로컬 JSON 로더 호출로 변경 ★★★
     # config.yaml에서 JSON 파일 경로를 읽어옵니다.
@@ -152,32 +186,79 @@ def main():
         if PIPELINE_STAGE in ['naver', 'kakao', 'full']:
             print(f"\n🚀 [STAGE: NAVER] 네이버 지도 크롤링을 시작합니다...")
             
-            # [수정] 새로워진 run_naver_crawling 함수 호출
-            current_df = run_naver_crawling(
-                search_query=args.query,
-                latitude=args.lat,
-                longitude=args.lon,
+            crawl_options = dict(
                 headless_mode=HEADLESS_MODE,
                 output_dir=OUTPUT_DIR,
-                existing_naver_ids=crawled_naver_ids
+                existing_naver_ids=crawled_naver_ids,
+                num_workers=NAVER_DETAIL_WORKERS,
+                tabs_per_browser=TABS_PER_BROWSER,
+                detail_backend=NAVER_DETAIL_BACKEND,
+                http_concurrency=config.get('naver_http_concurrency', 4),
+                run_id=RUN_ID,
+                sink_dir=config.get('crawl_sink_dir', 'runs'),
+                crawl_profile=CRAWL_PROFILE,
+                budget=BUDGET
             )
+            if args.bbox or args.polygon:
+                # 영역 스윕: 타일별 목록 수집(상한 도달 시 분할) 후 중복 제거한 ID만 상세 수집
+                current_df = run_area_sweep(
+                    search_query=args.query,
+                    bounds=args.bbox,
+                    polygon_wkt=args.polygon,
+                    master_df=load_master_data(config.get('storage_mode', 'local'), config),
+                    sweep_config=discovery_sweep_config(config) if args.new_only else config.get('area_sweep'),
+                    new_only=args.new_only,
+                    **crawl_options
+                )
+            else:
+                # [수정] 새로워진 run_naver_crawling 함수 호출
+                current_df = run_naver_crawling(
+                    search_query=args.query,
+                    latitude=args.lat,
+                    longitude=args.lon,
+                    **crawl_options
+                )
+
+            # 연속 시간 초과로 저하된 선택자가 있으면 네이버 마크업 변경을 의심할 수 있음
+            selector_health.log_report()
             
+            if current_df.empty and args.new_only:
+                print("✅ 새로 오픈한 매장이 없어 파이프라인을 마칩니다."); return
             if current_df.empty:
                 print("❌ 네이버 크롤링 결과가 없어 파이프라인을 중단합니다."); return
+            if BUDGET is not None:
+                current_df = BUDGET.limit(current_df)
 
             # 새로 수집된 ID들을 전체 목록에 추가
             crawled_naver_ids.update(set(current_df['naver_id'].dropna().unique()))
             print(f"✅ 네이버 크롤링 완료. 고유 가게 {len(crawled_naver_ids)}개 수집.")
+
+            # 인스타그램 팔로워/게시글 수는 네이버 상세 수집과 분리된 단계에서 계정 단위 캐시로 보강 (프로필에 포함된 경우만)
+            # 카카오/점수 산정까지 실행하면 사전 필터를 통과한 매장만 보강하므로, 여기서는 naver 단계만 실행할 때 보강
+            if PIPELINE_STAGE == 'naver' and "instagram" in profile_sections(CRAWL_PROFILE):
+                current_df = run_instagram_enrichment(current_df, config.get('instagram_enrichment'), DATA_DIR, headless=HEADLESS_MODE)
             
             save_data(current_df, os.path.join(OUTPUT_DIR, "1_naver_crawled"), OUTPUT_FORMAT)
             
             if PIPELINE_STAGE == 'naver':
                 print("\n🎉 'naver' 단계 실행이 완료되었습니다."); return
 
+        # [ 단계 1.5: 사전 필터 ] 카카오/점수 산정 전에 수집 대상이 아닌 매장 제외
+        if PIPELINE_STAGE in ['kakao', 'full']:
+            current_df, filtered_df = run_pre_filter(current_df, config.get('pre_filter'), DATA_DIR)
+            if not filtered_df.empty:
+                save_data(filtered_df, os.path.join(OUTPUT_DIR, "1_pre_filtered_out"), OUTPUT_FORMAT)
+            if current_df.empty:
+                print("❌ 사전 필터를 통과한 매장이 없어 파이프라인을 중단합니다."); return
+
+            # 사전 필터를 통과한 매장만 인스타그램 보강 (제외될 매장의 계정은 조회하지 않음)
+            if "instagram" in profile_sections(CRAWL_PROFILE):
+                current_df = run_instagram_enrichment(current_df, config.get('instagram_enrichment'), DATA_DIR, headless=HEADLESS_MODE)
+
         # [ 단계 2: 카카오 크롤링 ]
         if PIPELINE_STAGE in ['kakao', 'full']:
             print(f"\n🚀 [STAGE: KAKAO] 카카오맵 크롤링을 시작합니다...")
-            current_df = run_kakao_crawling(input_df=current_df, max_threads=KAKAO_MAX_THREADS, headless=HEADLESS_MODE)
+            current_df = run_kakao_crawling(input_df=current_df, max_threads=KAKAO_MAX_THREADS, headless=HEADLESS_MODE, tabs_per_browser=TABS_PER_BROWSER)
             save_data(current_df, os.path.join(OUTPUT_DIR, "2_kakao_added"), OUTPUT_FORMAT)
             print(f"✅ 카카오 크롤링 완료.")
             
@@ -198,6 +279,8 @@ def main():
             
             print(f"✅ 점수 산정 완료. 최종 결과가 '{OUTPUT_DIR}' 폴더에 저장되었습니다.")
         
+        if BUDGET is not None and BUDGET.partial:
+            print(f"\n⏳ 예산 소진으로 일부 매장만 처리했습니다(partial). 예산 현황: {BUDGET.summary()}")
         print("\n🎉 전체 파이프라인 실행이 성공적으로 완료되었습니다!")
 
     except Exception as e:
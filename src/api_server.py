@@ -10,7 +10,7 @@ import traceback
 import subprocess
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -19,15 +19,30 @@ import boto3
 
 # 기존에 만들었던 파이프라인 모듈들을 import합니다.
 from Crawling.naver_crawler import run_naver_crawling, run_target_naver_crawling
+from Crawling.area_sweep import discovery_sweep_config, run_area_sweep
+from Crawling.instagram_enricher import run_instagram_enrichment
 from Crawling.kakao_crawler import run_kakao_crawling
+from Crawling.pre_filter import run_pre_filter
 from QC_score.score_pipline import run_scoring_pipeline
-from Crawling.utils.master_loader import load_ids_from_master_data
+from Crawling.utils.master_loader import load_ids_from_master_data, load_master_data, save_filtered_file
+from Crawling.utils.crawl_sink import new_run_id
+from Crawling.utils.resolution_cache import load_resolution_cache
+from Crawling.utils.crawl_profiles import CrawlProfileName, DEFAULT_PROFILE, profile_sections
+from Crawling.utils import list_harvester
+from Crawling.utils.selector_health import selector_health
+from Crawling.utils.budget import budget_from_config
 from batch_consolidate import run_consolidation_job # 배치 작업 함수 import
+from QC_score.incremental_rescore import run_incremental_rescoring
+from Crawling.naver_refresh import run_naver_refresh
+from Crawling.section_retry import run_section_retry
 from copy import deepcopy
 
 # --- 1. 설정 및 전역 변수 초기화 ---
 app = FastAPI(title="Store Data Pipeline API")
 CONSOLIDATION_IN_PROGRESS = False # 통합 작업 중복 실행 방지 플래그
+RESCORE_IN_PROGRESS = False # 증분 재산정 작업 중복 실행 방지 플래그
+REFRESH_IN_PROGRESS = False # 네이버 경량 갱신 작업 중복 실행 방지 플래그
+SECTION_RETRY_IN_PROGRESS = False # 섹션 재수집 작업 중복 실행 방지 플래그
 
 
 # 설정 파일 로드
@@ -59,6 +74,13 @@ class PipelineRequest(BaseModel): # 입력 값
     longitude: Optional[float] = Field(None, description="검색 기준점 경도 (선택)", example=127.044)
     zoom_level: Optional[int] = Field(None, description="지도 확대 레벨(기본 값 15) (선택)", example=15) # [신규] zoom_level 필드 추가
     show_browser: bool = Field(False, description="크롤링 브라우저 창 표시 여부 (디버깅용)")
+    run_id: Optional[str] = Field(None, description="실행 ID (선택). 중단된 작업의 run_id를 주면 이미 수집된 매장을 건너뛰고 이어서 수집", example="20250620_150000_1a2b3c")
+    bbox: Optional[List[float]] = Field(None, description="영역 스윕 경계 상자 [south, west, north, east] (선택). 지정하면 타일 단위로 수집", example=[37.535, 127.035, 37.550, 127.060])
+    polygon_wkt: Optional[str] = Field(None, description="영역 스윕 Polygon WKT (선택). 행정구역 경계 등", example="POLYGON ((127.03 37.53, 127.06 37.53, 127.06 37.55, 127.03 37.55, 127.03 37.53))")
+    crawl_profile: CrawlProfileName = Field(DEFAULT_PROFILE, description="크롤링 프로필: minimal(기본 정보만), scoring(데이터랩/메뉴/리뷰), full(인스타그램 포함 전체)", example="scoring")
+    new_only: bool = Field(False, description="신규 오픈 탐색 (bbox 또는 polygon_wkt 필요). '새로오픈' 필터 목록에서 마스터에 없는 매장만 수집")
+    max_stores: Optional[int] = Field(None, ge=1, description="네이버 상세 수집 매장 수 상한 (선택). 도달하면 수집을 멈추고 모은 매장만 다음 단계로 처리", example=100)
+    max_duration: Optional[int] = Field(None, ge=1, description="작업 전체 시간 목표(초) (선택). 네이버 수집은 budget.naver_share 비율까지만 새 매장을 시작하고, 모은 매장은 카카오/점수 산정까지 마쳐 partial로 완료", example=1800)
 
 class TargetPipelineRequest(BaseModel): # 입력 값
     storage_mode: str = Field(
@@ -73,60 +95,161 @@ class TargetPipelineRequest(BaseModel): # 입력 값
     longitude: Optional[float] = Field(None, description="검색 기준점 경도 (선택)", example=127.044)
     zoom_level: Optional[int] = Field(None, description="지도 확대 레벨(기본 값 15) (선택)", example=15) # [신규] zoom_level 필드 추가
     show_browser: bool = Field(False, description="크롤링 브라우저 창 표시 여부 (디버깅용)")
+    crawl_profile: CrawlProfileName = Field(DEFAULT_PROFILE, description="크롤링 프로필: minimal(기본 정보만), scoring(데이터랩/메뉴/리뷰), full(인스타그램 포함 전체)", example="scoring")
+
+class SectionRetryRequest(BaseModel): # 섹션 재수집 입력 값
+    naver_ids: Optional[List[int]] = Field(None, description="재수집할 매장 naver_id 목록 (비우면 마스터 전체에서 실패한 섹션이 있는 매장)")
+
+class RefreshRequest(BaseModel): # 경량 갱신 입력 값
+    naver_ids: Optional[List[int]] = Field(None, description="갱신할 매장 naver_id 목록 (비우면 마스터 전체에서 갱신 주기가 지난 매장)")
+    ttl_days: Optional[Dict[str, int]] = Field(None, description="필드 그룹별 갱신 주기(일) 덮어쓰기", example={"review_counts": 7, "reviews": 7, "instagram": 14})
 
 class TaskResponse(BaseModel): # 작업 응답 형식
     task_id: str
     message: str
 
+class DiscoveryResponse(BaseModel): # 신규 오픈 탐색 응답 형식
+    task_ids: Dict[str, str] = Field(..., description="탐색 영역 이름별 파이프라인 task_id")
+    message: str
+
 class StatusResponse(BaseModel):
     task_id: str
     status: str
     request_details: Optional[Dict[str, Any]] = Field(None, description="최초 요청 파라미터")
     # ★★★ 상세 진행 상황을 위한 필드 추가
     progress: Optional[Dict[str, str]] = Field(None, description="파이프라인 단계별 진행 상황")
+    run_id: Optional[str] = Field(None, description="네이버 크롤링 실행 ID (재시도 시 요청에 넣으면 이어서 수집)")
     result_path: Optional[str] = Field(None, description="[로컬 모드] 결과 파일이 저장된 로컬 경로")
     result_url: Optional[str] = Field(None, description="[S3 모드] 결과 파일 다운로드를 위한 임시 URL")
-    error: Optional[str] = None
+    filtered_count: Optional[int] = Field(None, description="사전 필터에서 제외된 매장 수")
+    filtered_path: Optional[str] = Field(None, description="제외된 매장 목록 파일 경로(로컬) 또는 S3 키")
+    selector_health: Optional[Dict[str, Any]] = Field(None, description="네이버 크롤링 후 선택자 상태 요약 (저하된 선택자/섹션)")
+    partial: Optional[bool] = Field(None, description="매장 수/시간 예산(max_stores, max_duration)이 소진되어 일부 매장만 처리했는지 여부")
+    budget: Optional[Dict[str, Any]] = Field(None, description="예산 사용 현황 (경과 시간, 수집 매장 수, 단계별 중단 사유)")
     error: Optional[str] = None
 
 # --- 3. 핵심 파이프라인 실행 함수 ---
+def apply_pre_filter(task_id: str, naver_df: pd.DataFrame, request, annotate_only: bool = False) -> pd.DataFrame:
+    """
+    사전 필터를 적용하고, 제외된 매장 수/목록 파일을 작업 상태에 기록합니다.
+    annotate_only=True(매장을 직접 지정한 타겟 요청)면 제외하지 않고 filter_reason만 기록합니다.
+    """
+    tasks_db[task_id]["progress"]["사전 필터"] = "running"
+    if annotate_only:
+        annotated_df, _ = run_pre_filter(naver_df, config.get('pre_filter'), config.get('data_dir', 'data'), annotate_only=True)
+        tasks_db[task_id]["filtered_count"] = int((annotated_df.get("filter_reason", pd.Series(dtype=str)).fillna("") != "").sum())
+        tasks_db[task_id]["progress"]["사전 필터"] = "annotated"
+        print(f"[{task_id}] 사전 필터(표시만) 완료.")
+        return annotated_df
+    kept_df, filtered_df = run_pre_filter(naver_df, config.get('pre_filter'), config.get('data_dir', 'data'))
+    tasks_db[task_id]["filtered_count"] = len(filtered_df)
+    if not filtered_df.empty:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        safe_query_name = re.sub(r'[\\/*?:"<>|]', "", request.query)
+        file_name = f"{safe_query_name}_{timestamp}_{task_id[:8]}_filtered_{len(filtered_df)}.json"
+        tasks_db[task_id]["filtered_path"] = save_filtered_file(filtered_df, request.storage_mode, config, file_name)
+    tasks_db[task_id]["progress"]["사전 필터"] = "completed"
+    print(f"[{task_id}] 사전 필터 완료. ({len(kept_df)}건 통과, {len(filtered_df)}건 제외)")
+    if kept_df.empty: raise ValueError("사전 필터를 통과한 매장이 없습니다.")
+    return kept_df
+
+def apply_instagram_enrichment(task_id: str, naver_df: pd.DataFrame, request) -> pd.DataFrame:
+    """네이버 수집과 분리된 인스타그램 보강 단계를 실행하고, 진행 상황을 작업 상태에 기록합니다."""
+    if "instagram" not in profile_sections(request.crawl_profile):
+        tasks_db[task_id]["progress"]["인스타그램 보강"] = "skipped"
+        return naver_df
+    tasks_db[task_id]["progress"]["인스타그램 보강"] = "running"
+    naver_df = run_instagram_enrichment(naver_df, config.get('instagram_enrichment'), config.get('data_dir', 'data'), headless=(not request.show_browser))
+    tasks_db[task_id]["progress"]["인스타그램 보강"] = "completed"
+    print(f"[{task_id}] 인스타그램 보강 완료.")
+    return naver_df
+
+def stage_status(budget, stage: str) -> str:
+    """예산 소진으로 단계가 도중에 멈췄으면 'partial', 아니면 'completed'"""
+    return "partial" if budget is not None and stage in budget.summary()["stopped"] else "completed"
+
 # 일반 파이프라인 실행 함수
 def execute_pipeline_task(task_id: str, request: PipelineRequest, existing_ids: set):
     """오래 걸리는 전체 파이프라인 로직을 수행하는 함수 (백그라운드 실행용)"""
     output_dir = ""
+    selector_health.begin_run()  # 선택자 상태 통계는 실행 단위 (진행 중인 다른 작업이 없으면 이전 통계를 비움)
     try:
         tasks_db[task_id] = {
             "status": "processing", # 전체 상태는 'processing'으로 유지
             "request_details": request.model_dump(),
+            "run_id": request.run_id or new_run_id(), # 같은 run_id로 재요청하면 이어서 수집
             "progress": {
                 "네이버 크롤링": "pending",
+                "사전 필터": "pending",
+                "인스타그램 보강": "pending",
                 "카카오 크롤링": "pending",
                 "점수 산정": "pending",
                 "결과 저장": "pending"
             }
         }
         print(f"[{task_id}] 파이프라인 시작: query='{request.query}'")
+        # 요청 단위 매장 수/시간 예산 (요청값이 없으면 config.yaml의 budget 기본값, 둘 다 없으면 제한 없음)
+        budget = budget_from_config(request.max_stores, request.max_duration, config.get('budget'))
         
         # 1. Naver Crawling
         tasks_db[task_id]["progress"]["네이버 크롤링"] = "running"
-        naver_df = run_naver_crawling(
-            search_query=request.query,
-            latitude=request.latitude,
-            longitude=request.longitude,
+        crawl_options = dict(
             headless_mode=(not request.show_browser),
-            zoom_level=request.zoom_level,
-            existing_naver_ids=existing_ids
+            existing_naver_ids=existing_ids,
+            num_workers=config.get('naver_detail_workers', 1),
+            tabs_per_browser=config.get('tabs_per_browser', 1),
+            detail_backend=config.get('naver_detail_backend', 'browser'),
+            http_concurrency=config.get('naver_http_concurrency', 4),
+            run_id=tasks_db[task_id]["run_id"],
+            sink_dir=config.get('crawl_sink_dir', 'runs'),
+            crawl_profile=request.crawl_profile,
+            budget=budget
         )
+        if request.bbox or request.polygon_wkt:
+            # 영역 스윕: 타일별 목록 수집(상한 도달 시 분할) 후 중복 제거한 ID만 상세 수집
+            naver_df = run_area_sweep(
+                search_query=request.query,
+                bounds=request.bbox,
+                polygon_wkt=request.polygon_wkt,
+                master_df=load_master_data(request.storage_mode, config),
+                sweep_config=discovery_sweep_config(config) if request.new_only else config.get('area_sweep'),
+                new_only=request.new_only,
+                **crawl_options
+            )
+        else:
+            naver_df = run_naver_crawling(
+                search_query=request.query,
+                latitude=request.latitude,
+                longitude=request.longitude,
+                zoom_level=request.zoom_level,
+                **crawl_options
+            )
+        tasks_db[task_id]["selector_health"] = selector_health.summary()
+        if naver_df.empty and request.new_only:
+            # 신규 오픈 탐색에서 처음 보는 매장이 없으면 이후 단계 없이 완료
+            for stage in tasks_db[task_id]["progress"]:
+                tasks_db[task_id]["progress"][stage] = "skipped"
+            tasks_db[task_id]["progress"]["네이버 크롤링"] = "completed"
+            tasks_db[task_id]["status"] = "completed"
+            print(f"[{task_id}] 새로 오픈한 매장이 없어 작업을 마칩니다.")
+            return
         if naver_df.empty: raise ValueError("네이버 크롤링 결과가 없습니다.")
-        tasks_db[task_id]["progress"]["네이버 크롤링"] = "completed"
+        if budget is not None:
+            naver_df = budget.limit(naver_df)
+        tasks_db[task_id]["progress"]["네이버 크롤링"] = stage_status(budget, "naver")
         print(f"[{task_id}] 네이버 크롤링 완료.")
 
+        # 사전 필터를 먼저 적용해, 제외될 매장의 인스타그램 계정은 조회하지 않음
+        naver_df = apply_pre_filter(task_id, naver_df, request)
+        naver_df = apply_instagram_enrichment(task_id, naver_df, request)
+
         # 2. Kakao Crawling
         tasks_db[task_id]["progress"]["카카오 크롤링"] = "running"
         kakao_df = run_kakao_crawling(
             input_df=naver_df,
             max_threads=config.get('num_threads', 3),
-            headless=(not request.show_browser)
+            headless=(not request.show_browser),
+            tabs_per_browser=config.get('tabs_per_browser', 1)
         )
         tasks_db[task_id]["progress"]["카카오 크롤링"] = "completed"
         print(f"[{task_id}] 카카오 크롤링 완료.")
@@ -140,6 +263,11 @@ def execute_pipeline_task(task_id: str, request: PipelineRequest, existing_ids:
         if not final_list: raise ValueError("점수 산정 결과가 없습니다.")
         tasks_db[task_id]["progress"]["점수 산정"] = "completed"
         print(f"[{task_id}] 점수 산정 완료.")
+        if budget is not None:
+            # 예산은 네이버 수집만 멈추며, 이미 모은 매장은 카카오/점수 산정을 모두 마친 뒤 저장하고 partial로 표시
+            tasks_db[task_id].update({"partial": budget.partial, "budget": budget.summary()})
+            if budget.partial:
+                print(f"[{task_id}] 예산 소진으로 일부 매장만 처리했습니다. (중단 단계: {budget.summary()['stopped']})")
 
         final_df = pd.DataFrame(final_list)
         
@@ -186,17 +314,22 @@ def execute_pipeline_task(task_id: str, request: PipelineRequest, existing_ids:
             with open(error_log_path, 'w', encoding='utf-8') as f:
                 f.write(f"Error: {error_message}\n\n")
                 f.write(traceback.format_exc())
+    finally:
+        selector_health.end_run()
 
 # 타겟 파이프라인 실행 함수
 def execute_target_pipeline_task(task_id: str, request: TargetPipelineRequest, existing_ids: set):
     """단일 타겟 매장에 대한 파이프라인 로직을 수행하는 함수 (백그라운드 실행용)"""
     output_dir = ""
+    selector_health.begin_run()
     try:
         tasks_db[task_id] = {
             "status": "processing", # 전체 상태는 'processing'으로 유지
             "request_details": request.model_dump(),
             "progress": {
                 "네이버 크롤링": "pending",
+                "사전 필터": "pending",
+                "인스타그램 보강": "pending",
                 "카카오 크롤링": "pending",
                 "점수 산정": "pending",
                 "결과 저장": "pending"
@@ -214,19 +347,26 @@ def execute_target_pipeline_task(task_id: str, request: TargetPipelineRequest, e
             longitude=request.longitude,
             headless_mode=(not request.show_browser),
             zoom_level=request.zoom_level,
-            existing_naver_ids=existing_ids
-
+            existing_naver_ids=existing_ids,
+            resolution_cache=load_resolution_cache(request.storage_mode, config),
+            crawl_profile=request.crawl_profile
         )
+        tasks_db[task_id]["selector_health"] = selector_health.summary()
         if naver_df.empty: raise ValueError("타겟 네이버 크롤링 결과가 없습니다.")
         tasks_db[task_id]["progress"]["타겟 네이버 크롤링"] = "completed"
         print(f"[{task_id}] 타겟 네이버 크롤링 완료.")
 
+        # 사용자가 직접 지정한 매장이므로 제외하지 않고 filter_reason만 기록
+        naver_df = apply_pre_filter(task_id, naver_df, request, annotate_only=True)
+        naver_df = apply_instagram_enrichment(task_id, naver_df, request)
+
         # 2. Kakao Crawling
         tasks_db[task_id]["progress"]["카카오 크롤링"] = "running"
         kakao_df = run_kakao_crawling(
             input_df=naver_df,
             max_threads=config.get('num_threads', 3),
-            headless=(not request.show_browser)
+            headless=(not request.show_browser),
+            tabs_per_browser=config.get('tabs_per_browser', 1)
         )
         tasks_db[task_id]["progress"]["카카오 크롤링"] = "completed"
         print(f"[{task_id}] 카카오 크롤링 완료.")
@@ -286,6 +426,8 @@ def execute_target_pipeline_task(task_id: str, request: TargetPipelineRequest, e
             with open(error_log_path, 'w', encoding='utf-8') as f:
                 f.write(f"Error: {error_message}\n\n")
                 f.write(traceback.format_exc())
+    finally:
+        selector_health.end_run()
 
 
 # --- 4. 서버 시작 시 실행될 이벤트 ---
@@ -315,12 +457,16 @@ def on_startup():
     print(f"🚀 API 서버 시작... (스토리지 모드: {STORAGE_MODE.upper()})")
     setup_api_key()
     clean_firefox_cache()
+    selector_health.configure(**(config.get('selector_health') or {}))
+    list_harvester.configure(**(config.get('list_harvest') or {}))
 
 # --- 5. API 엔드포인트 구현 --- # 이거 어떻게 post 넘겨서 값 받을 지 다시 정하기
 # 일반 파이프라인 실행 함수 ------------------------------
 @app.post("/pipeline/run", response_model=TaskResponse, status_code=202)
 async def start_pipeline_endpoint(request: PipelineRequest, background_tasks: BackgroundTasks):
     """파이프라인 실행을 요청하고 즉시 작업 ID를 반환합니다."""
+    if request.new_only and not (request.bbox or request.polygon_wkt):
+        raise HTTPException(status_code=400, detail="신규 오픈 탐색(new_only)은 bbox 또는 polygon_wkt가 필요합니다.")
     task_id = str(uuid.uuid4())
     tasks_db[task_id] = {"status": "pending"}
 
@@ -380,6 +526,18 @@ async def get_config():
     # 민감 정보를 포함할 수 있으므로 주의해서 사용해야 합니다.
     return config
 
+# 선택자 상태 확인 함수 ------------------------------
+@app.get("/admin/selector-health", response_model=dict)
+async def get_selector_health():
+    """크롤러가 기다리는 선택자별 성공/시간 초과 통계와 저하 상태를 반환합니다. (마크업 변경 감지용)"""
+    return {
+        "degrade_after": selector_health.degrade_after,
+        "degraded_timeout": selector_health.degraded_timeout,
+        "probe_after_s": selector_health.probe_after_s,
+        **selector_health.summary(),
+        "selectors": selector_health.snapshot(),
+    }
+
 
 # --- 6. 데이터 통합 수동 실행 API ---
 def consolidation_task_wrapper():
@@ -409,3 +567,145 @@ async def trigger_consolidation_endpoint(background_tasks: BackgroundTasks):
     background_tasks.add_task(consolidation_task_wrapper)
     
     return {"task_id": "consolidation_job", "message": "데이터 통합 작업이 시작되었습니다."}
+
+
+# --- 7. 참조 데이터 변경 시 증분 재산정 API ---
+def rescore_task_wrapper(storage_mode: str):
+    """증분 재산정 실행 후 잠금 플래그를 해제하는 래퍼 함수."""
+    global RESCORE_IN_PROGRESS
+    try:
+        summary = run_incremental_rescoring(config, storage_mode=storage_mode)
+        print(f"증분 재산정 요약: {summary}")
+    except Exception as e:
+        print(f"증분 재산정 중 오류 발생: {e}")
+        traceback.print_exc()
+    finally:
+        RESCORE_IN_PROGRESS = False
+        print("증분 재산정 작업 완료. 이제 다음 재산정 요청을 받을 수 있습니다.")
+
+# 증분 재산정 수동 실행 API ------------------------------
+@app.post("/admin/rescore", response_model=TaskResponse, status_code=202)
+async def trigger_rescore_endpoint(background_tasks: BackgroundTasks):
+    """점수 매핑/폴리곤/키워드 변경의 영향을 받는 매장만 재산정하여 마스터에 반영합니다. (관리자용)"""
+    global RESCORE_IN_PROGRESS
+
+    if RESCORE_IN_PROGRESS or CONSOLIDATION_IN_PROGRESS:
+        raise HTTPException(
+            status_code=409,
+            detail="재산정 또는 데이터 통합 작업이 이미 실행 중입니다. 잠시 후 다시 시도해주세요."
+        )
+
+    RESCORE_IN_PROGRESS = True
+    print("관리자 요청으로 증분 재산정 작업을 백그라운드에서 시작합니다.")
+    background_tasks.add_task(rescore_task_wrapper, STORAGE_MODE)
+
+    return {"task_id": "rescore_job", "message": "증분 재산정 작업이 시작되었습니다."}
+
+
+# --- 8. 네이버 경량 갱신(자주 바뀌는 필드만 재수집) API ---
+def refresh_task_wrapper(storage_mode: str, request: RefreshRequest):
+    """경량 갱신 실행 후 잠금 플래그를 해제하는 래퍼 함수."""
+    global REFRESH_IN_PROGRESS
+    selector_health.begin_run()
+    try:
+        summary = run_naver_refresh(config, storage_mode=storage_mode, naver_ids=request.naver_ids, ttl_days=request.ttl_days)
+        print(f"네이버 경량 갱신 요약: {summary}")
+    except Exception as e:
+        print(f"네이버 경량 갱신 중 오류 발생: {e}")
+        traceback.print_exc()
+    finally:
+        selector_health.end_run()
+        REFRESH_IN_PROGRESS = False
+        print("네이버 경량 갱신 작업 완료. 이제 다음 갱신 요청을 받을 수 있습니다.")
+
+# 네이버 경량 갱신 수동 실행 API ------------------------------
+@app.post("/admin/refresh", response_model=TaskResponse, status_code=202)
+async def trigger_refresh_endpoint(request: RefreshRequest, background_tasks: BackgroundTasks):
+    """마스터 매장의 리뷰 수/최근 리뷰/인스타그램 지표 중 갱신 주기가 지난 필드만 다시 수집해 반영합니다. (관리자용)"""
+    global REFRESH_IN_PROGRESS
+
+    # 세 작업 모두 마스터 파일을 다시 쓰므로 동시에 실행하지 않음
+    if REFRESH_IN_PROGRESS or SECTION_RETRY_IN_PROGRESS or RESCORE_IN_PROGRESS or CONSOLIDATION_IN_PROGRESS:
+        raise HTTPException(
+            status_code=409,
+            detail="갱신, 재수집, 재산정 또는 데이터 통합 작업이 이미 실행 중입니다. 잠시 후 다시 시도해주세요."
+        )
+
+    REFRESH_IN_PROGRESS = True
+    print("관리자 요청으로 네이버 경량 갱신 작업을 백그라운드에서 시작합니다.")
+    background_tasks.add_task(refresh_task_wrapper, STORAGE_MODE, request)
+
+    return {"task_id": "refresh_job", "message": "네이버 경량 갱신 작업이 시작되었습니다."}
+
+# --- 9. 섹션 재수집(수집에 실패한 섹션만 재시도) API ---
+def section_retry_task_wrapper(storage_mode: str, request: SectionRetryRequest):
+    """섹션 재수집 실행 후 잠금 플래그를 해제하는 래퍼 함수."""
+    global SECTION_RETRY_IN_PROGRESS
+    selector_health.begin_run()
+    try:
+        summary = run_section_retry(config, storage_mode=storage_mode, naver_ids=request.naver_ids)
+        print(f"섹션 재수집 요약: {summary}")
+    except Exception as e:
+        print(f"섹션 재수집 중 오류 발생: {e}")
+        traceback.print_exc()
+    finally:
+        selector_health.end_run()
+        SECTION_RETRY_IN_PROGRESS = False
+        print("섹션 재수집 작업 완료. 이제 다음 재수집 요청을 받을 수 있습니다.")
+
+# 섹션 재수집 수동 실행 API ------------------------------
+@app.post("/admin/retry-sections", response_model=TaskResponse, status_code=202)
+async def trigger_section_retry_endpoint(request: SectionRetryRequest, background_tasks: BackgroundTasks):
+    """마스터 매장 중 수집에 실패한 섹션(데이터랩/메뉴/리뷰)만 백오프 재시도로 다시 수집해 반영합니다. (관리자용)"""
+    global SECTION_RETRY_IN_PROGRESS
+
+    # 마스터 파일을 다시 쓰는 작업과 동시에 실행하지 않음
+    if SECTION_RETRY_IN_PROGRESS or REFRESH_IN_PROGRESS or RESCORE_IN_PROGRESS or CONSOLIDATION_IN_PROGRESS:
+        raise HTTPException(
+            status_code=409,
+            detail="재수집, 갱신, 재산정 또는 데이터 통합 작업이 이미 실행 중입니다. 잠시 후 다시 시도해주세요."
+        )
+
+    SECTION_RETRY_IN_PROGRESS = True
+    print("관리자 요청으로 섹션 재수집 작업을 백그라운드에서 시작합니다.")
+    background_tasks.add_task(section_retry_task_wrapper, STORAGE_MODE, request)
+
+    return {"task_id": "section_retry_job", "message": "섹션 재수집 작업이 시작되었습니다."}
+
+# --- 10. 신규 오픈 탐색(새로오픈 필터 + 처음 보는 매장만 수집) API ---
+# 스케줄러(cron 등)가 주기적으로 호출하는 용도입니다. config.yaml의 new_openings.areas 영역마다 파이프라인 작업을 하나씩 접수합니다.
+@app.post("/admin/discover-new", response_model=DiscoveryResponse, status_code=202)
+async def trigger_new_openings_endpoint(background_tasks: BackgroundTasks):
+    """설정된 영역마다 '새로오픈' 필터로 타일 목록을 수집하고, 마스터에 없는 매장만 전체 파이프라인으로 처리합니다. (관리자용)"""
+    areas = (config.get('new_openings') or {}).get('areas') or []
+    if not areas:
+        raise HTTPException(status_code=400, detail="config.yaml의 new_openings.areas에 탐색할 영역이 없습니다.")
+
+    # 이전 탐색 작업이 끝나지 않았으면 같은 영역을 중복으로 수집하지 않음
+    if any(task.get("status") in ("pending", "processing") and (task.get("request_details") or {}).get("new_only")
+           for task in tasks_db.values()):
+        raise HTTPException(status_code=409, detail="신규 오픈 탐색 작업이 이미 실행 중입니다. 잠시 후 다시 시도해주세요.")
+
+    requests = {}
+    for i, area in enumerate(areas):
+        if not (area.get('bbox') or area.get('polygon_wkt')):
+            raise HTTPException(status_code=400, detail=f"new_openings.areas[{i}]에 bbox 또는 polygon_wkt가 없습니다.")
+        requests[area.get('name') or f"{area['query']}#{i + 1}"] = PipelineRequest(
+            storage_mode=STORAGE_MODE,
+            query=area['query'],
+            bbox=area.get('bbox'),
+            polygon_wkt=area.get('polygon_wkt'),
+            crawl_profile=area.get('crawl_profile', 'full'),
+            new_only=True,
+        )
+
+    existing_ids = load_ids_from_master_data(STORAGE_MODE, config)
+    task_ids: Dict[str, str] = {}
+    for name, request in requests.items():
+        task_id = str(uuid.uuid4())
+        tasks_db[task_id] = {"status": "pending", "request_details": request.model_dump()}
+        task_ids[name] = task_id
+        background_tasks.add_task(execute_pipeline_task, task_id, request, existing_ids)
+
+    print(f"관리자 요청으로 신규 오픈 탐색 작업 {len(task_ids)}개를 접수했습니다.")
+    return {"task_ids": task_ids, "message": "신규 오픈 탐색 작업이 접수되었습니다. '/pipeline/status/{task_id}'로 상태를 확인하세요."}
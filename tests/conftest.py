@@ -0,0 +1,7 @@
+# 테스트에서 저장소 루트의 패키지(Crawling, QC_score 등)를 import할 수 있도록 경로를 추가합니다.
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
@@ -0,0 +1,170 @@
+# NaverHttpCrawler를 네트워크 없이 확인하는 테스트입니다.
+# tests/fixtures/naver에 저장해 둔 네이버 플레이스 홈/리뷰 페이지를 로컬 http.server로 제공하고,
+# 크롤러의 base_url을 이 서버로 바꿔 실제 요청 → Apollo 상태 파싱 → 브라우저 재수집 대상 분리까지 확인합니다.
+#  - 1001: 필수 필드(이름/카테고리/주소)와 리뷰 페이지가 모두 있는 매장
+#  - 1002: 이름만 있고 카테고리/주소가 없는 매장 (브라우저 재수집 대상)
+#  - 그 밖의 ID: 저장된 페이지가 없어 404를 반환
+
+import functools
+import os
+import queue
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from Crawling.naver_http_crawler import NaverHttpCrawler, extract_apollo_state_from_html
+from Crawling.utils.apollo_state import parse_apollo_reviews
+from Crawling.utils.crawl_profiles import SECTION_OK, SECTION_SKIPPED
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "naver")
+PAGE_PATTERN = re.compile(r"^/restaurant/(\d+)/(home|review/visitor)$")
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """/restaurant/{id}/home → {id}_home.html, /restaurant/{id}/review/visitor → {id}_review.html"""
+
+    def do_GET(self):
+        match = PAGE_PATTERN.match(self.path.split("?")[0])
+        page = {"home": "home", "review/visitor": "review"}.get(match.group(2)) if match else None
+        file_path = os.path.join(FIXTURE_DIR, f"{match.group(1)}_{page}.html") if page else None
+        if not file_path or not os.path.exists(file_path):
+            self.send_error(404)
+            return
+        with open(file_path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def fixture_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def http_crawler(fixture_server):
+    crawler = NaverHttpCrawler(base_url=fixture_server, max_concurrency=2, timeout=5)
+    yield crawler
+    crawler.close()
+
+
+def test_extract_apollo_state_from_html():
+    state = extract_apollo_state_from_html(read_fixture("1001_home.html"))
+    assert state["PlaceDetailBase:1001"]["name"] == "성수 파스타집"
+    # 상태 뒤에 이어지는 다른 스크립트는 포함하지 않음
+    assert "__PLACE_STATE__" not in state
+
+    assert extract_apollo_state_from_html("<html><body>상태 없음</body></html>") is None
+    assert extract_apollo_state_from_html("<script>window.__APOLLO_STATE__ = {broken</script>") is None
+    assert extract_apollo_state_from_html("") is None
+
+
+def test_parse_apollo_reviews():
+    fields = parse_apollo_reviews(extract_apollo_state_from_html(read_fixture("1001_review.html")))
+    assert fields["review_category"] == {"음식이 맛있어요": 321, "분위기가 좋아요": 120}
+    # 방문일이 없는 리뷰는 제외하고 최근 방문 순으로 정렬
+    assert fields["review_info"] == [
+        {"date": "2025-01-05", "comment": "재방문 의사 있어요"},
+        {"date": "2024-12-22", "comment": "면이 쫄깃하고 소스가 진해요"},
+    ]
+    assert fields["running_well"] in (0, 1, 2, 3)
+
+    assert parse_apollo_reviews(None) == {}
+
+
+def test_fetch_place_parses_full_page(http_crawler, fixture_server):
+    store = http_crawler.fetch_place(1001, search_word="성수 파스타")
+
+    assert store["naver_id"] == 1001
+    assert store["search_word"] == "성수 파스타"
+    assert store["name"] == "성수 파스타집"
+    assert store["category"] == "이탈리아음식"
+    assert store["address"] == "서울 성동구 연무장길 12"
+    assert store["phone"] == "02-123-4567"
+    assert store["new_store"] is True
+    assert store["visitor_review_count"] == 1234
+    assert store["blog_review_count"] == 87
+    assert (store["gps_latitude"], store["gps_longitude"]) == (37.5443, 127.0561)
+    assert store["instagram_link"] == "https://instagram.com/seongsu_pasta"
+    assert store["distance_from_subway"] == 230
+    assert store["distance_from_subway_origin"] == "성수역 4번 출구에서 230m"
+    assert [m["name"] for m in store["menu_list"]] == ["트러플 크림 파스타", "봉골레"]
+    assert store["menu_list"][0]["price"] == "18,000원"
+    assert store["menu_list"][0]["is_representative"] is True
+    assert store["naver_url"] == f"{fixture_server}/restaurant/1001/home"
+
+    # 리뷰 페이지도 요청해 리뷰 섹션을 채움
+    assert store["review_category"]["음식이 맛있어요"] == 321
+    assert len(store["review_info"]) == 2
+    assert store["section_status"] == {"datalab": SECTION_SKIPPED, "menu": SECTION_OK, "reviews": SECTION_OK}
+
+
+def test_fetch_place_missing_required_fields(http_crawler):
+    # 카테고리/주소가 없는 페이지와 저장된 페이지가 없는 ID(404)는 모두 브라우저 재수집 대상
+    assert http_crawler.fetch_place(1002) is None
+    assert http_crawler.fetch_place(9999) is None
+
+
+def test_crawl_place_ids_splits_failed_ids(http_crawler):
+    records, failed_ids = http_crawler.crawl_place_ids([1001, 1002, 9999], search_word="성수 파스타")
+
+    assert [r["naver_id"] for r in records] == [1001]
+    assert failed_ids == [1002, 9999]
+
+
+def test_failed_ids_fall_back_to_store_crawler(monkeypatch, fixture_server):
+    # naver_crawler는 브라우저 크롤러(selenium)를 함께 import하므로, selenium이 없는 환경에서는 건너뜀
+    naver_crawler = pytest.importorskip("Crawling.naver_crawler")
+    monkeypatch.setattr(naver_crawler, "NaverHttpCrawler", functools.partial(NaverHttpCrawler, base_url=fixture_server))
+
+    browser_ids = []
+
+    class FakeStoreCrawler:
+        """StoreCrawler 대신 큐에서 꺼낸 ID만 기록합니다."""
+
+        def __init__(self, **kwargs):
+            self.driver = object()
+
+        def run_detail_worker(self, id_queue, search_query=""):
+            rows = []
+            while True:
+                try:
+                    place_id = id_queue.get_nowait()
+                except queue.Empty:
+                    break
+                browser_ids.append(place_id)
+                rows.append({"naver_id": int(place_id), "name": f"browser-{place_id}", "search_word": search_query})
+            return pd.DataFrame(rows)
+
+    monkeypatch.setattr(naver_crawler, "StoreCrawler", FakeStoreCrawler)
+
+    df = naver_crawler.crawl_naver_place_ids(
+        [1001, 1002, 9999], "성수 파스타", headless_mode=True, output_dir="results",
+        existing_naver_ids=set(), num_workers=1, detail_backend="http", http_concurrency=2,
+    )
+
+    # HTTP로 파싱한 1001은 브라우저로 다시 수집하지 않고, 실패한 ID만 브라우저 워커로 넘어감
+    assert sorted(browser_ids) == [1002, 9999]
+    assert sorted(df["naver_id"].tolist()) == [1001, 1002, 9999]
+    assert df.set_index("naver_id").loc[1001, "name"] == "성수 파스타집"